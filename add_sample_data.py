@@ -8,10 +8,6 @@ from config.database import db_manager
 def add_sample_data():
     """Add sample Q&A data to the database"""
     
-    # Ensure connection
-    if not db_manager.connection or not db_manager.connection.is_connected():
-        db_manager.connect()
-    
     print("Adding sample users...")
     
     # Add sample users
@@ -22,9 +18,7 @@ def add_sample_data():
         ('expert_user', 19)
     ]
     
-    for username, age in users_data:
-        query = "INSERT IGNORE INTO users (username, age) VALUES (%s, %s)"
-        db_manager.execute_query(query, (username, age))
+    db_manager.bulk_insert('users', ('username', 'age'), users_data, ignore=True)
     
     print("Adding sample questions...")
     
@@ -40,19 +34,13 @@ def add_sample_data():
         ('testuser2', 'What are the risks of teenage pregnancy? I want to understand all the health implications.', 'health', True),
     ]
     
-    question_ids = []
-    for username, question_text, category, is_answered in questions_data:
-        # Insert question and get the actual ID
-        query = "INSERT INTO anonymous_questions (username, question_text, category, is_answered) VALUES (%s, %s, %s, %s)"
-        result = db_manager.execute_query(query, (username, question_text, category, is_answered))
-        
-        # Get the ID of the just-inserted question
-        get_id_query = "SELECT LAST_INSERT_ID() as id"
-        id_result = db_manager.execute_query(get_id_query)
-        if id_result:
-            question_id = id_result[0]['id']
-            question_ids.append(question_id)
-            print(f"Added question {question_id}: {question_text[:50]}...")
+    # One bulk insert; the loader reports the actual IDs the questions received
+    result = db_manager.bulk_insert(
+        'anonymous_questions', ('username', 'question_text', 'category', 'is_answered'), questions_data
+    )
+    question_ids = result.ids if not result.failed else []
+    for question_id, (_, question_text, _, _) in zip(question_ids, questions_data):
+        print(f"Added question {question_id}: {question_text[:50]}...")
     
     print("Adding expert answers...")
     
@@ -88,9 +76,12 @@ def add_sample_data():
             (question_ids[7], 'My sister had her baby at 17. With good medical care and family support, both she and the baby are healthy. The key is getting prenatal care early and having a support system. There are programs to help young mothers continue their education too.', False, 7),
         ]
     
-    for question_id, answer_text, is_verified, helpful_votes in answers_data:
-        query = "INSERT INTO anonymous_answers (question_id, answer_text, is_verified, helpful_votes) VALUES (%s, %s, %s, %s)"
-        db_manager.execute_query(query, (question_id, answer_text, is_verified, helpful_votes))
+    else:
+        answers_data = []
+    
+    db_manager.bulk_insert(
+        'anonymous_answers', ('question_id', 'answer_text', 'is_verified', 'helpful_votes'), answers_data
+    )
     
     # Update system stats
     print("Updating system statistics...")
@@ -0,0 +1,94 @@
+# Bulk loading benchmark: row-by-row INSERTs vs chunked multi-row INSERTs
+#
+# Usage (from the project root):
+#     python benchmarks/bulk_load.py [questions] [chunk_size]
+#
+# Loads a synthetic Q&A dataset (users, questions, answers) into a throwaway
+# in-memory SQLite database unless DB_BACKEND is set. With MySQL and
+# DB_BULK_LOCAL_INFILE=on the LOAD DATA LOCAL INFILE path is measured too.
+
+import os
+import sys
+import time
+
+sys.path.append('.')
+os.environ.setdefault('DB_BACKEND', 'sqlite')
+os.environ.setdefault('DB_SQLITE_PATH', ':memory:')
+os.environ.setdefault('DB_QUERY_STATS', 'off')
+
+from config.bulk_loader import print_progress
+from config.database import db_manager
+
+CATEGORIES = ('general', 'health', 'emotional_support', 'resources', 'other')
+ROW_BY_ROW_SAMPLE = 2000
+
+
+def users(count, prefix):
+    for i in range(count):
+        yield (f"{prefix}{i}", 13 + i % 7)
+
+
+def questions(count, user_count, prefix):
+    for i in range(count):
+        yield (f"{prefix}{i % user_count}",
+               f"Synthetic question number {i} about reproductive health and support services?",
+               CATEGORIES[i % len(CATEGORIES)], i % 3 != 0)
+
+
+def report(label, rows, seconds):
+    rate = rows / seconds if seconds else 0
+    print(f"{label:<38} {rows:>9} rows {seconds:>8.2f} s {rate:>12,.0f} rows/s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    user_count = max(1, count // 100)
+
+    if not db_manager.connect():
+        return
+
+    print(f"\nLoading {count} questions on {db_manager.backend.label}\n")
+
+    # Baseline: one autocommitted INSERT per row, on a small sample
+    db_manager.bulk_insert('users', ('username', 'age'), users(1, 'rb'))
+    started = time.perf_counter()
+    for row in questions(ROW_BY_ROW_SAMPLE, 1, 'rb'):
+        db_manager.execute_query(
+            "INSERT INTO anonymous_questions (username, question_text, category, is_answered) "
+            "VALUES (%s, %s, %s, %s)", row
+        )
+    baseline = time.perf_counter() - started
+    report("row by row (sample)", ROW_BY_ROW_SAMPLE, baseline)
+    print(f"{'':<38} extrapolated to {count} rows: {baseline / ROW_BY_ROW_SAMPLE * count:,.0f} s")
+
+    result = db_manager.bulk_insert('users', ('username', 'age'), users(user_count, 'u'), chunk_size)
+    report("bulk insert: users", result.rows, result.seconds)
+
+    result = db_manager.bulk_insert(
+        'anonymous_questions', ('username', 'question_text', 'category', 'is_answered'),
+        questions(count, user_count, 'u'), chunk_size, progress=print_progress('anonymous_questions')
+    )
+    report(f"bulk insert: questions (chunk {chunk_size})", result.rows, result.seconds)
+
+    # Parent/child load: answers reference the question IDs returned above
+    question_ids = result.ids
+    answers = ((question_id, "Synthetic expert answer.", True, 0) for question_id in question_ids)
+    result = db_manager.bulk_insert(
+        'anonymous_answers', ('question_id', 'answer_text', 'is_verified', 'helpful_votes'),
+        answers, chunk_size
+    )
+    report("bulk insert: answers (child rows)", result.rows, result.seconds)
+
+    if db_manager.backend.supports_load_infile and db_manager.allow_local_infile:
+        result = db_manager.bulk_load_file(
+            'anonymous_questions', ('username', 'question_text', 'category', 'is_answered'),
+            questions(count, user_count, 'u'), progress=print_progress('anonymous_questions')
+        )
+        report("LOAD DATA LOCAL INFILE: questions", result.rows, result.seconds)
+
+    db_manager.disconnect()
+
+
+if __name__ == '__main__':
+    main()
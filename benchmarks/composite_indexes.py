@@ -0,0 +1,209 @@
+# Composite index benchmark: what each index of migration 003 saves and costs
+#
+# Usage (from the project root):
+#     python benchmarks/composite_indexes.py [questions] [repeats]
+#
+# Loads a synthetic dataset (1M questions by default, about 670k answers and
+# 100k users with counseling sessions) with the indexes of
+# database/migrations/003_composite_indexes.sql dropped. Then, one index at a
+# time, it times the queries the index was designed for and a chunked insert
+# into its table, builds the index, and repeats both measurements.
+#
+# Runs against a throwaway in-memory SQLite database unless DB_BACKEND is set,
+# in which case it uses (and fills) the configured database: use a scratch one.
+
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.append('.')
+os.environ.setdefault('DB_BACKEND', 'sqlite')
+os.environ.setdefault('DB_SQLITE_PATH', ':memory:')
+os.environ.setdefault('DB_QUERY_STATS', 'off')
+os.environ.setdefault('DB_RESULT_CACHE_SIZE', '0')
+
+from config.bulk_loader import print_progress
+from config.database import db_manager
+from config.migrations import index_statement, load_migrations
+
+INDEX_MIGRATION = 3
+INSERT_SAMPLE = 20000
+
+CATEGORIES = ('general', 'health', 'emotional_support', 'resources', 'other')
+
+ANSWERS_QUERY = """
+    SELECT answer_id, answer_text, is_verified, helpful_votes, created_at
+    FROM anonymous_answers
+    WHERE question_id = %s
+    ORDER BY is_verified DESC, helpful_votes DESC, created_at ASC
+"""
+BROWSE_QUERY = """
+    SELECT q.question_id, q.question_text, q.category, q.created_at,
+           COUNT(a.answer_id) as answer_count,
+           MAX(a.created_at) as last_answered
+    FROM anonymous_questions q
+    LEFT JOIN anonymous_answers a ON q.question_id = a.question_id
+    WHERE q.is_answered = TRUE AND q.category = %s
+    GROUP BY q.question_id, q.question_text, q.category, q.created_at
+    ORDER BY answer_count DESC, q.created_at DESC
+    LIMIT %s
+"""
+CATEGORY_COUNTS_QUERY = """
+    SELECT category, COUNT(*) as count
+    FROM anonymous_questions
+    WHERE is_answered = TRUE
+    GROUP BY category
+"""
+USER_QUESTIONS_QUERY = """
+    SELECT question_id, question_text, category, is_answered, created_at
+    FROM anonymous_questions
+    WHERE username = %s
+    ORDER BY created_at DESC
+"""
+USER_SESSIONS_QUERY = """
+    SELECT session_id, username, client_name, topic, preferred_date, status, notes, created_at, updated_at
+    FROM counseling_sessions
+    WHERE username = %s
+    ORDER BY preferred_date DESC, created_at DESC
+"""
+
+
+def workloads(user_count, question_count):
+    """Queries each index is meant to serve, as ``{index: [(label, query, params_for(i))]}``."""
+    def user(i):
+        return f"u{i * 7919 % user_count}"
+
+    return {
+        'idx_questions_answered_category_created': [
+            ("browse by category", BROWSE_QUERY, lambda i: (CATEGORIES[i % len(CATEGORIES)], 20)),
+            ("answered per category", CATEGORY_COUNTS_QUERY, lambda i: ()),
+        ],
+        'idx_questions_user_created': [
+            ("my questions", USER_QUESTIONS_QUERY, lambda i: (user(i),)),
+        ],
+        'idx_answers_question_ranking': [
+            ("answers of a question", ANSWERS_QUERY, lambda i: (1 + i * 7919 % question_count,)),
+        ],
+        'idx_sessions_user_date': [
+            ("my sessions", USER_SESSIONS_QUERY, lambda i: (user(i),)),
+        ],
+    }
+
+
+def insert_sample(table, user_count, offset):
+    """Generate ``INSERT_SAMPLE`` rows for ``table``, as ``(columns, rows)``."""
+    today = date.today()
+    if table == 'anonymous_questions':
+        return (('username', 'question_text', 'category', 'is_answered'),
+                ((f"u{i % user_count}", f"Extra question {i}?", CATEGORIES[i % 5], i % 3 != 0)
+                 for i in range(offset, offset + INSERT_SAMPLE)))
+    if table == 'anonymous_answers':
+        return (('question_id', 'answer_text', 'is_verified', 'helpful_votes'),
+                ((1 + i % 1000, "Extra answer.", i % 2 == 0, i % 9) for i in range(INSERT_SAMPLE)))
+    return (('username', 'client_name', 'topic', 'preferred_date'),
+            ((f"u{i % user_count}", "Client", "Topic", today + timedelta(days=i % 60))
+             for i in range(INSERT_SAMPLE)))
+
+
+def load(count, user_count):
+    """Load the synthetic dataset (skipped when it is already there)."""
+    existing = db_manager.execute_query("SELECT COUNT(*) AS n FROM anonymous_questions")[0]['n']
+    if existing >= count:
+        return
+
+    today = date.today()
+    db_manager.bulk_insert('users', ('username', 'age'), ((f"u{i}", 13 + i % 7) for i in range(user_count)),
+                           ignore=True)
+
+    questions = db_manager.bulk_insert(
+        'anonymous_questions', ('username', 'question_text', 'category', 'is_answered'),
+        ((f"u{i % user_count}", f"Synthetic question {i} about health and support?", CATEGORIES[i % 5],
+          i % 3 != 0) for i in range(count)),
+        progress=print_progress('anonymous_questions')
+    )
+    db_manager.bulk_insert(
+        'anonymous_answers', ('question_id', 'answer_text', 'is_verified', 'helpful_votes'),
+        ((question_id, "Synthetic expert answer.", i % 4 != 0, i % 17)
+         for i, question_id in enumerate(questions.ids) if i % 3 != 0),
+        progress=print_progress('anonymous_answers')
+    )
+    db_manager.bulk_insert(
+        'counseling_sessions', ('username', 'client_name', 'topic', 'preferred_date', 'status'),
+        ((f"u{i % user_count}", f"Client {i}", "Synthetic topic", today + timedelta(days=i % 365), 'scheduled')
+         for i in range(user_count * 2)),
+        progress=print_progress('counseling_sessions')
+    )
+
+
+def time_query(query, params_for, repeats):
+    """Average milliseconds per execution over ``repeats`` parameter sets."""
+    started = time.perf_counter()
+    for i in range(repeats):
+        db_manager.execute_query(query, params_for(i))
+    return (time.perf_counter() - started) * 1000 / repeats
+
+
+def time_insert(table, user_count, offset):
+    columns, rows = insert_sample(table, user_count, offset)
+    result = db_manager.bulk_insert(table, columns, rows)
+    return result.rows_per_second
+
+
+def drop_index(table, index):
+    if db_manager.backend.name == 'mysql':
+        db_manager.execute_query(f"DROP INDEX {index} ON {table}")
+    else:
+        db_manager.execute_query(f"DROP INDEX IF EXISTS {index}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    user_count = max(10, count // 10)
+
+    if not db_manager.connect():
+        return
+
+    backend = db_manager.backend
+    migration = next(m for m in load_migrations(backend.name) if m.version == INDEX_MIGRATION)
+    indexes = []
+    for statement in backend.migration_statements(migration.script):
+        table, index = index_statement(statement)
+        indexes.append((table, index, statement))
+
+    for table, index, _ in indexes:
+        drop_index(table, index)
+
+    print(f"\nLoading {count} questions on {backend.label}\n")
+    load(count, user_count)
+    tables = sorted({table for table, _, _ in indexes})
+    db_manager.analyze(tables)
+
+    plan = workloads(user_count, count)
+    print(f"\n{'Index / query':<44} {'Before':>11} {'After':>11} {'Speedup':>9}")
+    print("-" * 78)
+
+    for offset, (table, index, statement) in enumerate(indexes):
+        queries = [(label, time_query(query, params_for, repeats)) for label, query, params_for in plan[index]]
+        insert_before = time_insert(table, user_count, offset * INSERT_SAMPLE + count)
+
+        started = time.perf_counter()
+        db_manager.execute_query(backend.online_index_ddl(statement))
+        build_seconds = time.perf_counter() - started
+        db_manager.analyze([table])
+
+        insert_after = time_insert(table, user_count, (offset + len(indexes)) * INSERT_SAMPLE + count)
+
+        print(f"{index} (built in {build_seconds:.1f} s)")
+        for (label, before), (_, query, params_for) in zip(queries, plan[index]):
+            after = time_query(query, params_for, repeats)
+            print(f"  {label:<42} {before:>8.2f} ms {after:>8.2f} ms {before / after if after else 0:>8.1f}x")
+        print(f"  {'insert into ' + table:<42} {insert_before:>7,.0f}/s {insert_after:>7,.0f}/s "
+              f"{insert_after / insert_before if insert_before else 0:>8.2f}x")
+
+    db_manager.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+# Typo-tolerant name search benchmark: trigram index vs scanning every name
+#
+# Usage (from the project root):
+#     python benchmarks/fuzzy_search.py [resources] [lookups]
+#
+# Loads synthetic support resources with made-up Kinyarwanda-like names in the
+# gazetteer towns (50k by default), then looks up misspelled names (one letter
+# dropped, doubled or swapped) through ResourceDirectory.match_names and with
+# difflib.get_close_matches over every name, reporting the time per lookup and
+# how often the intended resource came first.
+#
+# Runs against a throwaway in-memory SQLite database unless DB_BACKEND is set,
+# in which case it uses (and fills) the configured database.
+
+import difflib
+import os
+import random
+import sys
+import time
+
+sys.path.append('.')
+os.environ.setdefault('DB_BACKEND', 'sqlite')
+os.environ.setdefault('DB_SQLITE_PATH', ':memory:')
+os.environ.setdefault('DB_QUERY_STATS', 'off')
+
+from config.database import db_manager
+from src.models.resource_directory import resource_directory
+from src.utils.geo import load_gazetteer
+
+TYPES = ('clinic', 'ngo', 'hotline', 'counseling_center')
+KINDS = ('Hospital', 'Health Centre', 'Clinic', 'Youth Centre', 'Counseling Services', 'Foundation')
+SYLLABLES = tuple(consonant + vowel for consonant in ('b', 'g', 'k', 'm', 'n', 'ny', 'r', 'sh', 't', 'z')
+                  for vowel in 'aeiou')
+
+
+def seed(count):
+    """Make sure there are at least ``count`` resources."""
+    existing = db_manager.execute_query("SELECT COUNT(*) AS n FROM support_resources")[0]['n']
+    rng = random.Random(existing)
+    towns = [town.name for town in load_gazetteer()]
+    db_manager.bulk_insert(
+        'support_resources', ('name', 'type', 'city', 'is_available_24_7'),
+        ((f"{''.join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).title()} {rng.choice(KINDS)}",
+          TYPES[i % len(TYPES)], rng.choice(towns), i % 7 == 0)
+         for i in range(existing, count))
+    )
+
+
+def misspell(name, rng):
+    """``name`` with one letter dropped, doubled or swapped with the next."""
+    position = rng.randrange(1, len(name) - 1)
+    edit = rng.randrange(3)
+    if edit == 0:
+        return name[:position] + name[position + 1:]
+    if edit == 1:
+        return name[:position] + name[position] + name[position:]
+    return name[:position] + name[position + 1] + name[position] + name[position + 2:]
+
+
+def measure(label, search, queries):
+    found = 0
+    started = time.perf_counter()
+    for query, name in queries:
+        found += search(query) == name
+    elapsed = (time.perf_counter() - started) / len(queries)
+    print(f"{label:<28} {elapsed * 1000:>10.2f} ms {found / len(queries):>9.0%}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    if not db_manager.connect():
+        return
+    seed(count)
+
+    resources = resource_directory.find()
+    started = time.perf_counter()
+    resource_directory.match_names("warm-up", limit=1)
+    print(f"\n{len(resources)} resources on {db_manager.backend.label}; "
+          f"name index built in {(time.perf_counter() - started) * 1000:.0f} ms\n")
+
+    rng = random.Random(0)
+    names = [resource.name for resource in resources]
+    queries = [(misspell(name, rng), name) for name in rng.sample(names, min(lookups, len(names)))]
+
+    def trigram_search(query):
+        matches = resource_directory.match_names(query, limit=1)
+        return matches[0][0].name if matches else None
+
+    def difflib_search(query):
+        matches = difflib.get_close_matches(query, names, n=1, cutoff=0.6)
+        return matches[0] if matches else None
+
+    print(f"{'Misspelled facility name':<28} {'Per lookup':>13} {'Top match':>10}")
+    print("-" * 53)
+    measure("trigram index", trigram_search, queries)
+    measure("difflib scan", difflib_search, queries[:max(1, len(queries) // 20)])
+
+    db_manager.disconnect()
+
+
+if __name__ == '__main__':
+    main()
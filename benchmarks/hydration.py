@@ -0,0 +1,168 @@
+# Model hydration benchmark: per-field construction vs __slots__ + RowMapper
+#
+# Usage (from the project root):
+#     python benchmarks/hydration.py [rows] [repeats]
+#
+# Fetches ``rows`` support resources and counseling sessions (100k by default)
+# once, then builds model objects from them two ways:
+#   - legacy: a dict-backed class built field by field through __init__, as the
+#     models did before they declared __slots__ and a RowMapper
+#   - mapper: the current models, hydrated by their generated RowMapper
+# and reports the best time, the peak allocation while hydrating and the memory
+# the objects keep alive afterwards.
+#
+# Runs against a throwaway in-memory SQLite database unless DB_BACKEND is set,
+# in which case it uses (and fills) the configured database.
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.append('.')
+os.environ.setdefault('DB_BACKEND', 'sqlite')
+os.environ.setdefault('DB_SQLITE_PATH', ':memory:')
+os.environ.setdefault('DB_QUERY_STATS', 'off')
+os.environ.setdefault('DB_RESULT_CACHE_SIZE', '0')
+
+from config.database import db_manager
+from src.models.counseling_session import CounselingSession
+from src.models.local_services import SupportResource
+
+TYPES = ('clinic', 'ngo', 'hotline', 'counseling_center')
+CITIES = ('Kigali', 'Huye', 'Musanze', 'Rubavu', 'Rwamagana', 'Muhanga')
+
+
+class LegacyResource:
+    """SupportResource as it was hydrated before: __dict__ per object, fields via __init__."""
+
+    def __init__(self, resource_id=None, name=None, resource_type=None, description=None,
+                 phone=None, email=None, address=None, city=None, country='Rwanda',
+                 website=None, is_available_24_7=False):
+        self.resource_id = resource_id
+        self.name = name
+        self.resource_type = resource_type
+        self.description = description
+        self.phone = phone
+        self.email = email
+        self.address = address
+        self.city = city
+        self.country = country
+        self.website = website
+        self.is_available_24_7 = is_available_24_7
+        self.created_at = None
+
+    @classmethod
+    def hydrate(cls, rows):
+        fields = rows.getter('resource_id', 'name', 'type', 'description', 'phone', 'email',
+                             'address', 'city', 'country', 'website', 'is_available_24_7')
+        created_at = rows.getter('created_at')
+        resources = []
+        for row in rows:
+            resource = cls(*fields(row))
+            resource.created_at = created_at(row)
+            resources.append(resource)
+        return resources
+
+
+class LegacySession:
+    """CounselingSession as it was hydrated before."""
+
+    def __init__(self, session_id=None, username=None, name=None, topic=None,
+                 preferred_date=None, status='scheduled', notes=None):
+        self.session_id = session_id
+        self.username = username
+        self.name = name
+        self.topic = topic
+        self.preferred_date = preferred_date
+        self.status = status
+        self.notes = notes
+        self.created_at = None
+        self.updated_at = None
+
+    @classmethod
+    def hydrate(cls, rows):
+        fields = rows.getter('session_id', 'username', 'client_name', 'topic',
+                             'preferred_date', 'status', 'notes')
+        timestamps = rows.getter('created_at', 'updated_at')
+        sessions = []
+        for row in rows:
+            session = cls(*fields(row))
+            session.created_at, session.updated_at = timestamps(row)
+            sessions.append(session)
+        return sessions
+
+
+def seed(count):
+    """Make sure there are at least ``count`` resources and sessions."""
+    existing = db_manager.execute_query("SELECT COUNT(*) AS n FROM support_resources")[0]['n']
+    db_manager.bulk_insert(
+        'support_resources', ('name', 'type', 'description', 'phone', 'email', 'address', 'city',
+                              'country', 'is_available_24_7'),
+        ((f"Benchmark Resource {i}", TYPES[i % len(TYPES)], "Synthetic resource.", f"+250 788 {i:06d}",
+          f"resource{i}@example.rw", f"KN {i % 500} St", CITIES[i % len(CITIES)], "Rwanda", i % 7 == 0)
+         for i in range(existing, count))
+    )
+
+    existing = db_manager.execute_query("SELECT COUNT(*) AS n FROM counseling_sessions")[0]['n']
+    if existing < count:
+        db_manager.bulk_insert('users', ('username', 'age'), [('benchuser', 16)], ignore=True)
+    today = date.today()
+    db_manager.bulk_insert(
+        'counseling_sessions', ('username', 'client_name', 'topic', 'preferred_date', 'status'),
+        (('benchuser', f"Client {i}", "Synthetic topic", today + timedelta(days=i % 365), 'scheduled')
+         for i in range(existing, count))
+    )
+
+
+def measure(label, hydrate, rows, repeats):
+    """Best time of ``hydrate(rows)``, its peak allocation and the memory its result retains."""
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        hydrate(rows)
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    objects = hydrate(rows)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<28} {best * 1000:>9.1f} ms {peak / 1024 / 1024:>9.1f} MiB "
+          f"{retained / 1024 / 1024:>9.1f} MiB {retained / len(objects):>8.0f} B")
+    return best, retained
+
+
+def compare(name, legacy, mapper, rows, repeats):
+    old_time, old_memory = measure(f"{name}: legacy", legacy, rows, repeats)
+    new_time, new_memory = measure(f"{name}: slots + mapper", mapper, rows, repeats)
+    print(f"{'':<28} {old_time / new_time:>8.2f}x {'':>13} {old_memory / new_memory:>8.2f}x\n")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    if not db_manager.connect():
+        return
+    seed(count)
+
+    resources = db_manager.execute_rows(SupportResource.ALL_RESOURCES_QUERY + " LIMIT %s", (count,))
+    sessions = db_manager.execute_rows(CounselingSession.ALL_SESSIONS_QUERY + " LIMIT %s", (count,))
+
+    print(f"\nHydrating {len(resources)} resources and {len(sessions)} sessions on "
+          f"{db_manager.backend.label}, best of {repeats}\n")
+    print(f"{'Model':<28} {'Time':>12} {'Peak':>13} {'Retained':>13} {'Per obj':>10}")
+    print("-" * 80)
+
+    compare("resources", LegacyResource.hydrate, SupportResource.mapper.hydrate, resources, repeats)
+    compare("sessions", LegacySession.hydrate, CounselingSession.mapper.hydrate, sessions, repeats)
+
+    db_manager.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# Nearest-service lookup benchmark: k-d tree vs scanning every resource
+#
+# Usage (from the project root):
+#     python benchmarks/nearest_services.py [resources] [lookups]
+#
+# Loads synthetic support resources spread over Rwanda (50k by default), then
+# times the nearest-5 lookup of ResourceDirectory from every gazetteer town,
+# unfiltered and filtered to 24/7 clinics, against a full haversine scan.
+#
+# Runs against a throwaway in-memory SQLite database unless DB_BACKEND is set,
+# in which case it uses (and fills) the configured database.
+
+import os
+import random
+import sys
+import time
+
+sys.path.append('.')
+os.environ.setdefault('DB_BACKEND', 'sqlite')
+os.environ.setdefault('DB_SQLITE_PATH', ':memory:')
+os.environ.setdefault('DB_QUERY_STATS', 'off')
+
+from config.database import db_manager
+from src.models.resource_directory import resource_directory
+from src.utils.geo import haversine_km, load_gazetteer
+
+TYPES = ('clinic', 'ngo', 'hotline', 'counseling_center')
+
+# Bounding box of Rwanda
+LATITUDES = (-2.84, -1.05)
+LONGITUDES = (28.86, 30.90)
+
+
+def seed(count):
+    """Make sure there are at least ``count`` resources with coordinates."""
+    existing = db_manager.execute_query("SELECT COUNT(*) AS n FROM support_resources")[0]['n']
+    rng = random.Random(existing)
+    db_manager.bulk_insert(
+        'support_resources', ('name', 'type', 'city', 'is_available_24_7', 'latitude', 'longitude'),
+        ((f"Facility {i}", TYPES[i % len(TYPES)], "Synthetic", i % 7 == 0,
+          round(rng.uniform(*LATITUDES), 6), round(rng.uniform(*LONGITUDES), 6))
+         for i in range(existing, count))
+    )
+
+
+def scan(resources, latitude, longitude, count, accept):
+    """Reference: distance to every resource, then the ``count`` closest."""
+    distances = sorted(
+        (haversine_km(latitude, longitude, float(r.latitude), float(r.longitude)), r.resource_id)
+        for r in resources if r.latitude is not None and accept(r)
+    )
+    return distances[:count]
+
+
+def measure(label, lookup, towns, lookups):
+    started = time.perf_counter()
+    for i in range(lookups):
+        town = towns[i % len(towns)]
+        lookup(town.latitude, town.longitude)
+    elapsed = (time.perf_counter() - started) / lookups
+    print(f"{label:<40} {elapsed * 1e6:>10.0f} us")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    if not db_manager.connect():
+        return
+    seed(count)
+
+    resources = resource_directory.find()
+    started = time.perf_counter()
+    resource_directory.nearest(-1.9441, 30.0619, 1)
+    print(f"\n{len(resources)} resources on {db_manager.backend.label}; "
+          f"k-d tree built in {(time.perf_counter() - started) * 1000:.0f} ms\n")
+
+    towns = load_gazetteer()
+    print(f"{'Nearest 5, from every gazetteer town':<40} {'Per lookup':>13}")
+    print("-" * 54)
+    measure("k-d tree", lambda lat, lon: resource_directory.nearest(lat, lon, 5), towns, lookups)
+    measure("k-d tree, 24/7 clinics", lambda lat, lon: resource_directory.nearest(
+        lat, lon, 5, resource_type='clinic', open_24_7=True), towns, lookups)
+    measure("full scan", lambda lat, lon: scan(resources, lat, lon, 5, lambda r: True),
+            towns, max(1, lookups // 50))
+    measure("full scan, 24/7 clinics", lambda lat, lon: scan(
+        resources, lat, lon, 5, lambda r: r.resource_type == 'clinic' and r.is_available_24_7),
+        towns, max(1, lookups // 50))
+
+    db_manager.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+# Microbenchmark: dict rows vs tuple rows, and model hydration cost
+#
+# Usage (from the project root):
+#     python benchmarks/row_modes.py [rows] [repeats]
+#
+# Runs against a throwaway in-memory SQLite database unless DB_BACKEND is set,
+# in which case it uses (and fills) the configured database.
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append('.')
+os.environ.setdefault('DB_BACKEND', 'sqlite')
+os.environ.setdefault('DB_SQLITE_PATH', ':memory:')
+os.environ.setdefault('DB_QUERY_STATS', 'off')
+# Time database fetches, not copies out of the result cache
+os.environ.setdefault('DB_RESULT_CACHE_SIZE', '0')
+
+from config.database import db_manager
+from src.models.local_services import SupportResource
+
+INSERT_QUERY = """
+INSERT INTO support_resources (name, type, description, phone, email, address,
+                               city, country, website, is_available_24_7)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+TYPES = ('clinic', 'ngo', 'hotline', 'counseling_center')
+CITIES = ('Kigali', 'Huye', 'Musanze', 'Rubavu', 'Rwamagana', 'Muhanga')
+
+
+def seed(count):
+    """Insert ``count`` synthetic resources."""
+    batch = []
+    for i in range(count):
+        batch.append((
+            f"Benchmark Resource {i}", TYPES[i % len(TYPES)],
+            "Synthetic resource used by the row mode benchmark.",
+            f"+250 788 {i:06d}", f"resource{i}@example.rw", f"KN {i % 500} St",
+            CITIES[i % len(CITIES)], "Rwanda", None, i % 7 == 0
+        ))
+        if len(batch) == 5000:
+            db_manager.execute_many(INSERT_QUERY, batch)
+            batch = []
+    if batch:
+        db_manager.execute_many(INSERT_QUERY, batch)
+
+
+def measure(label, func, repeats):
+    """Run ``func`` ``repeats`` times; report the best time and peak allocation."""
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<34} {best * 1000:>10.1f} ms {peak / 1024 / 1024:>10.1f} MiB")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    query = SupportResource.ALL_RESOURCES_QUERY
+
+    if not db_manager.connect():
+        return
+
+    existing = db_manager.execute_query("SELECT COUNT(*) AS n FROM support_resources")[0]['n']
+    if existing < count:
+        seed(count - existing)
+    total = db_manager.execute_query("SELECT COUNT(*) AS n FROM support_resources")[0]['n']
+
+    print(f"\nFetching {total} rows on {db_manager.backend.label}, best of {repeats}\n")
+    print(f"{'Mode':<34} {'Time':>13} {'Peak alloc':>14}")
+    print("-" * 63)
+
+    measure("fetch: dict rows", lambda: db_manager.execute_query(query), repeats)
+    measure("fetch: tuple rows", lambda: db_manager.execute_rows(query), repeats)
+    measure("fetch: tuple rows -> namedtuples", lambda: db_manager.execute_rows(query).named(), repeats)
+
+    dict_rows = db_manager.execute_query(query)
+    tuple_rows = db_manager.execute_rows(query)
+    measure("hydrate: from dict rows", lambda: SupportResource.mapper.hydrate(dict_rows), repeats)
+    measure("hydrate: from tuple rows", lambda: SupportResource.mapper.hydrate(tuple_rows), repeats)
+
+    measure("end to end: dict rows", lambda: SupportResource.mapper.hydrate(
+        db_manager.execute_query(query)
+    ), repeats)
+    measure("end to end: tuple rows", lambda: SupportResource.mapper.hydrate(db_manager.execute_rows(query)), repeats)
+
+    db_manager.disconnect()
+
+
+if __name__ == '__main__':
+    main()
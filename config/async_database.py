@@ -0,0 +1,168 @@
+import asyncio
+import os
+from dotenv import load_dotenv
+from mysql.connector import errorcode
+
+from config.database import db_manager
+from config.result_cache import tables_written
+
+try:
+    import aiomysql
+    from pymysql import Error
+except ImportError:  # aiomysql is only needed by the asyncio entry points
+    aiomysql = None
+    Error = Exception
+
+# Load environment variables
+load_dotenv()
+
+# aiomysql errors meaning the server could not be reached or the connection was lost
+ASYNC_OUTAGE_ERRNOS = frozenset((
+    errorcode.CR_CONNECTION_ERROR,
+    errorcode.CR_CONN_HOST_ERROR,
+    errorcode.CR_SERVER_GONE_ERROR,
+    errorcode.CR_SERVER_LOST,
+))
+
+
+class AsyncDatabaseManager:
+    """Asyncio counterpart of DatabaseManager.
+
+    Uses the connection settings, circuit breaker, query statistics and
+    result cache of ``manager``. On MySQL (with aiomysql installed) it keeps
+    its own connection pool; other backends have no asyncio driver, so their
+    statements run on ``manager`` in a worker thread.
+    """
+
+    def __init__(self, manager=db_manager):
+        self.manager = manager
+        self.pool_min_size = int(os.getenv('DB_ASYNC_POOL_MIN_SIZE', 1))
+        self.pool_size = int(os.getenv('DB_ASYNC_POOL_SIZE', 20))
+        self.pool_recycle = int(os.getenv('DB_ASYNC_POOL_RECYCLE', 3600))
+        self.pool = None
+        self._connect_lock = None
+
+    @property
+    def native(self):
+        """Whether statements go through the aiomysql pool rather than a worker thread."""
+        return aiomysql is not None and self.manager.backend.name == 'mysql'
+
+    async def connect(self):
+        """Create the async connection pool."""
+        if self.pool is not None or not self.native:
+            return True
+
+        # Many coroutines may hit an unconnected manager at once; only one creates the pool
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self.pool is not None:
+                return True
+            return await self._create_pool()
+
+    async def _create_pool(self):
+        manager = self.manager
+        try:
+            self.pool = await aiomysql.create_pool(
+                host=manager.host,
+                db=manager.database,
+                user=manager.user,
+                password=manager.password,
+                port=int(manager.port),
+                minsize=self.pool_min_size,
+                maxsize=self.pool_size,
+                pool_recycle=self.pool_recycle,
+                autocommit=True,
+                cursorclass=aiomysql.DictCursor
+            )
+            print("✓ Successfully connected to MySQL database (async)")
+            return True
+
+        except Error as e:
+            manager._record_outage()
+            print(f"✗ Error connecting to MySQL database: {e}")
+            return False
+
+    async def disconnect(self):
+        """Close the async connection pool."""
+        if self.pool is not None:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
+            print("✓ Database connection closed")
+
+    async def _run(self, query, operation, is_read, failure="Error executing query"):
+        """Run ``operation(cursor)`` on a pooled connection, as DatabaseManager does for its calls.
+
+        Returns None when the database is unreachable, the circuit breaker
+        is open or the statement fails.
+        """
+        manager = self.manager
+        if not await self.connect():
+            return None
+        if not manager.breaker.allow():
+            return None
+
+        started = manager.query_stats.timer()
+        try:
+            async with self.pool.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    result = await operation(cursor)
+
+        except Error as e:
+            manager.query_stats.record(query, started, failed=True)
+            if getattr(e, 'args', None) and e.args[0] in ASYNC_OUTAGE_ERRNOS:
+                manager._record_outage()
+            else:
+                manager.breaker.record_success()
+            print(f"✗ {failure}: {e}")
+            return None
+
+        manager.breaker.record_success()
+        if not is_read:
+            manager.result_cache.invalidate(tables_written(query))
+        manager.query_stats.record(query, started, len(result) if is_read else result)
+        return result
+
+    async def fetch_all(self, query, params=None):
+        """Run a SELECT and return all rows as dictionaries."""
+        if not self.native:
+            return await asyncio.to_thread(self.manager.execute_query, query, params)
+
+        async def fetch(cursor):
+            await cursor.execute(query, params)
+            return list(await cursor.fetchall())
+
+        return await self._run(query, fetch, is_read=True)
+
+    async def fetch_one(self, query, params=None):
+        """Run a SELECT and return the first row, or None."""
+        rows = await self.fetch_all(query, params)
+        return rows[0] if rows else None
+
+    async def execute(self, query, params=None):
+        """Run a write statement and return the affected row count."""
+        if not self.native:
+            return await asyncio.to_thread(self.manager.execute_query, query, params)
+
+        async def execute(cursor):
+            await cursor.execute(query, params)
+            return cursor.rowcount
+
+        return await self._run(query, execute, is_read=False)
+
+    async def execute_many(self, query, data_list):
+        """Run a write statement once per parameter set."""
+        if not self.native:
+            return await asyncio.to_thread(self.manager.execute_many, query, data_list)
+
+        async def execute_many(cursor):
+            await cursor.executemany(query, data_list)
+            return cursor.rowcount
+
+        return await self._run(query, execute_many, is_read=False, failure="Error executing batch query")
+
+
+# Global async database instance
+async_db_manager = AsyncDatabaseManager()
@@ -0,0 +1,625 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime
+from functools import lru_cache
+
+import mysql.connector
+from mysql.connector import errorcode
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MIGRATIONS_PATH = os.path.join(PROJECT_ROOT, 'database', 'migrations')
+
+# Errors raised by any supported backend
+DATABASE_ERRORS = (mysql.connector.Error, sqlite3.Error)
+
+# Client errors meaning the server connection is gone rather than the statement being wrong
+MYSQL_DISCONNECT_ERRNOS = frozenset((
+    errorcode.CR_CONNECTION_ERROR,
+    errorcode.CR_CONN_HOST_ERROR,
+    errorcode.CR_SERVER_GONE_ERROR,
+    errorcode.CR_SERVER_LOST,
+    errorcode.CR_SERVER_LOST_EXTENDED,
+))
+
+# Default of ``connect(socket_timeout=...)``: use the manager's DB_SOCKET_TIMEOUT
+MANAGER_SOCKET_TIMEOUT = object()
+
+# Leading SELECT of a statement, where MySQL accepts optimizer hints
+_SELECT_KEYWORD = re.compile(r'^(\s*SELECT)\b', re.IGNORECASE)
+
+
+class MySQLBackend:
+    """MySQL server backend (the production default)."""
+
+    name = 'mysql'
+    supports_prepared = True
+    supports_replicas = True
+    supports_load_infile = True
+    # DDL commits implicitly, so a migration cannot be rolled back as a whole
+    transactional_ddl = False
+    # Migrations are a deploy step (tools/migrate.py), never run on connect
+    auto_migrate = False
+    # The text protocol has no placeholder limit; chunks are bounded by max_allowed_packet
+    max_bind_params = None
+    # Connections carry DB_SOCKET_TIMEOUT, so long maintenance needs a connection of its own
+    socket_timeouts = True
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.label = "MySQL database"
+
+    def connect(self, host=None, port=None, socket_timeout=MANAGER_SOCKET_TIMEOUT):
+        """Open a new connection using the manager's settings, optionally to another host.
+
+        ``socket_timeout`` overrides DB_SOCKET_TIMEOUT; None waits on the
+        server indefinitely, for migrations and bulk loads that legitimately
+        run longer (statements keep their MAX_EXECUTION_TIME limits).
+        """
+        if socket_timeout is MANAGER_SOCKET_TIMEOUT:
+            socket_timeout = self.manager.socket_timeout
+        socket_timeout = socket_timeout or None
+        connection = mysql.connector.connect(
+            host=host or self.manager.host,
+            database=self.manager.database,
+            user=self.manager.user,
+            password=self.manager.password,
+            port=port or self.manager.port,
+            autocommit=True,
+            allow_local_infile=self.manager.allow_local_infile,
+            # The C extension also applies this to every read and write
+            connection_timeout=socket_timeout
+        )
+
+        # The pure-Python driver only uses it for the handshake; keep it on the socket
+        sock = getattr(connection, '_socket', None)
+        if socket_timeout and sock is not None:
+            sock.set_connection_timeout(socket_timeout)
+        return connection
+
+    def inserted_id_range(self, cursor, count):
+        """Inclusive ID range generated by the multi-row INSERT just run on ``cursor``.
+
+        MySQL reports the first ID of the statement; a single INSERT with a
+        known row count receives consecutive values (auto_increment_increment=1).
+        """
+        return cursor.lastrowid, cursor.lastrowid + count - 1
+
+    def replication_lag(self, connection):
+        """Return how many seconds a replica is behind its source, or None if not replicating."""
+        cursor = connection.cursor(dictionary=True)
+        try:
+            try:
+                cursor.execute("SHOW REPLICA STATUS")
+                column = 'Seconds_Behind_Source'
+            except mysql.connector.Error:
+                # Servers older than 8.0.22 only know the old syntax
+                cursor.execute("SHOW SLAVE STATUS")
+                column = 'Seconds_Behind_Master'
+            status = cursor.fetchone()
+        finally:
+            cursor.close()
+
+        if not status or status.get(column) is None:
+            return None
+        return float(status[column])
+
+    def translate(self, query):
+        """MySQL runs the application's SQL unchanged."""
+        return query
+
+    def cursor(self, connection, dictionary=True):
+        return connection.cursor(dictionary=dictionary)
+
+    def limit_query(self, query, seconds):
+        """Return ``query`` with a MAX_EXECUTION_TIME hint if it is a SELECT.
+
+        The server aborts the statement after ``seconds`` (0 = no limit);
+        other statements are returned unchanged.
+        """
+        if not seconds:
+            return query
+        return _execution_time_hint(query, max(1, int(seconds * 1000)))
+
+    @contextmanager
+    def time_limit(self, connection, seconds):
+        """Statements carry their own limit (see :meth:`limit_query`)."""
+        yield
+
+    def run_transaction(self, connection, statements):
+        """Run ``(query, params)`` pairs atomically and return their row counts.
+
+        The statements are sent as one multi-statement script wrapped in
+        START TRANSACTION/COMMIT, so the whole unit costs a single round trip.
+        """
+        script = ";\n".join(
+            ["START TRANSACTION"] + [query.strip().rstrip(';') for query, _ in statements] + ["COMMIT"]
+        )
+        params = tuple(value for _, values in statements for value in values)
+
+        cursor = connection.cursor()
+        try:
+            rowcounts = [result.rowcount for result in cursor.execute(script, params, multi=True)]
+        except mysql.connector.Error:
+            # The server stops at the failing statement, leaving the transaction open
+            try:
+                connection.rollback()
+            except mysql.connector.Error:
+                pass
+            raise
+        finally:
+            cursor.close()
+
+        return rowcounts[1:-1]
+
+    def run_pipeline(self, connection, statements):
+        """Run ``(query, params)`` SELECTs as one multi-statement script.
+
+        Returns the rows of each statement. All result sets come back from a
+        single round trip.
+        """
+        script = ";\n".join(query.strip().rstrip(';') for query, _ in statements)
+        params = tuple(value for _, values in statements for value in values)
+
+        cursor = connection.cursor(dictionary=True)
+        try:
+            return [result.fetchall() for result in cursor.execute(script, params, multi=True)]
+        finally:
+            cursor.close()
+
+    def explain(self, connection, query, params=()):
+        """Return the plan of ``query`` as a list of backend-neutral steps.
+
+        Each step is a dict with ``table`` (as written in the query, so
+        possibly an alias), ``access`` (``scan``, ``index scan``, ``lookup``
+        or None), ``index``, estimated ``rows`` and the ``filesort`` and
+        ``temporary`` flags.
+        """
+        cursor = connection.cursor(dictionary=True)
+        try:
+            cursor.execute(f"EXPLAIN {query}", params)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        steps = []
+        for row in rows:
+            extra = row.get('Extra') or ''
+            steps.append({
+                'table': row['table'] if row['table'] and not row['table'].startswith('<') else None,
+                'access': _MYSQL_ACCESS.get(row['type'], 'lookup') if row['type'] else None,
+                'index': row['key'],
+                'rows': row['rows'],
+                'filesort': 'Using filesort' in extra,
+                'temporary': 'Using temporary' in extra,
+            })
+        return steps
+
+    def secondary_indexes(self, connection):
+        """Return ``(table, index)`` for every non-unique index of the current schema."""
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT DISTINCT TABLE_NAME, INDEX_NAME FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND NON_UNIQUE = 1 ORDER BY TABLE_NAME, INDEX_NAME"
+            )
+            return [tuple(row) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    def analyze(self, connection, tables):
+        """Refresh the optimizer's statistics for ``tables``."""
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"ANALYZE TABLE {', '.join(tables)}")
+            cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def migration_statements(self, script):
+        """Split a migration script into statements."""
+        return [statement.strip() for statement in _LINE_COMMENT.sub('', script).split(';') if statement.strip()]
+
+    def index_exists(self, connection, table, index):
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT 1 FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s LIMIT 1",
+                (table, index)
+            )
+            return cursor.fetchone() is not None
+        finally:
+            cursor.close()
+
+    def column_exists(self, connection, table, column):
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT 1 FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s LIMIT 1",
+                (table, column)
+            )
+            return cursor.fetchone() is not None
+        finally:
+            cursor.close()
+
+    def online_index_ddl(self, statement):
+        """Build the index with InnoDB online DDL, so the table keeps accepting writes."""
+        if re.search(r'\bALGORITHM\s*=', statement, re.IGNORECASE):
+            return statement
+        if statement.upper().startswith('ALTER'):
+            return f"{statement}, ALGORITHM=INPLACE, LOCK=NONE"
+        return f"{statement} ALGORITHM=INPLACE LOCK=NONE"
+
+    def ping(self, connection):
+        """Round-trip to the server, raising if the connection is dead."""
+        connection.ping(reconnect=False)
+
+    def is_disconnect(self, error):
+        """Whether ``error`` means the connection was lost (so a retry may succeed)."""
+        if getattr(error, 'errno', None) in MYSQL_DISCONNECT_ERRNOS:
+            return True
+        # "MySQL Connection not available" is raised client-side without an error number
+        return isinstance(error, mysql.connector.errors.OperationalError) and error.errno in (None, -1)
+
+    def is_timeout(self, error):
+        """Whether ``error`` is a statement or socket timeout rather than a failure of the statement."""
+        if getattr(error, 'errno', None) == errorcode.ER_QUERY_TIMEOUT:
+            return True
+        return getattr(error, 'errno', None) == errorcode.CR_SERVER_LOST and 'timed out' in str(error)
+
+
+@lru_cache(maxsize=1024)
+def _execution_time_hint(query, milliseconds):
+    return _SELECT_KEYWORD.sub(rf'\1 /*+ MAX_EXECUTION_TIME({milliseconds}) */', query, count=1)
+
+
+# EXPLAIN ``type`` values that read a whole table or a whole index
+_MYSQL_ACCESS = {'ALL': 'scan', 'index': 'index scan'}
+
+
+# --- SQLite ---------------------------------------------------------------
+
+LOCAL_NOW = "datetime('now', 'localtime')"
+
+_PLACEHOLDER = re.compile(r'%s')
+_INSERT_IGNORE = re.compile(r'\bINSERT\s+IGNORE\b', re.IGNORECASE)
+_ON_DUPLICATE = re.compile(r'\bON\s+DUPLICATE\s+KEY\s+UPDATE\b', re.IGNORECASE)
+_VALUES_FUNCTION = re.compile(r'\bVALUES\s*\(\s*(\w+)\s*\)', re.IGNORECASE)
+_NOW = re.compile(r'\bNOW\(\)', re.IGNORECASE)
+_LAST_INSERT_ID = re.compile(r'\bLAST_INSERT_ID\(\)', re.IGNORECASE)
+
+_AUTO_INCREMENT_PK = re.compile(r'\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b', re.IGNORECASE)
+_ENUM_COLUMN = re.compile(r'\b(\w+)\s+ENUM\s*\(([^)]*)\)', re.IGNORECASE)
+_ON_UPDATE_COLUMN = re.compile(
+    r'\b(\w+)\s+(?:TIMESTAMP|DATETIME)\b[^,\n]*?\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP', re.IGNORECASE
+)
+_ON_UPDATE = re.compile(r'\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP\b', re.IGNORECASE)
+_DEFAULT_NOW = re.compile(r'\bDEFAULT\s+CURRENT_TIMESTAMP\b', re.IGNORECASE)
+_UNIQUE_KEY = re.compile(r'\bUNIQUE\s+KEY\s+\w+\s*\(', re.IGNORECASE)
+_CREATE_TABLE = re.compile(r'\bCREATE\s+TABLE\s+(?!IF\s+NOT\s+EXISTS\b)', re.IGNORECASE)
+_CREATE_INDEX = re.compile(r'\bCREATE\s+(UNIQUE\s+)?INDEX\s+(?!IF\s+NOT\s+EXISTS\b)', re.IGNORECASE)
+_TABLE_NAME = re.compile(r'\bCREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)', re.IGNORECASE)
+_LINE_COMMENT = re.compile(r'--[^\n]*')
+# Quoted string literals, left alone when rewriting placeholders and functions
+_STRING_LITERAL = re.compile(r"""('(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*")""")
+
+# ON CONFLICT DO UPDATE without a conflict target (used for ON DUPLICATE KEY UPDATE)
+SQLITE_MIN_VERSION = (3, 35, 0)
+
+_PLAN_TABLE = re.compile(r'^(SCAN|SEARCH) (?:TABLE )?(\w+)')
+_PLAN_INDEX = re.compile(r'\bUSING (?:(?:AUTOMATIC |PARTIAL |COVERING )*INDEX (\w+)|(?:INTEGER )?PRIMARY KEY)')
+
+
+def _translate_ddl(statement):
+    """Translate a MySQL CREATE statement into SQLite syntax."""
+    statement = _AUTO_INCREMENT_PK.sub('INTEGER PRIMARY KEY AUTOINCREMENT', statement)
+    statement = _ENUM_COLUMN.sub(r'\1 TEXT CHECK (\1 IN (\2))', statement)
+    statement = _ON_UPDATE.sub('', statement)
+    statement = _DEFAULT_NOW.sub(f"DEFAULT ({LOCAL_NOW})", statement)
+    statement = _UNIQUE_KEY.sub('UNIQUE (', statement)
+    statement = _CREATE_TABLE.sub('CREATE TABLE IF NOT EXISTS ', statement)
+    statement = _CREATE_INDEX.sub(lambda m: f"CREATE {m.group(1) or ''}INDEX IF NOT EXISTS ", statement)
+    return statement
+
+
+@lru_cache(maxsize=1024)
+def translate_mysql_to_sqlite(query):
+    """Translate one MySQL statement (with %s placeholders) into SQLite syntax."""
+    if query.lstrip().upper().startswith('CREATE'):
+        query = _translate_ddl(query)
+
+    match = _ON_DUPLICATE.search(query)
+    if match:
+        head = query[:match.start()]
+        tail = _VALUES_FUNCTION.sub(r'excluded.\1', query[match.end():])
+        query = f"{head}ON CONFLICT DO UPDATE SET{tail}"
+
+    return ''.join(part if index % 2 else _translate_code(part)
+                   for index, part in enumerate(_STRING_LITERAL.split(query)))
+
+
+def _translate_code(part):
+    """Rewrite MySQL functions and placeholders in a part of a statement outside string literals."""
+    part = _INSERT_IGNORE.sub('INSERT OR IGNORE', part)
+    part = _NOW.sub(LOCAL_NOW, part)
+    part = _LAST_INSERT_ID.sub('last_insert_rowid()', part)
+    return _PLACEHOLDER.sub('?', part)
+
+
+def translate_schema(script):
+    """Translate a MySQL schema script into a list of SQLite statements.
+
+    ``ON UPDATE CURRENT_TIMESTAMP`` columns become AFTER UPDATE triggers.
+    """
+    statements = []
+    triggers = []
+
+    for statement in _LINE_COMMENT.sub('', script).split(';'):
+        statement = statement.strip()
+        if not statement:
+            continue
+
+        table = _TABLE_NAME.search(statement)
+        if table:
+            for column in _ON_UPDATE_COLUMN.findall(statement):
+                triggers.append(
+                    f"CREATE TRIGGER IF NOT EXISTS trg_{table.group(1)}_{column}_on_update "
+                    f"AFTER UPDATE ON {table.group(1)} FOR EACH ROW WHEN NEW.{column} IS OLD.{column} "
+                    f"BEGIN UPDATE {table.group(1)} SET {column} = {LOCAL_NOW} "
+                    f"WHERE rowid = NEW.rowid; END"
+                )
+
+        statements.append(translate_mysql_to_sqlite(statement))
+
+    return statements + triggers
+
+
+def _dict_row(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+def _convert_datetime(value):
+    return datetime.fromisoformat(value.decode())
+
+
+def _convert_date(value):
+    return date.fromisoformat(value.decode()[:10])
+
+
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_converter('TIMESTAMP', _convert_datetime)
+sqlite3.register_converter('DATETIME', _convert_datetime)
+sqlite3.register_converter('DATE', _convert_date)
+
+
+class SQLiteConnection(sqlite3.Connection):
+    """SQLite connection exposing the ``is_connected()`` check used by the app."""
+
+    def is_connected(self):
+        try:
+            self.execute('SELECT 1')
+            return True
+        except sqlite3.ProgrammingError:
+            return False
+
+
+class SQLiteBackend:
+    """Embedded SQLite backend for offline kiosks, tests and benchmarks.
+
+    ``DB_SQLITE_PATH=:memory:`` gives a throwaway database shared by every
+    pooled connection of the process; the backend keeps one connection of
+    its own open, so the database outlives the pool evicting all of them.
+    Requires SQLite 3.35 or later.
+    """
+
+    name = 'sqlite'
+    supports_prepared = False
+    supports_replicas = False
+    supports_load_infile = False
+    transactional_ddl = True
+    # Pending migrations are applied when the first connection opens
+    auto_migrate = True
+    # SQLITE_MAX_VARIABLE_NUMBER since SQLite 3.32
+    max_bind_params = 32766
+    # No socket: long statements can use the pooled connections
+    socket_timeouts = False
+
+    def __init__(self, path=None, migrations_path=MIGRATIONS_PATH):
+        path = path or os.getenv('DB_SQLITE_PATH', os.path.join('data', 'teen_support.db'))
+        self.migrations_path = migrations_path
+        self._migrated = False
+        self._migrate_lock = threading.Lock()
+        self._keeper = None
+
+        if sqlite3.sqlite_version_info < SQLITE_MIN_VERSION:
+            raise RuntimeError(
+                f"DB_BACKEND=sqlite needs SQLite {'.'.join(map(str, SQLITE_MIN_VERSION))} or later, "
+                f"this Python has {sqlite3.sqlite_version}"
+            )
+
+        if path == ':memory:':
+            # Shared-cache URI so every pooled connection sees the same in-memory database
+            self.database = f"file:tpas-{uuid.uuid4().hex}?mode=memory&cache=shared"
+            self.label = "in-memory SQLite database"
+            # The database is dropped with its last connection; this one is never closed
+            self._keeper = sqlite3.connect(self.database, uri=True, check_same_thread=False)
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.database = f"file:{path}"
+            self.label = f"SQLite database ({path})"
+
+    def connect(self, socket_timeout=None):
+        """Open a connection, applying pending migrations on first use.
+
+        ``socket_timeout`` is accepted for symmetry with MySQL and ignored.
+        """
+        connection = sqlite3.connect(
+            self.database,
+            uri=True,
+            factory=SQLiteConnection,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,  # autocommit, like the MySQL connections
+            check_same_thread=False
+        )
+        connection.row_factory = _dict_row
+        connection.execute('PRAGMA foreign_keys = ON')
+        connection.execute('PRAGMA busy_timeout = 5000')
+        self._ensure_schema(connection)
+        return connection
+
+    def translate(self, query):
+        return translate_mysql_to_sqlite(query)
+
+    def cursor(self, connection, dictionary=True):
+        cursor = connection.cursor()
+        if not dictionary:
+            cursor.row_factory = None
+        return cursor
+
+    def limit_query(self, query, seconds):
+        """SQLite has no per-statement hint; see :meth:`time_limit`."""
+        return query
+
+    @contextmanager
+    def time_limit(self, connection, seconds):
+        """Interrupt statements still running on ``connection`` after ``seconds`` (0 = no limit)."""
+        if not seconds:
+            yield
+            return
+
+        deadline = time.monotonic() + seconds
+        # Checked every few thousand virtual machine instructions
+        connection.set_progress_handler(lambda: time.monotonic() > deadline, 10000)
+        try:
+            yield
+        finally:
+            connection.set_progress_handler(None, 0)
+
+    def run_transaction(self, connection, statements):
+        """Run ``(query, params)`` pairs atomically and return their row counts."""
+        # IMMEDIATE takes the write lock up front, so concurrent writers queue instead of deadlocking
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            rowcounts = [
+                connection.execute(self.translate(query), params).rowcount
+                for query, params in statements
+            ]
+            connection.execute('COMMIT')
+        except sqlite3.Error:
+            connection.execute('ROLLBACK')
+            raise
+        return rowcounts
+
+    def inserted_id_range(self, cursor, count):
+        """Inclusive ID range of the multi-row INSERT just run (SQLite reports the last ID)."""
+        return cursor.lastrowid - count + 1, cursor.lastrowid
+
+    def run_pipeline(self, connection, statements):
+        """Run ``(query, params)`` SELECTs in turn; there is no network round trip to save."""
+        return [connection.execute(self.translate(query), params).fetchall() for query, params in statements]
+
+    def explain(self, connection, query, params=()):
+        """Return the plan of ``query`` in the same shape as :meth:`MySQLBackend.explain`.
+
+        SQLite gives no row estimates, so ``rows`` is None. An automatic
+        index is built by reading the whole table, so it counts as a scan.
+        """
+        rows = connection.execute(f"EXPLAIN QUERY PLAN {self.translate(query)}", params).fetchall()
+
+        steps = []
+        for row in rows:
+            detail = row['detail']
+            step = {'table': None, 'access': None, 'index': None, 'rows': None,
+                    'filesort': False, 'temporary': False}
+
+            if detail.startswith('USE TEMP B-TREE'):
+                step['filesort'] = 'ORDER BY' in detail
+                step['temporary'] = not step['filesort']
+            else:
+                match = _PLAN_TABLE.match(detail)
+                if not match or match.group(2) == 'CONSTANT':
+                    continue
+                index = _PLAN_INDEX.search(detail)
+                step['table'] = match.group(2)
+                step['index'] = (index.group(1) or 'PRIMARY') if index else None
+                if 'AUTOMATIC' in detail or not index:
+                    step['access'] = 'scan'
+                else:
+                    step['access'] = 'lookup' if match.group(1) == 'SEARCH' else 'index scan'
+            steps.append(step)
+        return steps
+
+    def secondary_indexes(self, connection):
+        """Return ``(table, index)`` for every non-unique index created by the schema."""
+        rows = connection.execute(
+            "SELECT tbl_name, name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL "
+            "AND sql NOT LIKE 'CREATE UNIQUE%' ORDER BY tbl_name, name"
+        ).fetchall()
+        return [(row['tbl_name'], row['name']) for row in rows]
+
+    def analyze(self, connection, tables):
+        for table in tables:
+            connection.execute(f"ANALYZE {table}")
+
+    def ping(self, connection):
+        connection.execute('SELECT 1')
+
+    def is_disconnect(self, error):
+        # Only a closed connection object is recoverable; the database file itself is local
+        return isinstance(error, sqlite3.ProgrammingError) and 'closed' in str(error)
+
+    def is_timeout(self, error):
+        return isinstance(error, sqlite3.OperationalError) and 'interrupted' in str(error)
+
+    def migration_statements(self, script):
+        """Translate a MySQL migration script into SQLite statements."""
+        return translate_schema(script)
+
+    def index_exists(self, connection, table, index):
+        return connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND name = ?", (table, index)
+        ).fetchone() is not None
+
+    def column_exists(self, connection, table, column):
+        return connection.execute(
+            "SELECT 1 FROM pragma_table_info(?) WHERE name = ?", (table, column)
+        ).fetchone() is not None
+
+    def online_index_ddl(self, statement):
+        # SQLite has no online index builds; the write lock is held briefly instead
+        return statement
+
+    def _ensure_schema(self, connection):
+        if not self.auto_migrate or self._migrated:
+            return
+
+        # Imported here because the migration runner depends on this module
+        from config.migrations import MigrationError, MigrationRunner
+
+        with self._migrate_lock:
+            if self._migrated:
+                return
+            try:
+                MigrationRunner(self, connection, self.migrations_path, log=None).run()
+            except MigrationError as e:
+                raise sqlite3.DatabaseError(str(e)) from e
+            self._migrated = True
+
+
+def create_backend(manager):
+    """Create the backend selected by DB_BACKEND (``mysql`` or ``sqlite``)."""
+    backend = os.getenv('DB_BACKEND', 'mysql').lower()
+    if backend == 'sqlite':
+        return SQLiteBackend()
+    if backend != 'mysql':
+        print(f"✗ Unknown DB_BACKEND '{backend}', falling back to MySQL")
+    return MySQLBackend(manager)
@@ -0,0 +1,209 @@
+import itertools
+import os
+import tempfile
+import time
+from datetime import date, datetime
+
+from config.backends import DATABASE_ERRORS
+
+
+class BulkLoadResult:
+    """Outcome of a bulk load: row count, timing and the generated IDs.
+
+    ``id_ranges`` holds one inclusive ``(first_id, last_id)`` pair per chunk.
+    IDs are only known for plain multi-row INSERTs, whose auto-increment
+    values are consecutive within each statement; it is None otherwise.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.rows = 0
+        self.chunks = 0
+        self.seconds = 0.0
+        self.id_ranges = []
+        self.failed = False
+
+    @property
+    def ids(self):
+        """All generated IDs in insertion order, or None when they are unknown."""
+        if self.id_ranges is None:
+            return None
+        return [i for first, last in self.id_ranges for i in range(first, last + 1)]
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def print_progress(table, interval=0.5):
+    """Return a progress callback printing ``loaded/total rows`` for ``table``.
+
+    Updates are printed at most every ``interval`` seconds, plus once at the end.
+    """
+    last_printed = [0.0]
+
+    def report(loaded, total):
+        now = time.monotonic()
+        if loaded != total and now - last_printed[0] < interval:
+            return
+        last_printed[0] = now
+        of_total = f"/{total}" if total is not None else ""
+        print(f"\r  {table}: {loaded}{of_total} rows", end="\n" if loaded == total else "", flush=True)
+    return report
+
+
+def _infile_value(value):
+    """Encode one value in LOAD DATA's default tab-separated, backslash-escaped format."""
+    if value is None:
+        return '\\N'
+    if value is True or value is False:
+        return '1' if value else '0'
+    if isinstance(value, datetime):
+        value = value.isoformat(' ')
+    elif isinstance(value, date):
+        value = value.isoformat()
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r').replace('\0', '\\0'))
+
+
+class BulkLoader:
+    """Chunked bulk inserts through a ``DatabaseManager``.
+
+    Rows may be any iterable (including generators), so datasets far larger
+    than memory can be loaded. All chunks run on one borrowed connection.
+    """
+
+    def __init__(self, manager, chunk_size=1000):
+        self.manager = manager
+        self.chunk_size = chunk_size
+
+    def insert(self, table, columns, rows, chunk_size=None, ignore=False, progress=None):
+        """Insert ``rows`` with multi-row ``INSERT ... VALUES`` statements.
+
+        ``progress(loaded, total)`` is called after every chunk; when ``rows``
+        has no length, ``total`` is None until a final call with
+        ``loaded == total``. With ``ignore=True`` duplicate rows
+        are skipped and generated IDs are not reported.
+        """
+        backend = self.manager.backend
+        chunk_size = chunk_size or self.chunk_size
+        if backend.max_bind_params:
+            chunk_size = max(1, min(chunk_size, backend.max_bind_params // len(columns)))
+
+        total = len(rows) if hasattr(rows, '__len__') else None
+        result = BulkLoadResult(table)
+        if ignore:
+            result.id_ranges = None
+
+        verb = "INSERT IGNORE INTO" if ignore else "INSERT INTO"
+        row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+        prefix = f"{verb} {table} ({', '.join(columns)}) VALUES "
+        statements = {}
+        started = time.perf_counter()
+
+        try:
+            with self.manager._borrow_unbounded() as pooled:
+                cursor = backend.cursor(pooled.connection, dictionary=False)
+                try:
+                    iterator = iter(rows)
+                    while True:
+                        chunk = list(itertools.islice(iterator, chunk_size))
+                        if not chunk:
+                            break
+
+                        # Full-size chunks share one statement text
+                        query = statements.get(len(chunk))
+                        if query is None:
+                            query = statements[len(chunk)] = backend.translate(
+                                prefix + ", ".join([row_placeholders] * len(chunk))
+                            )
+
+                        chunk_started = self.manager.query_stats.timer()
+                        cursor.execute(query, [value for row in chunk for value in row])
+                        self.manager.query_stats.record(query, chunk_started, cursor.rowcount)
+
+                        if result.id_ranges is not None:
+                            result.id_ranges.append(backend.inserted_id_range(cursor, len(chunk)))
+                        result.rows += len(chunk)
+                        result.chunks += 1
+                        if progress:
+                            progress(result.rows, total)
+                finally:
+                    cursor.close()
+
+        except DATABASE_ERRORS as e:
+            result.failed = True
+            print(f"✗ Error bulk loading {table} after {result.rows} rows: {e}")
+
+        result.seconds = time.perf_counter() - started
+        if progress and total is None and result.rows:
+            progress(result.rows, result.rows)
+        if result.rows:
+            self.manager._note_write(prefix)
+        return result
+
+    def load_infile(self, table, columns, rows, chunk_size=100000, progress=None):
+        """Load ``rows`` with ``LOAD DATA LOCAL INFILE`` from generated temp files.
+
+        Each chunk is written to a tab-separated temp file and loaded in one
+        statement. Needs DB_BULK_LOCAL_INFILE=on and ``local_infile`` enabled
+        on the server; other backends fall back to :meth:`insert`. Generated
+        IDs are not reported.
+        """
+        backend = self.manager.backend
+        if not backend.supports_load_infile or not self.manager.allow_local_infile:
+            return self.insert(table, columns, rows, progress=progress)
+
+        total = len(rows) if hasattr(rows, '__len__') else None
+        result = BulkLoadResult(table)
+        result.id_ranges = None
+        started = time.perf_counter()
+
+        try:
+            with self.manager._borrow_unbounded() as pooled:
+                cursor = backend.cursor(pooled.connection, dictionary=False)
+                try:
+                    iterator = iter(rows)
+                    while True:
+                        chunk = list(itertools.islice(iterator, chunk_size))
+                        if not chunk:
+                            break
+
+                        path = self._write_infile(chunk)
+                        try:
+                            query = (
+                                f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} "
+                                f"CHARACTER SET utf8mb4 ({', '.join(columns)})"
+                            )
+                            chunk_started = self.manager.query_stats.timer()
+                            cursor.execute(query, (path,))
+                            self.manager.query_stats.record(query, chunk_started, cursor.rowcount)
+                        finally:
+                            os.remove(path)
+
+                        result.rows += len(chunk)
+                        result.chunks += 1
+                        if progress:
+                            progress(result.rows, total)
+                finally:
+                    cursor.close()
+
+        except DATABASE_ERRORS as e:
+            result.failed = True
+            print(f"✗ Error loading {table} from file after {result.rows} rows: {e}")
+
+        result.seconds = time.perf_counter() - started
+        if progress and total is None and result.rows:
+            progress(result.rows, result.rows)
+        if result.rows:
+            self.manager._note_write(f"INSERT INTO {table}")
+        return result
+
+    @staticmethod
+    def _write_infile(chunk):
+        handle, path = tempfile.mkstemp(prefix='bulk-', suffix='.tsv')
+        with os.fdopen(handle, 'w', encoding='utf-8', newline='\n') as infile:
+            for row in chunk:
+                infile.write("\t".join(_infile_value(value) for value in row))
+                infile.write("\n")
+        return path
@@ -0,0 +1,102 @@
+import threading
+import time
+from mysql.connector import Error
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class DatabaseUnavailableError(Error):
+    """Raised when no connection to the database can be obtained."""
+
+
+class CircuitOpenError(DatabaseUnavailableError):
+    """Raised instead of contacting the database while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stop calling a database that keeps failing, and probe it again later.
+
+    After ``failure_threshold`` consecutive outages (lost connections,
+    timeouts, failed connects) the breaker opens and every call fails fast
+    for ``reset_timeout`` seconds. Then a single trial call is let through:
+    success closes the breaker, failure opens it for another period.
+    ``failure_threshold=0`` disables the breaker.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+        # Counters for tuning
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def enabled(self):
+        return self.failure_threshold > 0
+
+    def allow(self):
+        """Whether a call may go to the database now."""
+        if not self.enabled:
+            return True
+
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+
+            if self.state == HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        """A call reached the database; close the breaker."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.failures = 0
+            self._trial_running = False
+            self.state = CLOSED
+
+    def record_failure(self):
+        """A call hit an outage. Returns True if this opened the breaker."""
+        if not self.enabled:
+            return False
+
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.trips += 1
+                return True
+            return False
+
+    def seconds_until_retry(self):
+        """Seconds left before the next trial call, 0 unless the breaker is open."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def stats(self):
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'trips': self.trips,
+                'rejected': self.rejected,
+            }
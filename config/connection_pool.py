@@ -0,0 +1,241 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from mysql.connector import Error
+
+
+class PoolTimeoutError(Error):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class PooledConnection:
+    """A pooled connection together with its usage and health information."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        # A fresh connection counts as known-good until proven otherwise
+        self.last_success = self.created_at
+        self.use_count = 0
+        self.failure_count = 0
+        # Per-connection prepared statement cache, created by the owner on first use
+        self.statements = None
+        # Set when the connection is left in an unusable state and must not be reused
+        self.broken = False
+
+    def record_success(self):
+        """Record a successful use of the connection."""
+        self.failure_count = 0
+        self.last_used = self.last_success = time.monotonic()
+
+    def record_failure(self):
+        """Record a failed use of the connection."""
+        self.failure_count += 1
+        self.last_used = time.monotonic()
+
+    def invalidate(self):
+        """Mark the connection as unusable so the pool closes it on return."""
+        self.broken = True
+
+    def seconds_since_success(self):
+        """Seconds since the connection last completed a statement successfully."""
+        return time.monotonic() - self.last_success
+
+    def idle_seconds(self):
+        """Seconds since the connection was last used."""
+        return time.monotonic() - self.last_used
+
+    def close(self):
+        """Close the underlying connection, ignoring errors."""
+        try:
+            self.connection.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """Thread-safe pool of database connections.
+
+    Connections are opened lazily up to ``max_size``. Idle connections beyond
+    ``min_size`` are closed after ``idle_timeout`` seconds, and connections
+    that fail ``max_failures`` times in a row are discarded on return.
+    """
+
+    def __init__(self, connection_factory, min_size=1, max_size=5,
+                 idle_timeout=300, checkout_timeout=10, max_failures=3):
+        self.connection_factory = connection_factory
+        self.min_size = min_size
+        self.max_size = max(max_size, 1)
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.max_failures = max_failures
+
+        self._idle = deque()
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        # Counters for monitoring
+        self.checkouts = 0
+        self.created = 0
+        self.discarded = 0
+        self.evicted = 0
+
+    def fill(self):
+        """Open connections until the pool holds ``min_size`` of them."""
+        while True:
+            with self._condition:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+
+            try:
+                pooled = self._open()
+            except Exception:
+                self._forget()
+                raise
+
+            with self._condition:
+                self._idle.append(pooled)
+                self._condition.notify()
+
+    def acquire(self, timeout=None):
+        """Check a connection out of the pool."""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        evicted = []
+
+        try:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise Error("Connection pool is closed")
+
+                    evicted.extend(self._evict_idle_locked())
+
+                    if self._idle:
+                        # Most recently used connection first, it is the most likely to be alive
+                        pooled = self._idle.pop()
+                        pooled.use_count += 1
+                        self.checkouts += 1
+                        return pooled
+
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(
+                            f"No database connection available after {timeout}s "
+                            f"(pool size {self.max_size})"
+                        )
+                    self._condition.wait(remaining)
+        finally:
+            # Closing may wait on the server; never with the lock held
+            for stale in evicted:
+                stale.close()
+
+        # Open the new connection outside the lock so other threads are not blocked
+        try:
+            pooled = self._open()
+        except Exception:
+            self._forget()
+            raise
+
+        pooled.use_count += 1
+        with self._condition:
+            self.checkouts += 1
+        return pooled
+
+    def release(self, pooled):
+        """Return a connection to the pool, discarding it if it is unhealthy."""
+        with self._condition:
+            if self._closed or pooled.broken or pooled.failure_count >= self.max_failures:
+                self._size -= 1
+                self.discarded += 1
+                self._condition.notify()
+                discard = True
+            else:
+                self._idle.append(pooled)
+                self._condition.notify()
+                discard = False
+
+        if discard:
+            pooled.close()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """Borrow a connection for the duration of a ``with`` block."""
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    def evict_idle(self):
+        """Close idle connections that exceeded the idle timeout."""
+        with self._condition:
+            evicted = self._evict_idle_locked()
+
+        for pooled in evicted:
+            pooled.close()
+
+    def close_all(self):
+        """Close every idle connection and refuse further checkouts."""
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+
+        for pooled in idle:
+            pooled.close()
+
+    def idle_connections(self):
+        """Return a snapshot of the connections currently idle in the pool."""
+        with self._condition:
+            return list(self._idle)
+
+    def stats(self):
+        """Return a snapshot of pool usage."""
+        with self._condition:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'max_size': self.max_size,
+                'checkouts': self.checkouts,
+                'created': self.created,
+                'discarded': self.discarded,
+                'evicted': self.evicted,
+            }
+
+    def _open(self):
+        connection = self.connection_factory()
+        with self._condition:
+            self.created += 1
+        return PooledConnection(connection)
+
+    def _forget(self):
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _evict_idle_locked(self):
+        """Take expired idle connections out of the pool and return them, for the caller to close."""
+        evicted = []
+        if not self.idle_timeout:
+            return evicted
+
+        # Oldest connections sit at the left end of the deque
+        while self._idle and self._size > self.min_size:
+            if self._idle[0].idle_seconds() < self.idle_timeout:
+                break
+            evicted.append(self._idle.popleft())
+            self._size -= 1
+            self.evicted += 1
+        return evicted
@@ -0,0 +1,163 @@
+import atexit
+import os
+import threading
+
+from config.database import db_manager
+
+
+class Counter:
+    """A column of per-key counters that is incremented through an aggregator.
+
+    With ``upsert=True`` missing keys are inserted (the key column must be
+    unique); otherwise existing rows are updated.
+    """
+
+    def __init__(self, aggregator, table, key_column, value_column, upsert=False):
+        self.aggregator = aggregator
+        self.table = table
+        self.key_column = key_column
+        self.value_column = value_column
+        self.upsert = upsert
+
+    def increment(self, key, amount=1):
+        """Add ``amount`` to the counter for ``key``; written back later."""
+        self.aggregator.increment(self, key, amount)
+
+    def pending(self, key):
+        """Increments for ``key`` not yet written to the database."""
+        return self.aggregator.pending(self, key)
+
+    def statement(self, deltas):
+        """Build one ``(query, params)`` applying every ``{key: delta}`` in ``deltas``."""
+        if self.upsert:
+            values = ", ".join(["(%s, %s)"] * len(deltas))
+            query = (
+                f"INSERT INTO {self.table} ({self.key_column}, {self.value_column}) VALUES {values} "
+                f"ON DUPLICATE KEY UPDATE {self.value_column} = {self.value_column} + VALUES({self.value_column})"
+            )
+            params = tuple(value for item in deltas.items() for value in item)
+            return query, params
+
+        cases = " ".join(["WHEN %s THEN %s"] * len(deltas))
+        keys = ", ".join(["%s"] * len(deltas))
+        query = (
+            f"UPDATE {self.table} SET {self.value_column} = {self.value_column} + "
+            f"CASE {self.key_column} {cases} ELSE 0 END WHERE {self.key_column} IN ({keys})"
+        )
+        params = tuple(value for item in deltas.items() for value in item) + tuple(deltas)
+        return query, params
+
+
+class CounterAggregator:
+    """Write-behind aggregation of counter increments.
+
+    Increments are coalesced per key in memory and written back in one
+    transaction, with one batched statement per counter, every
+    ``flush_interval`` seconds, once ``max_pending`` increments are waiting,
+    or at shutdown. Increments whose flush fails are kept for the next one.
+    """
+
+    def __init__(self, manager, flush_interval=5.0, max_pending=100):
+        self.manager = manager
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._pending = {}
+        self._pending_count = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+        # Counters for monitoring
+        self.increments = 0
+        self.flushes = 0
+        self.statements = 0
+
+    def counter(self, table, key_column, value_column, upsert=False):
+        """Declare a counter column handled by this aggregator."""
+        return Counter(self, table, key_column, value_column, upsert)
+
+    def increment(self, counter, key, amount=1):
+        if self.flush_interval <= 0:
+            # Write-behind disabled: apply the increment straight away
+            query, params = counter.statement({key: amount})
+            self.manager.execute_query(query, params)
+            return
+
+        with self._lock:
+            deltas = self._pending.setdefault(counter, {})
+            deltas[key] = deltas.get(key, 0) + amount
+            self._pending_count += 1
+            self.increments += 1
+            full = self._pending_count >= self.max_pending
+
+        self._ensure_thread()
+        if full:
+            self._wake.set()
+
+    def pending(self, counter, key):
+        with self._lock:
+            return self._pending.get(counter, {}).get(key, 0)
+
+    def flush(self):
+        """Write every pending increment now. Returns False if the write failed."""
+        with self._flush_lock:
+            with self._lock:
+                batch = {counter: deltas for counter, deltas in self._pending.items() if deltas}
+                count = self._pending_count
+                self._pending = {}
+                self._pending_count = 0
+
+            if not batch:
+                return True
+
+            with self.manager.transaction() as unit:
+                for counter, deltas in batch.items():
+                    unit.add(*counter.statement(deltas))
+
+            if unit.committed:
+                self.flushes += 1
+                self.statements += len(batch)
+                return True
+
+            # Put the increments back so they are retried on the next flush
+            with self._lock:
+                for counter, deltas in batch.items():
+                    pending = self._pending.setdefault(counter, {})
+                    for key, amount in deltas.items():
+                        pending[key] = pending.get(key, 0) + amount
+                self._pending_count += count
+            return False
+
+    def stats(self):
+        with self._lock:
+            return {
+                'pending': self._pending_count,
+                'increments': self.increments,
+                'flushes': self.flushes,
+                'statements': self.statements,
+            }
+
+    def _ensure_thread(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='counter-flush', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+# Global aggregator, flushed on exit so no increments are lost
+counter_aggregator = CounterAggregator(
+    db_manager,
+    flush_interval=float(os.getenv('DB_COUNTER_FLUSH_INTERVAL', 5)),
+    max_pending=int(os.getenv('DB_COUNTER_FLUSH_SIZE', 100))
+)
+atexit.register(counter_aggregator.flush)
@@ -1,14 +1,25 @@
-import mysql.connector
-from mysql.connector import Error
 import os
+import threading
+import time
+from contextlib import ExitStack, contextmanager
 from dotenv import load_dotenv
+from config.backends import DATABASE_ERRORS, create_backend
+from config.bulk_loader import BulkLoader
+from config.circuit_breaker import CircuitBreaker, CircuitOpenError, DatabaseUnavailableError
+from config.connection_pool import ConnectionPool, PooledConnection, PoolTimeoutError
+from config.statement_cache import StatementCache, classify_statement
+from config.query_stats import QueryStats
+from config.replicas import ReplicaSet, parse_replica_hosts
+from config.result_cache import ResultCache, tables_written
+from config.rows import RowSet, column_map, description_names
+from config.unit_of_work import UnitOfWork
 
 # Load environment variables
 load_dotenv()
 
 class DatabaseManager:
     """Manages database connections and operations."""
-    
+
     def __init__(self):
         self.host = os.getenv('DB_HOST', 'teenage-pc-mfitumukizapeter255-fa99.d.aivencloud.com')
         self.database = os.getenv('DB_NAME', 'defaultdb')
@@ -16,63 +27,680 @@ class DatabaseManager:
         self.password = os.getenv('DB_PASSWORD', 'AVNS_LxwVa_57ZXqckNMOgt2')
         self.port = os.getenv('DB_PORT', 16835)
         self.connection = None
-    
+
+        # Bulk loading (LOAD DATA LOCAL INFILE must also be enabled on the server)
+        self.allow_local_infile = os.getenv('DB_BULK_LOCAL_INFILE', 'off').lower() in ('1', 'on', 'true')
+        self.bulk_loader = BulkLoader(self, chunk_size=int(os.getenv('DB_BULK_CHUNK_SIZE', 1000)))
+
+        # MySQL by default; DB_BACKEND=sqlite runs on an embedded database
+        self.backend = create_backend(self)
+
+        # Connection pool settings (DB_POOL_SIZE=0 keeps the single shared connection)
+        self.pool_size = int(os.getenv('DB_POOL_SIZE', 5))
+        self.pool_min_size = int(os.getenv('DB_POOL_MIN_SIZE', 1))
+        self.pool_idle_timeout = float(os.getenv('DB_POOL_IDLE_TIMEOUT', 300))
+        self.pool_checkout_timeout = float(os.getenv('DB_POOL_CHECKOUT_TIMEOUT', 10))
+        self.pool = None
+        self._shared = None
+
+        # Optional read replicas (DB_REPLICA_HOSTS=host[:port],...), used in pooled mode only
+        self.replica_endpoints = parse_replica_hosts(os.getenv('DB_REPLICA_HOSTS'), self.port)
+        self.replica_max_lag = float(os.getenv('DB_REPLICA_MAX_LAG', 2))
+        self.replica_check_interval = float(os.getenv('DB_REPLICA_CHECK_INTERVAL', 5))
+        self.replica_probe_timeout = float(os.getenv('DB_REPLICA_PROBE_TIMEOUT', 1))
+        # After a write, this thread reads from the primary for this many seconds
+        self.read_your_writes_seconds = float(os.getenv('DB_READ_YOUR_WRITES_SECONDS', 5))
+        self.replicas = None
+        self._session = threading.local()
+
+        # Liveness: ping only connections idle this long, retry lost reads with backoff
+        self.ping_after_idle = float(os.getenv('DB_PING_AFTER_IDLE', 30))
+        self.read_retries = int(os.getenv('DB_READ_RETRIES', 2))
+        self.retry_backoff = float(os.getenv('DB_RETRY_BACKOFF', 0.2))
+        self.pings = 0
+        self.reconnects = 0
+        self.retries = 0
+        self.timeouts = 0
+
+        # Time limits: DB_QUERY_TIMEOUT for each SELECT (callers may pass their own), and
+        # DB_SOCKET_TIMEOUT for any wait on the server, so a hung connection cannot block forever
+        self.query_timeout = float(os.getenv('DB_QUERY_TIMEOUT', 5))
+        self.socket_timeout = float(os.getenv('DB_SOCKET_TIMEOUT', 30))
+
+        # Fail fast while the database is down instead of making every screen wait for timeouts
+        self.breaker = CircuitBreaker(
+            failure_threshold=int(os.getenv('DB_BREAKER_FAILURES', 5)),
+            reset_timeout=float(os.getenv('DB_BREAKER_RESET', 30))
+        )
+
+        # Prepared statements kept per connection (0 disables server-side prepares)
+        self.statement_cache_size = int(os.getenv('DB_STATEMENT_CACHE_SIZE', 64))
+
+        # Result cache for rarely changing tables; writes through this manager invalidate it
+        self.result_cache = ResultCache(
+            max_entries=int(os.getenv('DB_RESULT_CACHE_SIZE', 256)),
+            ttl=float(os.getenv('DB_RESULT_CACHE_TTL', 60)),
+            tables=[table.strip() for table in os.getenv(
+                'DB_RESULT_CACHE_TABLES',
+                'educational_modules,support_resources,anonymous_questions,anonymous_answers'
+            ).split(',') if table.strip()]
+        )
+
+        # Per-query latency statistics and slow-query log
+        self.query_stats_path = os.getenv('DB_QUERY_STATS_FILE', 'logs/query_stats.json')
+        self.query_stats = QueryStats(
+            slow_query_ms=float(os.getenv('DB_SLOW_QUERY_MS', 500)),
+            slow_log_path=os.getenv('DB_SLOW_QUERY_LOG', 'logs/slow_queries.log'),
+            enabled=os.getenv('DB_QUERY_STATS', 'on').lower() not in ('0', 'off', 'false')
+        )
+
+    def _open_connection(self):
+        """Open a new raw connection to the database."""
+        return self.backend.connect()
+
     def connect(self):
         """Establish database connection."""
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                database=self.database,
-                user=self.user,
-                password=self.password,
-                port=self.port,
-                autocommit=True
-            )
-            
+            if self.pool_size > 0:
+                if self.pool is not None:
+                    return True
+
+                pool = ConnectionPool(
+                    self._open_connection,
+                    min_size=min(self.pool_min_size, self.pool_size),
+                    max_size=self.pool_size,
+                    idle_timeout=self.pool_idle_timeout,
+                    checkout_timeout=self.pool_checkout_timeout
+                )
+                pool.fill()
+                self.pool = pool
+                print(f"✓ Successfully connected to {self.backend.label}")
+                self._connect_replicas()
+                return True
+
+            self.connection = self._open_connection()
+            self._shared = PooledConnection(self.connection)
+
             if self.connection.is_connected():
-                print("✓ Successfully connected to MySQL database")
+                print(f"✓ Successfully connected to {self.backend.label}")
                 return True
-                
-        except Error as e:
-            print(f"✗ Error connecting to MySQL database: {e}")
+
+        except DATABASE_ERRORS as e:
+            print(f"✗ Error connecting to {self.backend.label}: {e}")
             return False
-    
+
+    def _connect_replicas(self):
+        """Set up routing to the configured read replicas."""
+        if not self.replica_endpoints or not self.backend.supports_replicas:
+            return
+
+        # Replica pools start empty so an unreachable replica never blocks startup
+        self.replicas = ReplicaSet.from_endpoints(
+            self.replica_endpoints,
+            lambda host, port: self.backend.connect(host, port),
+            self.backend.replication_lag,
+            max_lag=self.replica_max_lag,
+            check_interval=self.replica_check_interval,
+            # Lag probes get their own connection with a short timeout, so a dead replica is dropped fast
+            probe_factory=lambda host, port: self.backend.connect(
+                host, port, socket_timeout=self.replica_probe_timeout),
+            min_size=0,
+            max_size=self.pool_size,
+            idle_timeout=self.pool_idle_timeout,
+            checkout_timeout=self.pool_checkout_timeout
+        )
+        print(f"✓ Routing reads to {len(self.replica_endpoints)} replica(s)")
+
     def disconnect(self):
         """Close database connection."""
-        if self.connection and self.connection.is_connected():
+        if self.replicas is not None:
+            self.replicas.close_all()
+            self.replicas = None
+
+        if self.pool is not None:
+            self.pool.close_all()
+            self.pool = None
+            print("✓ Database connection closed")
+        elif self.connection and self.connection.is_connected():
             self.connection.close()
+            self._shared = None
             print("✓ Database connection closed")
-    
-    def execute_query(self, query, params=None):
-        """Execute a query and return results."""
+
+    def _is_alive(self, pooled):
+        """Check a connection, pinging the server only after an idle period."""
+        if pooled.broken:
+            return False
+        if pooled.seconds_since_success() < self.ping_after_idle:
+            return True
+
+        self.pings += 1
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query, params)
-            
-            if query.strip().upper().startswith('SELECT'):
-                return cursor.fetchall()
+            self.backend.ping(pooled.connection)
+        except DATABASE_ERRORS:
+            return False
+        pooled.record_success()
+        return True
+
+    def _checkout(self, replica=None):
+        """Return ``(pooled, release)`` for a live connection, connecting on first use."""
+        if self.pool is None and self._shared is None and not self.connect():
+            raise DatabaseUnavailableError("Not connected to the database")
+
+        pool = replica.pool if replica is not None else self.pool
+        while True:
+            if pool is not None:
+                pooled = pool.acquire()
+                release = pool.release
             else:
-                return cursor.rowcount
-                
-        except Error as e:
-            print(f"✗ Error executing query: {e}")
+                pooled = self._shared
+                release = None
+
+            if self._is_alive(pooled):
+                return pooled, release
+
+            # Dead connection: drop it and use (or open) another one
+            self.reconnects += 1
+            pooled.invalidate()
+            if release is not None:
+                release(pooled)
+            else:
+                pooled.close()
+                self.connection = self._open_connection()
+                self._shared = PooledConnection(self.connection)
+
+    @contextmanager
+    def _borrow(self, replica=None):
+        """Borrow a live pooled connection wrapper (from a replica if given), tracking its health.
+
+        Outages of the primary (failed connects, lost connections, timeouts)
+        feed the circuit breaker; while it is open this raises
+        :class:`CircuitOpenError` without contacting the server.
+        """
+        primary = replica is None
+        if primary and not self.breaker.allow():
+            raise CircuitOpenError(
+                f"Database unavailable, retrying in {self.breaker.seconds_until_retry():.0f} s"
+            )
+
+        try:
+            pooled, release = self._checkout(replica)
+        except PoolTimeoutError:
+            if primary:
+                self._record_outage()
+            raise
+        except DATABASE_ERRORS as e:
+            if primary:
+                self._record_outage()
+            if isinstance(e, DatabaseUnavailableError):
+                raise
+            raise DatabaseUnavailableError(f"Cannot connect to the database: {e}") from e
+
+        outage = False
+        try:
+            yield pooled
+        except DATABASE_ERRORS as e:
+            pooled.record_failure()
+            if self.backend.is_disconnect(e):
+                pooled.invalidate()
+            if self.backend.is_timeout(e):
+                self.timeouts += 1
+                outage = True
+            outage = outage or self.backend.is_disconnect(e)
+            raise
+        else:
+            pooled.record_success()
+        finally:
+            if release is not None:
+                release(pooled)
+            if primary:
+                # Any answer from the server, even an error, shows it is reachable
+                if outage:
+                    self._record_outage()
+                else:
+                    self.breaker.record_success()
+
+    @contextmanager
+    def _borrow_unbounded(self):
+        """Borrow a connection without a socket timeout for bulk loads and maintenance.
+
+        DB_SOCKET_TIMEOUT protects interactive calls from a hung server, but
+        a LOAD DATA or ANALYZE on a large table keeps the server busy for
+        longer. On backends with socket timeouts these get a dedicated
+        connection, closed afterwards; elsewhere this is :meth:`_borrow`.
+        """
+        if not self.backend.socket_timeouts or not self.socket_timeout:
+            with self._borrow() as pooled:
+                yield pooled
+            return
+
+        if not self.breaker.allow():
+            raise CircuitOpenError(
+                f"Database unavailable, retrying in {self.breaker.seconds_until_retry():.0f} s"
+            )
+        try:
+            connection = self.backend.connect(socket_timeout=None)
+        except DATABASE_ERRORS as e:
+            self._record_outage()
+            raise DatabaseUnavailableError(f"Cannot connect to the database: {e}") from e
+        self.breaker.record_success()
+        try:
+            yield PooledConnection(connection)
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _borrow_read(self, replica):
+        """:meth:`_borrow` for a read, from the primary if ``replica`` cannot hand out a connection."""
+        with ExitStack() as stack:
+            try:
+                pooled = stack.enter_context(self._borrow(replica))
+            except (DatabaseUnavailableError, PoolTimeoutError):
+                if replica is None:
+                    raise
+                self.replicas.mark_down(replica)
+                pooled = stack.enter_context(self._borrow())
+            yield pooled
+
+    def _record_outage(self):
+        if self.breaker.record_failure():
+            print(f"✗ Database unavailable; pausing database calls for "
+                  f"{self.breaker.reset_timeout:.0f} seconds")
+
+    def is_available(self):
+        """Whether the database is believed reachable (the circuit breaker is not open)."""
+        return self.breaker.stats()['state'] != 'open'
+
+    def breaker_stats(self):
+        """Return the circuit breaker state and how often it tripped and rejected calls."""
+        return self.breaker.stats()
+
+    @contextmanager
+    def get_connection(self):
+        """Borrow a connection for the duration of a ``with`` block."""
+        with self._borrow() as pooled:
+            yield pooled.connection
+
+    def _statement_cache(self, pooled):
+        """Return the prepared statement cache of a borrowed connection."""
+        if pooled.statements is None:
+            pooled.statements = StatementCache(pooled.connection, self.statement_cache_size)
+        return pooled.statements
+
+    def pool_stats(self):
+        """Return connection pool statistics, or None when pooling is disabled."""
+        return self.pool.stats() if self.pool is not None else None
+
+    def _read_replica(self):
+        """Pick a replica for a read, or None when the read must go to the primary."""
+        if self.replicas is None:
+            return None
+
+        # Read-your-writes: stay on the primary until replicas have caught up with our write
+        last_write = getattr(self._session, 'last_write', None)
+        if last_write is not None and time.monotonic() - last_write < self.read_your_writes_seconds:
             return None
+        return self.replicas.choose()
+
+    def _note_write(self, *queries):
+        """Start the read-your-writes window and invalidate cached reads of the written tables."""
+        self._session.last_write = time.monotonic()
+        for query in queries:
+            self.result_cache.invalidate(tables_written(query))
+
+    def result_cache_stats(self):
+        """Return result cache hit/miss counters and size."""
+        return self.result_cache.stats()
+
+    def replica_stats(self):
+        """Return per-replica health, lag and read counts, or None without replicas."""
+        return self.replicas.stats() if self.replicas is not None else None
+
+    def liveness_stats(self):
+        """Return how often connections were pinged, replaced and reads retried."""
+        return {'pings': self.pings, 'reconnects': self.reconnects, 'retries': self.retries,
+                'timeouts': self.timeouts}
+
+    def execute_query(self, query, params=None, timeout=None, cached=True):
+        """Execute a query and return results.
+
+        A SELECT is aborted after ``timeout`` seconds (default
+        DB_QUERY_TIMEOUT, 0 = no limit). If it fails while the database is
+        unreachable, the last cached result of a cacheable query is returned.
+        ``cached=False`` bypasses the result cache, for reads that must see
+        writes made by other processes.
+        """
+        return self._execute(query, params, timeout=timeout, cached=cached)
+
+    def execute_rows(self, query, params=None, timeout=None, cached=True):
+        """Execute a SELECT and return a :class:`RowSet` of plain tuples, or None on error.
+
+        No dict is built per row; column positions come from ``rows.getter()``,
+        which is resolved once per statement shape.
+        """
+        return self._execute(query, params, dictionary=False, timeout=timeout, cached=cached)
+
+    def execute_page(self, keyset, params=None, after=None, before=None, page_size=20,
+                     dictionary=True, timeout=None):
+        """Read one page of a :class:`KeysetQuery`, or None on error.
+
+        ``params`` are the listing's own parameters; ``after``/``before`` is
+        a cursor from a previous :class:`Page` (none for the first page).
+        """
+        query, seek_params = keyset.query(after, before, page_size)
+        params = tuple(params) if params is not None else ()
+        rows = self._execute(query, params + seek_params, dictionary, timeout)
+        if rows is None:
+            return None
+        return keyset.page(rows, after, before, page_size)
+
+    def _execute(self, query, params=None, dictionary=True, timeout=None, cached=True):
+        normalized, is_read, is_preparable = classify_statement(query)
+        use_prepared = is_preparable and self.backend.supports_prepared and self.statement_cache_size > 0
+        limit = (self.query_timeout if timeout is None else timeout) if is_read else 0
+
+        cache_key = None
+        if cached and is_read and self.result_cache.enabled and self.result_cache.cacheable(query):
+            cache_key = (normalized, tuple(params) if params is not None else (), dictionary)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            generation = self.result_cache.generation()
+
+        started = self.query_stats.timer()
+
+        def run(pooled):
+            with self.backend.time_limit(pooled.connection, limit):
+                if use_prepared:
+                    return self._execute_prepared(
+                        pooled, self.backend.limit_query(normalized, limit), params, is_read, dictionary
+                    )
+
+                cursor = self.backend.cursor(pooled.connection, dictionary=dictionary)
+                try:
+                    cursor.execute(self.backend.translate(self.backend.limit_query(query, limit)), params or ())
+                    return self._collect(cursor, is_read, dictionary)
+                finally:
+                    cursor.close()
+
+        try:
+            result = self._run(run, is_read)
+        except DATABASE_ERRORS as e:
+            self.query_stats.record(query, started, failed=True)
+            if cache_key is not None and self._unavailable(e):
+                stale = self.result_cache.get_stale(cache_key)
+                if stale is not None:
+                    return stale
+            if not isinstance(e, CircuitOpenError):
+                print(f"✗ Error executing query: {e}")
+            return None
+
+        if not is_read:
+            self._note_write(query)
+        elif cache_key is not None:
+            self.result_cache.put(cache_key, query, result, generation)
+        self.query_stats.record(query, started, len(result) if is_read else result)
+        return result
+
+    def _unavailable(self, error):
+        """Whether ``error`` means the server could not be reached or did not answer in time."""
+        return (isinstance(error, (DatabaseUnavailableError, PoolTimeoutError))
+                or self.backend.is_disconnect(error) or self.backend.is_timeout(error))
+
+    def _run(self, operation, is_read):
+        """Call ``operation(pooled)`` on a borrowed connection.
+
+        Reads go to a replica when one is usable and, being idempotent, are
+        retried on a fresh connection if theirs was lost. A replica that
+        cannot be reached, has no free connection or drops the connection is
+        taken out of rotation and the read goes to the primary at once; that
+        does not use up the ``read_retries`` of the primary. Timeouts are not
+        retried: the server was reached and a retry would wait just as long.
+        """
+        attempts = 1 + (self.read_retries if is_read else 0)
+        replica = self._read_replica() if is_read else None
+
+        attempt = 0
+        while True:
+            try:
+                with self._borrow(replica) as pooled:
+                    return operation(pooled)
+
+            except DATABASE_ERRORS as e:
+                lost = self.backend.is_disconnect(e) and not self.backend.is_timeout(e)
+                if replica is not None and (lost or isinstance(e, (DatabaseUnavailableError, PoolTimeoutError))):
+                    self.retries += 1
+                    self.replicas.mark_down(replica)
+                    replica = None
+                    continue
+                if lost and attempt + 1 < attempts:
+                    self.retries += 1
+                    time.sleep(self.retry_backoff * (2 ** attempt))
+                    attempt += 1
+                    continue
+                raise
+
+    def execute_pipeline(self, statements, timeout=None):
+        """Run several independent SELECTs in one round trip.
+
+        ``statements`` is a list of ``(query, params)`` pairs; the result is
+        a list with the rows of each statement, in order, or None on error.
+        ``timeout`` limits each statement, as in :meth:`execute_query`.
+        """
+        statements = [(query, tuple(params) if params is not None else ()) for query, params in statements]
+        for query, _ in statements:
+            if not classify_statement(query)[1]:
+                raise ValueError("execute_pipeline only accepts read statements")
+
+        # Identically shaped pipelines share one statistics entry
+        label = ";\n".join(query for query, _ in statements)
+        started = self.query_stats.timer()
+        limit = self.query_timeout if timeout is None else timeout
+        limited = [(self.backend.limit_query(query, limit), params) for query, params in statements]
+
+        def run(pooled):
+            with self.backend.time_limit(pooled.connection, limit):
+                return self.backend.run_pipeline(pooled.connection, limited)
+
+        try:
+            results = self._run(run, is_read=True)
+        except DATABASE_ERRORS as e:
+            self.query_stats.record(label, started, failed=True)
+            if not isinstance(e, CircuitOpenError):
+                print(f"✗ Error executing query pipeline: {e}")
+            return None
+
+        self.query_stats.record(label, started, sum(len(rows) for rows in results))
+        return results
+
+    def iter_query_batches(self, query, params=None, batch_size=500, dictionary=True):
+        """Yield the rows of a SELECT in lists of at most ``batch_size`` rows.
+
+        Rows are streamed with an unbuffered cursor, so memory stays flat
+        however large the result is. With ``dictionary=False`` each batch is
+        a :class:`RowSet` of tuples. The connection stays checked out until
+        the generator is exhausted or closed; with DB_POOL_SIZE=0 no other
+        query may run on the shared connection in the meantime.
+        """
+        rows = 0
+        fetch_ms = 0.0
+        failed = False
+
+        try:
+            with self._borrow_read(self._read_replica()) as pooled:
+                cursor = self.backend.cursor(pooled.connection, dictionary=dictionary)
+                try:
+                    started = time.perf_counter()
+                    cursor.execute(self.backend.translate(query), params or ())
+                    columns = None if dictionary else column_map(description_names(cursor.description))
+
+                    while True:
+                        batch = cursor.fetchmany(batch_size)
+                        fetch_ms += (time.perf_counter() - started) * 1000
+                        if not batch:
+                            break
+
+                        rows += len(batch)
+                        yield batch if columns is None else RowSet(batch, columns)
+                        started = time.perf_counter()
+                finally:
+                    try:
+                        # Drains any unread rows when the consumer stopped early
+                        cursor.close()
+                    except DATABASE_ERRORS:
+                        pooled.invalidate()
+
+        except DATABASE_ERRORS as e:
+            failed = True
+            print(f"✗ Error streaming query: {e}")
         finally:
-            if cursor:
-                cursor.close()
-    
+            self.query_stats.record_duration(query, fetch_ms, rows, failed)
+
+    def iter_query(self, query, params=None, chunk_size=500):
+        """Yield the rows of a SELECT one at a time, fetching ``chunk_size`` per round trip."""
+        for batch in self.iter_query_batches(query, params, chunk_size):
+            yield from batch
+
+    @staticmethod
+    def _collect(cursor, is_read, dictionary):
+        """Fetch a cursor's result: rows for reads, the affected row count otherwise."""
+        if not is_read:
+            return cursor.rowcount
+
+        rows = cursor.fetchall()
+        if dictionary:
+            return rows
+        return RowSet(rows, column_map(description_names(cursor.description)))
+
+    def _execute_prepared(self, pooled, normalized, params, is_read, dictionary=True):
+        """Execute a statement through the connection's prepared statement cache."""
+        statements = self._statement_cache(pooled)
+        sql, cursor = statements.get(normalized, dictionary)
+
+        try:
+            cursor.execute(sql, tuple(params) if params is not None else ())
+            return self._collect(cursor, is_read, dictionary)
+        except DATABASE_ERRORS:
+            # The statement may be invalid on the server now; prepare it afresh next time
+            statements.discard(normalized, dictionary)
+            raise
+
+    def statement_cache_stats(self):
+        """Return prepared statement cache hits, misses and size across connections."""
+        caches = []
+        if self.pool is not None:
+            caches = [pooled.statements for pooled in self.pool.idle_connections()]
+        elif self._shared is not None:
+            caches = [self._shared.statements]
+
+        caches = [cache for cache in caches if cache is not None]
+        return {
+            'hits': sum(cache.hits for cache in caches),
+            'misses': sum(cache.misses for cache in caches),
+            'statements': sum(len(cache) for cache in caches),
+        }
+
     def execute_many(self, query, data_list):
         """Execute query with multiple data sets."""
+        started = self.query_stats.timer()
+
         try:
-            cursor = self.connection.cursor()
-            cursor.executemany(query, data_list)
-            return cursor.rowcount
-        except Error as e:
+            with self.get_connection() as connection:
+                cursor = self.backend.cursor(connection, dictionary=False)
+                try:
+                    cursor.executemany(self.backend.translate(query), data_list)
+                    result = cursor.rowcount
+                finally:
+                    cursor.close()
+
+            self._note_write(query)
+            self.query_stats.record(query, started, result)
+            return result
+
+        except DATABASE_ERRORS as e:
+            self.query_stats.record(query, started, failed=True)
             print(f"✗ Error executing batch query: {e}")
             return None
+
+    def bulk_insert(self, table, columns, rows, chunk_size=None, ignore=False, progress=None):
+        """Insert many rows with chunked multi-row INSERTs; see :class:`BulkLoader`.
+
+        Returns a :class:`BulkLoadResult` with the generated ``ids``.
+        """
+        return self.bulk_loader.insert(table, columns, rows, chunk_size, ignore, progress)
+
+    def bulk_load_file(self, table, columns, rows, progress=None):
+        """Insert many rows through LOAD DATA LOCAL INFILE, or chunked INSERTs if unavailable."""
+        return self.bulk_loader.load_infile(table, columns, rows, progress=progress)
+
+    @contextmanager
+    def transaction(self):
+        """Queue writes in a ``with`` block and commit them together on exit.
+
+        Yields a :class:`UnitOfWork`; call ``add(query, params)`` for each
+        statement. If the block raises, nothing is sent. After the block,
+        ``committed`` tells whether the transaction succeeded and
+        ``rowcounts`` holds the affected rows of each statement.
+        """
+        unit = UnitOfWork()
+        yield unit
+        self.flush(unit)
+
+    def flush(self, unit):
+        """Send the statements of a unit of work in one transaction."""
+        if not unit.statements:
+            unit.committed = True
+            unit.rowcounts = []
+            return True
+
+        # Identically shaped units share one statistics entry
+        label = ";\n".join(query for query, _ in unit.statements)
+        started = self.query_stats.timer()
+
+        try:
+            with self._borrow() as pooled:
+                unit.rowcounts = self.backend.run_transaction(pooled.connection, unit.statements)
+
+            unit.committed = True
+            self._note_write(*(query for query, _ in unit.statements))
+            self.query_stats.record(label, started, sum(unit.rowcounts))
+            return True
+
+        except DATABASE_ERRORS as e:
+            unit.committed = False
+            self.query_stats.record(label, started, failed=True)
+            print(f"✗ Error executing transaction: {e}")
+            return False
         finally:
-            if cursor:
-                cursor.close()
+            unit.discard()
+
+    def explain(self, query, params=None):
+        """Return the execution plan of ``query`` on the primary (see ``MySQLBackend.explain``).
+
+        Unlike the execute methods, errors are raised so callers can report them.
+        """
+        with self._borrow() as pooled:
+            return self.backend.explain(pooled.connection, query, params or ())
+
+    def secondary_indexes(self):
+        """Return ``(table, index)`` for every non-unique index in the schema."""
+        with self._borrow() as pooled:
+            return self.backend.secondary_indexes(pooled.connection)
+
+    def analyze(self, tables):
+        """Refresh optimizer statistics, e.g. after bulk loading ``tables``."""
+        with self._borrow_unbounded() as pooled:
+            self.backend.analyze(pooled.connection, tables)
+
+    def save_query_stats(self):
+        """Write the collected query statistics to DB_QUERY_STATS_FILE."""
+        if not self.query_stats.enabled or not self.query_stats_path:
+            return None
+
+        try:
+            return self.query_stats.dump_json(self.query_stats_path)
+        except OSError as e:
+            print(f"✗ Could not save query statistics: {e}")
+            return None
 
 
 # Global database instance
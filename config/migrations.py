@@ -0,0 +1,220 @@
+import hashlib
+import os
+import re
+
+from config.backends import DATABASE_ERRORS, MIGRATIONS_PATH
+
+VERSION_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    checksum CHAR(64) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+APPLIED_QUERY = "SELECT version, name, checksum FROM schema_migrations ORDER BY version"
+RECORD_QUERY = "INSERT INTO schema_migrations (version, name, checksum) VALUES (%s, %s, %s)"
+
+# NNN_description.sql, optionally NNN_description.<backend>.sql for a backend-specific variant
+_MIGRATION_FILE = re.compile(r'^(\d+)_(\w+?)(?:\.(\w+))?\.sql$')
+_CREATE_INDEX = re.compile(
+    r'^CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s+ON\s+(\w+)', re.IGNORECASE
+)
+_ADD_INDEX = re.compile(
+    r'^ALTER\s+TABLE\s+(\w+)\s+ADD\s+(?:UNIQUE\s+)?(?:KEY|INDEX)\s+(\w+)', re.IGNORECASE
+)
+
+_ALTER_TABLE = re.compile(r'^ALTER\s+TABLE\s+(\w+)\s', re.IGNORECASE)
+_ADD_COLUMN = re.compile(r'\bADD\s+COLUMN\s+(\w+)', re.IGNORECASE)
+
+
+class MigrationError(Exception):
+    """A migration cannot be applied, or an applied one was edited afterwards."""
+
+
+class Migration:
+    """One versioned migration file."""
+
+    def __init__(self, version, name, path):
+        self.version = version
+        self.name = name
+        self.path = path
+        with open(path, 'rb') as migration_file:
+            content = migration_file.read()
+        self.script = content.decode('utf-8')
+        self.checksum = hashlib.sha256(content).hexdigest()
+
+    def __repr__(self):
+        return f"Migration({self.version}, {self.name!r})"
+
+
+def load_migrations(backend_name, directory=MIGRATIONS_PATH):
+    """Return the migrations in ``directory`` for ``backend_name``, ordered by version.
+
+    A ``NNN_name.<backend>.sql`` file replaces ``NNN_name.sql`` on that backend,
+    for migrations whose SQL cannot be translated automatically.
+    """
+    generic = {}
+    specific = {}
+    for filename in os.listdir(directory):
+        match = _MIGRATION_FILE.match(filename)
+        if not match:
+            continue
+
+        version, name, variant = int(match.group(1)), match.group(2), match.group(3)
+        if variant is None:
+            target = generic
+        elif variant == backend_name:
+            target = specific
+        else:
+            continue
+
+        if version in target:
+            raise MigrationError(f"Duplicate migration version {version}: {filename}")
+        target[version] = (name, os.path.join(directory, filename))
+
+    generic.update(specific)
+    return [Migration(version, name, path) for version, (name, path) in sorted(generic.items())]
+
+
+def index_statement(statement):
+    """Return ``(table, index)`` if ``statement`` creates an index, else None."""
+    match = _CREATE_INDEX.match(statement)
+    if match:
+        return match.group(2), match.group(1)
+    match = _ADD_INDEX.match(statement)
+    if match:
+        return match.group(1), match.group(2)
+    return None
+
+
+def added_columns(statement):
+    """Return ``(table, [column, ...])`` if ``statement`` only adds columns, else None."""
+    match = _ALTER_TABLE.match(statement)
+    if not match:
+        return None
+    columns = _ADD_COLUMN.findall(statement)
+    if not columns or len(columns) != len(re.findall(r'\bADD\b', statement, re.IGNORECASE)):
+        return None
+    return match.group(1), columns
+
+
+class MigrationRunner:
+    """Apply pending migrations and record them in ``schema_migrations``.
+
+    Every applied version is stored with the checksum of its file; a file
+    that changed after it was applied stops the run. Index creation is
+    skipped when the index already exists and, on MySQL, runs as online DDL
+    so live tables keep accepting writes. MySQL commits DDL implicitly, so
+    a migration that fails halfway is not recorded and is re-run from the
+    start next time: migrations must be safe to repeat (``IF NOT EXISTS``).
+    For the same reason an ``ALTER TABLE ... ADD COLUMN`` is skipped when
+    its columns already exist.
+    """
+
+    def __init__(self, backend, connection, directory=MIGRATIONS_PATH, log=print):
+        self.backend = backend
+        self.connection = connection
+        self.directory = directory
+        self.log = log or (lambda message: None)
+
+    def applied(self):
+        """Return ``{version: (name, checksum)}`` of the recorded migrations."""
+        cursor = self.backend.cursor(self.connection, dictionary=False)
+        try:
+            cursor.execute(APPLIED_QUERY)
+            return {version: (name, checksum) for version, name, checksum in cursor.fetchall()}
+        except DATABASE_ERRORS:
+            # No version table yet: nothing has been applied
+            return {}
+        finally:
+            cursor.close()
+
+    def pending(self):
+        """Return the migrations not applied yet, after verifying the applied ones."""
+        applied = self.applied()
+        migrations = load_migrations(self.backend.name, self.directory)
+
+        for migration in migrations:
+            recorded = applied.get(migration.version)
+            if recorded and recorded[1] != migration.checksum:
+                raise MigrationError(
+                    f"Migration {migration.version} ({migration.name}) was modified after it was applied; "
+                    f"add a new migration instead"
+                )
+        return [migration for migration in migrations if migration.version not in applied]
+
+    def run(self, dry_run=False):
+        """Apply every pending migration in order and return them.
+
+        With ``dry_run`` the statements are only logged.
+        """
+        pending = self.pending()
+        if not pending:
+            self.log("✓ Schema is up to date")
+            return []
+
+        if not dry_run:
+            self._execute(self.backend.translate(VERSION_TABLE_QUERY))
+
+        for migration in pending:
+            self.log(f"{'Would apply' if dry_run else 'Applying'} migration "
+                     f"{migration.version:03d} {migration.name}")
+            self._apply(migration, dry_run)
+        return pending
+
+    def _apply(self, migration, dry_run):
+        transactional = self.backend.transactional_ddl and not dry_run
+        if transactional:
+            self._execute('BEGIN IMMEDIATE')
+
+        try:
+            for statement in self.backend.migration_statements(migration.script):
+                index = index_statement(statement)
+                if index and self.backend.index_exists(self.connection, *index):
+                    self.log(f"  skip: index {index[1]} on {index[0]} already exists")
+                    continue
+                if index:
+                    statement = self.backend.online_index_ddl(statement)
+                columns = added_columns(statement)
+                if columns and self._columns_exist(*columns):
+                    self.log(f"  skip: columns {', '.join(columns[1])} on {columns[0]} already exist")
+                    continue
+
+                if dry_run:
+                    self.log(f"  {' '.join(statement.split())}")
+                else:
+                    self._execute(statement)
+
+            if not dry_run:
+                self._execute(self.backend.translate(RECORD_QUERY),
+                              (migration.version, migration.name, migration.checksum))
+            if transactional:
+                self._execute('COMMIT')
+
+        except DATABASE_ERRORS + (MigrationError,) as e:
+            if transactional:
+                self._execute('ROLLBACK')
+            if isinstance(e, MigrationError):
+                raise
+            raise MigrationError(f"Migration {migration.version} ({migration.name}) failed: {e}") from e
+
+    def _columns_exist(self, table, columns):
+        existing = [column for column in columns if self.backend.column_exists(self.connection, table, column)]
+        if existing and len(existing) < len(columns):
+            raise MigrationError(
+                f"Only some of the columns {', '.join(columns)} exist on {table}; add the others by hand"
+            )
+        return bool(existing)
+
+    def _execute(self, statement, params=()):
+        cursor = self.backend.cursor(self.connection, dictionary=False)
+        try:
+            if params:
+                cursor.execute(statement, params)
+            else:
+                cursor.execute(statement)
+            if cursor.description:
+                cursor.fetchall()
+        finally:
+            cursor.close()
@@ -0,0 +1,144 @@
+from config.rows import RowSet
+
+
+class Page:
+    """One page of a keyset-paginated listing.
+
+    ``next_after`` and ``previous_before`` are the cursors to pass back as
+    ``after=`` / ``before=`` for the neighbouring pages; ``has_next`` and
+    ``has_previous`` tell whether those pages exist.
+    """
+
+    def __init__(self, items=(), next_after=None, previous_before=None, has_next=False, has_previous=False):
+        self.items = items
+        self.next_after = next_after
+        self.previous_before = previous_before
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def map(self, convert):
+        """Return the same page with ``convert(items)`` as its items (e.g. model hydration)."""
+        return Page(convert(self.items), self.next_after, self.previous_before,
+                    self.has_next, self.has_previous)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __bool__(self):
+        return bool(self.items)
+
+
+class KeysetQuery:
+    """A SELECT read one page at a time by seeking past the last row seen.
+
+    ``key`` lists the SQL expressions the listing is ordered by, ending with
+    a unique column so the order is total (e.g. ``('q.created_at',
+    'q.question_id')``); the cursor is the tuple of their values, read from
+    the result columns of the same name. Instead of OFFSET, the next page is
+    found with a range condition on the key, so with an index on it every
+    page costs the same however deep it is.
+
+    ``select`` is the query up to and excluding WHERE; ``where`` is an
+    optional condition without the keyword. Key columns
+    must not be NULL: rows whose key compares as NULL are never returned
+    after the first page. Key a nullable column on ``COALESCE(column, '')``
+    and name the result column holding it in ``columns``.
+    """
+
+    def __init__(self, select, key, where=None, descending=True, columns=None):
+        self.select = select.strip()
+        self.key = tuple(key)
+        self.columns = tuple(columns) if columns is not None else tuple(
+            expression.rsplit('.', 1)[-1] for expression in self.key
+        )
+        if len(self.columns) != len(self.key):
+            raise ValueError("columns must name one result column per key expression")
+        self.where = where
+        self.descending = descending
+        self._queries = {}
+
+    def query(self, after=None, before=None, page_size=20):
+        """Return ``(sql, params)`` for a page, to append after the listing's own parameters.
+
+        One more row than ``page_size`` is requested to find out whether
+        another page follows.
+        """
+        if after is not None and before is not None:
+            raise ValueError("Pass either after or before, not both")
+
+        cursor = after if after is not None else before
+        if cursor is not None and len(cursor) != len(self.key):
+            raise ValueError(f"Cursor must have {len(self.key)} values: {', '.join(self.columns)}")
+
+        seek = 'after' if after is not None else 'before' if before is not None else None
+        sql = self._queries.get(seek)
+        if sql is None:
+            sql = self._queries[seek] = self._build(seek)
+
+        params = self._seek_params(cursor) if cursor is not None else ()
+        return sql, params + (page_size + 1,)
+
+    def page(self, rows, after=None, before=None, page_size=20):
+        """Build the :class:`Page` from the rows returned by :meth:`query`."""
+        has_more = len(rows) > page_size
+        kept = list(rows[:page_size])
+        if before is not None:
+            # Read backwards from the cursor; put the rows back in listing order
+            kept.reverse()
+        if isinstance(rows, RowSet):
+            kept = RowSet(kept, rows.columns)
+
+        if not kept:
+            return Page(kept, has_previous=after is not None, has_next=before is not None)
+
+        cursor_of = self._cursor_reader(kept)
+        return Page(
+            kept,
+            next_after=cursor_of(kept[-1]),
+            previous_before=cursor_of(kept[0]),
+            has_next=has_more if before is None else True,
+            has_previous=has_more if before is not None else after is not None
+        )
+
+    def _build(self, seek):
+        # Walking backwards flips both the comparison and the sort direction
+        backwards = seek == 'before'
+        descending = self.descending != backwards
+        conditions = [self.where] if self.where else []
+        if seek is not None:
+            conditions.append(self._seek_condition('<' if descending else '>'))
+
+        sql = self.select
+        if conditions:
+            sql += "\nWHERE " + " AND ".join(f"({condition})" for condition in conditions)
+        direction = ' DESC' if descending else ''
+        sql += "\nORDER BY " + ", ".join(f"{expression}{direction}" for expression in self.key)
+        return sql + "\nLIMIT %s"
+
+    def _seek_condition(self, operator):
+        """Lexicographic ``key <op> cursor``, written so the first key column bounds an index range.
+
+        ``(a, b) < (x, y)`` becomes ``a <= x AND (a < x OR (b < y))``; row
+        constructors would be shorter but not every optimizer ranges them.
+        """
+        condition = f"{self.key[-1]} {operator} %s"
+        for expression in reversed(self.key[:-1]):
+            condition = f"{expression} {operator}= %s AND ({expression} {operator} %s OR ({condition}))"
+        return condition
+
+    def _seek_params(self, cursor):
+        params = []
+        for value in cursor[:-1]:
+            params += [value, value]
+        return tuple(params) + (cursor[-1],)
+
+    def _cursor_reader(self, rows):
+        if isinstance(rows, RowSet):
+            return rows.getter(*self.columns)
+        return lambda row: tuple(row[column] for column in self.columns)
@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+
+# Upper bounds (in milliseconds) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%s|\?')
+_VALUE_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(query):
+    """Return ``(fingerprint_id, normalized_text)`` for a SQL statement.
+
+    Literals and placeholders are replaced with ``?`` and value lists are
+    collapsed, so the same statement with different values groups together.
+    """
+    text = _WHITESPACE.sub(' ', query).strip()
+    text = _STRING_LITERAL.sub('?', text)
+    text = _NUMBER_LITERAL.sub('?', text)
+    text = _PLACEHOLDER.sub('?', text)
+    text = _VALUE_LIST.sub('(?+)', text)
+    digest = hashlib.md5(text.encode('utf-8')).hexdigest()[:12]
+    return digest, text
+
+
+class QueryMetrics:
+    """Counters and latency histogram for a single query fingerprint."""
+
+    def __init__(self, fingerprint_id, text):
+        self.fingerprint_id = fingerprint_id
+        self.text = text
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, duration_ms, rows, failed):
+        self.calls += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        if failed:
+            self.errors += 1
+        else:
+            self.rows += rows or 0
+
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                self.buckets[index] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def percentile(self, fraction):
+        """Estimate a latency percentile (ms) from the histogram buckets."""
+        if not self.calls:
+            return 0.0
+
+        rank = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return min(float(LATENCY_BUCKETS_MS[index]), self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def to_dict(self):
+        return {
+            'fingerprint': self.fingerprint_id,
+            'query': self.text,
+            'calls': self.calls,
+            'errors': self.errors,
+            'rows': self.rows,
+            'total_ms': round(self.total_ms, 3),
+            'avg_ms': round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': round(self.max_ms, 3),
+            'histogram': dict(zip(
+                [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"],
+                self.buckets
+            )),
+        }
+
+
+class QueryStats:
+    """Thread-safe per-query statistics with a slow-query log."""
+
+    def __init__(self, slow_query_ms=500, slow_log_path=None, enabled=True):
+        self.slow_query_ms = slow_query_ms
+        self.slow_log_path = slow_log_path
+        self.enabled = enabled
+        self.started_at = datetime.now()
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def timer(self):
+        """Return a start timestamp for a later ``record`` call."""
+        return time.perf_counter()
+
+    def record(self, query, started, rows=0, failed=False):
+        """Record one execution of ``query`` that began at ``started``."""
+        if self.enabled:
+            self.record_duration(query, (time.perf_counter() - started) * 1000, rows, failed)
+
+    def record_duration(self, query, duration_ms, rows=0, failed=False):
+        """Record one execution of ``query`` that took ``duration_ms``."""
+        if not self.enabled:
+            return
+
+        fingerprint_id, text = fingerprint(query)
+
+        with self._lock:
+            metrics = self._metrics.get(fingerprint_id)
+            if metrics is None:
+                metrics = self._metrics[fingerprint_id] = QueryMetrics(fingerprint_id, text)
+            metrics.add(duration_ms, rows, failed)
+
+        if self.slow_log_path and duration_ms >= self.slow_query_ms:
+            self._log_slow_query(fingerprint_id, text, duration_ms, rows, failed)
+
+    def snapshot(self):
+        """Return per-query statistics, slowest total time first."""
+        with self._lock:
+            entries = [metrics.to_dict() for metrics in self._metrics.values()]
+        return sorted(entries, key=lambda entry: entry['total_ms'], reverse=True)
+
+    def to_json(self):
+        """Serialize the current statistics as a JSON document."""
+        return json.dumps({
+            'collected_since': self.started_at.isoformat(timespec='seconds'),
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'slow_query_ms': self.slow_query_ms,
+            'queries': self.snapshot(),
+        }, indent=2)
+
+    def dump_json(self, path):
+        """Write the statistics to ``path`` as JSON and return the path."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as stats_file:
+            stats_file.write(self.to_json())
+        return path
+
+    @staticmethod
+    def load_json(path):
+        """Load statistics previously written by ``dump_json``, or None."""
+        try:
+            with open(path, encoding='utf-8') as stats_file:
+                return json.load(stats_file)
+        except (OSError, ValueError):
+            return None
+
+    def reset(self):
+        """Discard all collected statistics."""
+        with self._lock:
+            self._metrics.clear()
+            self.started_at = datetime.now()
+
+    def _log_slow_query(self, fingerprint_id, text, duration_ms, rows, failed):
+        # Only the fingerprint is logged: parameters may hold user-submitted text
+        line = (
+            f"{datetime.now().isoformat(timespec='seconds')} "
+            f"duration_ms={duration_ms:.1f} rows={rows or 0} "
+            f"{'status=error ' if failed else ''}"
+            f"fingerprint={fingerprint_id} query={text}\n"
+        )
+        try:
+            directory = os.path.dirname(self.slow_log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._lock, open(self.slow_log_path, 'a', encoding='utf-8') as log_file:
+                log_file.write(line)
+        except OSError as e:
+            print(f"✗ Could not write slow query log: {e}")
+
+
+def format_stats_table(entries, limit=20):
+    """Format query statistics as a fixed-width text table."""
+    lines = [
+        f"{'Fingerprint':<13} {'Calls':>7} {'Rows':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'Total ms':>10}  Query",
+        "-" * 110,
+    ]
+    for entry in entries[:limit]:
+        query = entry['query'] if len(entry['query']) <= 45 else entry['query'][:42] + "..."
+        lines.append(
+            f"{entry['fingerprint']:<13} {entry['calls']:>7} {entry['rows']:>8} "
+            f"{entry['p50_ms']:>8.1f} {entry['p95_ms']:>8.1f} {entry['p99_ms']:>8.1f} "
+            f"{entry['total_ms']:>10.1f}  {query}"
+        )
+    return "\n".join(lines)
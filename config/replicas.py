@@ -0,0 +1,153 @@
+import itertools
+import threading
+import time
+
+from config.connection_pool import ConnectionPool
+
+
+def parse_replica_hosts(value, default_port):
+    """Parse ``host[:port],host[:port]`` into a list of ``(host, port)`` pairs."""
+    endpoints = []
+    for entry in (value or '').split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        host, _, port = entry.partition(':')
+        endpoints.append((host, int(port) if port else int(default_port)))
+    return endpoints
+
+
+class Replica:
+    """A read replica endpoint with its own connection pool and lag state.
+
+    Lag probes use a separate connection from ``probe_factory`` (by default
+    one more from the pool's factory), so a slow probe never holds a read
+    connection. A replica is not healthy until its first probe says so.
+    """
+
+    def __init__(self, host, port, pool, probe_factory=None):
+        self.host = host
+        self.port = port
+        self.pool = pool
+        self.probe_factory = probe_factory or pool.connection_factory
+        self.probe_connection = None
+        self.probing = False
+        self.healthy = False
+        self.lag_seconds = None
+        self.checked_at = None
+        self.reads = 0
+        self.failures = 0
+
+    @property
+    def name(self):
+        return f"{self.host}:{self.port}"
+
+    def to_dict(self):
+        return {
+            'replica': self.name,
+            'healthy': self.healthy,
+            'lag_seconds': self.lag_seconds,
+            'reads': self.reads,
+            'failures': self.failures,
+        }
+
+
+class ReplicaSet:
+    """Round-robin routing of reads over replicas that are up and not lagging.
+
+    Replication lag is measured lazily: a replica is probed at most once per
+    ``check_interval`` seconds, when it is next picked. Probes run on a
+    background thread, so a read never waits for one (or for the connect to
+    an unreachable replica); it is routed on the state of the last probe.
+    Replicas that lag more than ``max_lag`` seconds, stop replicating or drop
+    their connection are skipped until a later probe finds them healthy again.
+    """
+
+    def __init__(self, replicas, lag_probe, max_lag=2.0, check_interval=5.0):
+        self.replicas = replicas
+        self.lag_probe = lag_probe
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._cycle = itertools.cycle(replicas)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_endpoints(cls, endpoints, connection_factory, lag_probe, max_lag=2.0,
+                       check_interval=5.0, probe_factory=None, **pool_options):
+        """Build a replica set with one connection pool per ``(host, port)`` endpoint.
+
+        ``probe_factory(host, port)`` opens the connections used for lag
+        probes, e.g. with a short socket timeout; defaults to ``connection_factory``.
+        """
+        probe_factory = probe_factory or connection_factory
+        replicas = [
+            Replica(host, port, ConnectionPool(
+                lambda host=host, port=port: connection_factory(host, port), **pool_options
+            ), lambda host=host, port=port: probe_factory(host, port))
+            for host, port in endpoints
+        ]
+        return cls(replicas, lag_probe, max_lag=max_lag, check_interval=check_interval)
+
+    def choose(self):
+        """Return the next usable replica, or None to read from the primary."""
+        for _ in range(len(self.replicas)):
+            with self._lock:
+                replica = next(self._cycle)
+                probe = not replica.probing and self._due_for_check(replica)
+                if probe:
+                    replica.probing = True
+
+            if probe:
+                threading.Thread(target=self._probe, args=(replica,),
+                                 name=f"replica-probe-{replica.name}", daemon=True).start()
+            if replica.healthy:
+                replica.reads += 1
+                return replica
+        return None
+
+    def mark_down(self, replica):
+        """Stop routing to a replica until its next lag check."""
+        replica.healthy = False
+        replica.failures += 1
+        replica.checked_at = time.monotonic()
+
+    def close_all(self):
+        for replica in self.replicas:
+            replica.pool.close_all()
+            self._close_probe_connection(replica)
+
+    def stats(self):
+        return [replica.to_dict() for replica in self.replicas]
+
+    def _due_for_check(self, replica):
+        return replica.checked_at is None or time.monotonic() - replica.checked_at >= self.check_interval
+
+    def _probe(self, replica):
+        try:
+            self._check(replica)
+        finally:
+            replica.probing = False
+
+    def _check(self, replica):
+        replica.checked_at = time.monotonic()
+        try:
+            if replica.probe_connection is None:
+                replica.probe_connection = replica.probe_factory()
+            lag = self.lag_probe(replica.probe_connection)
+        except Exception:
+            # Unreachable, timed out or broken: reconnect on the next probe
+            self._close_probe_connection(replica)
+            self.mark_down(replica)
+            return
+
+        replica.lag_seconds = lag
+        # No lag figure means replication is stopped or broken
+        replica.healthy = lag is not None and lag <= self.max_lag
+
+    def _close_probe_connection(self, replica):
+        connection, replica.probe_connection = replica.probe_connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
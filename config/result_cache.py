@@ -0,0 +1,158 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from config.rows import RowSet
+
+_READ_TABLE = re.compile(r'\b(?:FROM|JOIN)\s+`?(\w+)`?', re.IGNORECASE)
+_WRITE_TABLE = re.compile(
+    r'^\s*(?:INSERT(?:\s+IGNORE)?\s+INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM|TRUNCATE(?:\s+TABLE)?'
+    r'|ALTER\s+TABLE|DROP\s+TABLE(?:\s+IF\s+EXISTS)?)\s+`?(\w+)`?',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=1024)
+def tables_read(query):
+    """Return the set of tables a SELECT reads from."""
+    return frozenset(name.lower() for name in _READ_TABLE.findall(query))
+
+
+@lru_cache(maxsize=1024)
+def tables_written(query):
+    """Return the set of tables a write statement modifies."""
+    match = _WRITE_TABLE.match(query)
+    return frozenset((match.group(1).lower(),)) if match else frozenset()
+
+
+class ResultCache:
+    """LRU cache of SELECT results with a TTL, tagged by the tables they read.
+
+    Entries are keyed by normalized SQL plus parameters. Writing to a table
+    invalidates every entry tagged with it. Only queries whose tables are all
+    in ``tables`` are cached. Expired entries stay until they are replaced or
+    evicted, so :meth:`get_stale` can still serve them while the database is
+    unreachable.
+    """
+
+    def __init__(self, max_entries=256, ttl=60, tables=()):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.tables = frozenset(table.lower() for table in tables)
+        self._entries = OrderedDict()
+        self._tagged = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        # Counters for tuning
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.stale_hits = 0
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0 and self.ttl > 0 and bool(self.tables)
+
+    def cacheable(self, query):
+        """Whether results of ``query`` may be cached (it only reads cacheable tables)."""
+        tables = tables_read(query)
+        return bool(tables) and tables <= self.tables
+
+    def get(self, key):
+        """Return a private copy of the cached result for ``key``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._copy(entry[2])
+
+    def get_stale(self, key):
+        """Return a copy of the last result stored for ``key``, even if expired, or None.
+
+        Invalidated entries are gone, so this never returns a result a
+        known write has made wrong.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self.stale_hits += 1
+            return self._copy(entry[2])
+
+    def generation(self):
+        """Token to pass to ``put`` so results read before a write are not stored."""
+        return self._generation
+
+    def put(self, key, query, result, generation):
+        """Store a result unless a write happened since ``generation`` was taken."""
+        tags = tables_read(query)
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, tags, self._copy(result))
+            for table in tags:
+                self._tagged.setdefault(table, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, tables):
+        """Drop every entry that read any of ``tables``."""
+        if not tables:
+            return
+
+        with self._lock:
+            self._generation += 1
+            for table in tables:
+                for key in self._tagged.pop(table, ()):
+                    if key in self._entries:
+                        self._remove(key)
+                        self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tagged.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'invalidations': self.invalidations,
+                'evictions': self.evictions,
+                'stale_hits': self.stale_hits,
+            }
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for table in entry[1]:
+            keys = self._tagged.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tagged[table]
+
+    @staticmethod
+    def _copy(result):
+        # Callers decorate the dict rows they get back, so never hand out shared ones
+        if isinstance(result, RowSet):
+            return RowSet(result, result.columns)
+        return [dict(row) for row in result]
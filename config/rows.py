@@ -0,0 +1,148 @@
+from collections import namedtuple
+from functools import lru_cache
+from operator import itemgetter
+
+
+class ColumnMap:
+    """Column name to position map for one result shape.
+
+    Instances are shared by every execution of a statement with the same
+    columns, so lookups such as ``getter`` are resolved only once.
+    """
+
+    def __init__(self, names):
+        self.names = names
+        self.index = {name: position for position, name in enumerate(names)}
+        self._getters = {}
+        self._row_type = None
+
+    def getter(self, *names):
+        """Return a cached ``itemgetter`` for the given columns.
+
+        With a single name the getter returns a value, otherwise a tuple of
+        values in the order requested.
+        """
+        getter = self._getters.get(names)
+        if getter is None:
+            getter = self._getters[names] = itemgetter(*(self.index[name] for name in names))
+        return getter
+
+    @property
+    def row_type(self):
+        """Namedtuple class with this shape's columns, built on first use."""
+        if self._row_type is None:
+            self._row_type = namedtuple('Row', self.names, rename=True)
+        return self._row_type
+
+
+@lru_cache(maxsize=256)
+def column_map(names):
+    """Return the shared ``ColumnMap`` for a tuple of column names."""
+    return ColumnMap(names)
+
+
+class RowSet(list):
+    """A list of positional rows together with their ``ColumnMap``."""
+
+    def __init__(self, rows, columns):
+        super().__init__(rows)
+        self.columns = columns
+
+    def getter(self, *names):
+        return self.columns.getter(*names)
+
+    def named(self):
+        """Return the rows as namedtuples (attribute access, still no dicts)."""
+        make = self.columns.row_type._make
+        return [make(row) for row in self]
+
+
+def description_names(description):
+    """Column names from a DB-API ``cursor.description``."""
+    return tuple(column[0] for column in description or ())
+
+
+class RowMapper:
+    """Declarative mapping from result columns to the ``__slots__`` of a model.
+
+    Declared once in the model class::
+
+        class Resource:
+            __slots__ = ('resource_id', 'resource_type', 'created_at')
+            mapper = RowMapper('resource_id', 'created_at', resource_type='type')
+
+    Positional names map an attribute to the column of the same name,
+    keywords map ``attribute=column``; ``defaults`` gives the value of slots
+    no column fills. Every slot must be covered, which is checked when the
+    class is created. Attributes named in ``deferred`` may be missing from a
+    result; their slots are then left unset, for the model to load on first
+    access (see ``EducationalModule.__getattr__``).
+
+    For each result shape the mapper generates, once, a function that
+    creates the instances without calling ``__init__`` and assigns every
+    slot straight from its tuple position, so hydrating a result is one
+    tight loop with no per-row lookups.
+    """
+
+    def __init__(self, *attributes, defaults=None, deferred=(), **renamed):
+        self.fields = tuple((attribute, attribute) for attribute in attributes) + tuple(renamed.items())
+        self.defaults = dict(defaults or {})
+        self.deferred = frozenset(deferred)
+        self.model = None
+        self._by_shape = {}
+
+    def __set_name__(self, owner, name):
+        self.model = owner
+        slots = set(owner.__slots__)
+        covered = {attribute for attribute, _ in self.fields} | set(self.defaults)
+        if covered != slots:
+            raise TypeError(
+                f"{owner.__name__}.{name} must cover exactly the slots of {owner.__name__}: "
+                f"unmapped {sorted(slots - covered)}, unknown {sorted(covered - slots)}"
+            )
+
+    def hydrate(self, rows):
+        """Build a model instance per row of a :class:`RowSet` or a list of dict rows."""
+        if not rows:
+            return []
+        # Dict results are told apart by their keys, tuple results by their ColumnMap
+        shape = rows.columns if isinstance(rows, RowSet) else tuple(rows[0])
+        build = self._by_shape.get(shape)
+        if build is None:
+            index = shape.index if isinstance(shape, ColumnMap) else {column: column for column in shape}
+            build = self._by_shape[shape] = self._generate({
+                attribute: index[column] for attribute, column in self.fields
+                if column in index or attribute not in self.deferred
+            })
+        return build(rows)
+
+    def from_row(self, row):
+        """Build one model instance from a dict row (or None for no row)."""
+        return self.hydrate([row])[0] if row else None
+
+    def first(self, rows):
+        """Build the instance of the first row only, or None when there are no rows."""
+        if not rows:
+            return None
+        if isinstance(rows, RowSet):
+            return self.hydrate(RowSet(rows[:1], rows.columns))[0]
+        return self.from_row(rows[0])
+
+    def _generate(self, keys):
+        """Compile ``build(rows)`` reading each attribute's ``row[key]``."""
+        namespace = {'cls': self.model, 'new': object.__new__}
+        lines = [
+            "def build(rows):",
+            "    objects = []",
+            "    append = objects.append",
+            "    for row in rows:",
+            "        obj = new(cls)",
+        ]
+        lines += [f"        obj.{attribute} = row[{key!r}]" for attribute, key in keys.items()]
+        for position, (attribute, value) in enumerate(self.defaults.items()):
+            namespace[f'default_{position}'] = value
+            lines.append(f"        obj.{attribute} = default_{position}")
+        lines += ["        append(obj)", "    return objects"]
+
+        exec("\n".join(lines), namespace)
+        return namespace['build']
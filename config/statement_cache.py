@@ -0,0 +1,84 @@
+import re
+from collections import OrderedDict
+from functools import lru_cache
+
+_WHITESPACE = re.compile(r'\s+')
+
+# Statements that return a result set
+READ_KEYWORDS = ('SELECT', 'SHOW', 'DESCRIBE', 'DESC', 'EXPLAIN', 'WITH')
+# Statements that MySQL can run through the binary (prepared) protocol
+PREPARABLE_KEYWORDS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+
+@lru_cache(maxsize=1024)
+def classify_statement(query):
+    """Return ``(normalized_sql, is_read, is_preparable)`` for a SQL string.
+
+    The result is memoized on the exact query text, so the hand-written SQL
+    constants used by the models are only normalized and classified once.
+    """
+    normalized = _WHITESPACE.sub(' ', query).strip()
+    keyword = normalized.split(' ', 1)[0].upper() if normalized else ''
+    return normalized, keyword in READ_KEYWORDS, keyword in PREPARABLE_KEYWORDS
+
+
+class StatementCache:
+    """LRU cache of server-side prepared statements for a single connection.
+
+    Each entry keeps a prepared cursor open, so executing the same SQL again
+    only sends the parameters instead of re-sending and re-parsing the text.
+    """
+
+    def __init__(self, connection, max_size=64):
+        self.connection = connection
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, normalized_sql, dictionary=True):
+        """Return ``(sql, cursor)`` for a normalized statement, preparing it on a miss.
+
+        The returned ``sql`` object must be the one passed to ``cursor.execute``:
+        the connector only reuses a prepared statement for the identical string.
+        Dict and tuple cursors are cached separately.
+        """
+        key = (normalized_sql, dictionary)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        cursor = self.connection.cursor(prepared=True, dictionary=dictionary)
+        entry = (normalized_sql, cursor)
+        self._entries[key] = entry
+
+        if len(self._entries) > self.max_size:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._close_cursor(evicted)
+
+        return entry
+
+    def discard(self, normalized_sql, dictionary=True):
+        """Drop a statement, e.g. after it failed on the server."""
+        entry = self._entries.pop((normalized_sql, dictionary), None)
+        if entry is not None:
+            self._close_cursor(entry[1])
+
+    def clear(self):
+        """Close every cached statement."""
+        for _, cursor in self._entries.values():
+            self._close_cursor(cursor)
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _close_cursor(cursor):
+        try:
+            cursor.close()
+        except Exception:
+            pass
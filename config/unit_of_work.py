@@ -0,0 +1,23 @@
+class UnitOfWork:
+    """Statements queued by ``DatabaseManager.transaction()``.
+
+    Nothing is sent while the ``with`` block runs; on exit the queued
+    statements are flushed together in a single transaction.
+    """
+
+    def __init__(self):
+        self.statements = []
+        self.rowcounts = None
+        self.committed = False
+
+    def add(self, query, params=None):
+        """Queue a write statement and return its position in the unit."""
+        self.statements.append((query, tuple(params) if params is not None else ()))
+        return len(self.statements) - 1
+
+    def discard(self):
+        """Drop every queued statement."""
+        self.statements.clear()
+
+    def __len__(self):
+        return len(self.statements)
@@ -103,7 +103,7 @@ CREATE TABLE IF NOT EXISTS system_stats (
     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
-CREATE TABLE counseling_sessions (
+CREATE TABLE IF NOT EXISTS counseling_sessions (
     session_id INT AUTO_INCREMENT PRIMARY KEY,
     username VARCHAR(20) NOT NULL,
     client_name VARCHAR(255) NOT NULL,
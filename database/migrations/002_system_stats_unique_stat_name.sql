@@ -0,0 +1,29 @@
+-- Make system_stats.stat_name unique so counter upserts update one row per statistic.
+-- Databases created before this change may hold several rows per stat_name
+-- (each "upsert" inserted a new row); fold them into one row before adding the key.
+--
+-- The duplicates are merged in place: the oldest row of each statistic takes
+-- the total and the others are deleted, in one transaction, so an interrupted
+-- run loses nothing and a repeated run finds no duplicates left.
+
+START TRANSACTION;
+
+UPDATE system_stats s
+JOIN (
+    SELECT MIN(stat_id) AS stat_id, SUM(stat_value) AS stat_value, MAX(last_updated) AS last_updated
+    FROM system_stats
+    GROUP BY stat_name
+    HAVING COUNT(*) > 1
+) totals ON s.stat_id = totals.stat_id
+SET s.stat_value = totals.stat_value, s.last_updated = totals.last_updated;
+
+DELETE s FROM system_stats s
+JOIN (
+    SELECT stat_name, MIN(stat_id) AS stat_id
+    FROM system_stats
+    GROUP BY stat_name
+) keep ON s.stat_name = keep.stat_name AND s.stat_id <> keep.stat_id;
+
+COMMIT;
+
+ALTER TABLE system_stats ADD UNIQUE KEY unique_stat_name (stat_name);
@@ -0,0 +1,16 @@
+-- SQLite version of 002_system_stats_unique_stat_name.sql: SQLite cannot add a
+-- key with ALTER TABLE, so the unique constraint is a unique index instead.
+
+CREATE TEMPORARY TABLE system_stats_totals AS
+SELECT stat_name, SUM(stat_value) AS stat_value, MAX(last_updated) AS last_updated
+FROM system_stats
+GROUP BY stat_name;
+
+DELETE FROM system_stats;
+
+INSERT INTO system_stats (stat_name, stat_value, last_updated)
+SELECT stat_name, stat_value, last_updated FROM system_stats_totals;
+
+DROP TABLE system_stats_totals;
+
+CREATE UNIQUE INDEX unique_stat_name ON system_stats (stat_name);
@@ -0,0 +1,24 @@
+-- Composite indexes for the hot Q&A and counseling queries.
+-- tools/migrate.py builds them online on MySQL (ALGORITHM=INPLACE, LOCK=NONE).
+-- benchmarks/composite_indexes.py measures what each one saves and costs.
+-- user_progress needs none: its unique (username, module_id) key already narrows
+-- a user's rows to one per module. quiz_attempts gets none until the application
+-- reads a user's attempts: each index costs inserts on the table it covers.
+
+-- Q&A browse and category counts: WHERE is_answered = ? AND category = ? ORDER BY created_at;
+-- also covers the answered/pending counts of the statistics query
+CREATE INDEX idx_questions_answered_category_created
+    ON anonymous_questions (is_answered, category, created_at);
+
+-- "My questions": WHERE username = ? ORDER BY created_at DESC
+CREATE INDEX idx_questions_user_created
+    ON anonymous_questions (username, created_at);
+
+-- Answers of a question: WHERE question_id = ? ORDER BY is_verified DESC, helpful_votes DESC, created_at.
+-- Matches that sort exactly and covers the answer count/latest answer of the browse join
+CREATE INDEX idx_answers_question_ranking
+    ON anonymous_answers (question_id, is_verified DESC, helpful_votes DESC, created_at);
+
+-- A user's sessions: WHERE username = ? ORDER BY preferred_date DESC, created_at DESC
+CREATE INDEX idx_sessions_user_date
+    ON counseling_sessions (username, preferred_date, created_at);
@@ -0,0 +1,14 @@
+-- Indexes that let the paged listings seek straight to a page (see config/pagination.py).
+-- A user's questions and sessions and the per-category browse already have theirs (003).
+
+-- Browse of all answered questions: WHERE is_answered = TRUE ORDER BY created_at DESC, question_id DESC
+CREATE INDEX idx_questions_answered_created
+    ON anonymous_questions (is_answered, created_at);
+
+-- Counselor view of all sessions: ORDER BY preferred_date DESC, created_at DESC, session_id DESC
+CREATE INDEX idx_sessions_date
+    ON counseling_sessions (preferred_date, created_at);
+
+-- Services directory: ORDER BY city, type, name, resource_id
+CREATE INDEX idx_support_resources_directory
+    ON support_resources (city, type, name);
@@ -0,0 +1,19 @@
+-- Geocoordinates for support resources, used by the nearest-service lookup
+-- (ResourceDirectory.nearest). Resources without coordinates (national hotlines)
+-- keep NULL and are only found by type, city and 24/7.
+-- Both columns are added in one ALTER so a failed run leaves neither behind.
+
+ALTER TABLE support_resources
+    ADD COLUMN latitude DECIMAL(9, 6) NULL,
+    ADD COLUMN longitude DECIMAL(9, 6) NULL;
+
+-- Approximate locations of the default resources (street or town centre level)
+UPDATE support_resources SET latitude = -1.944100, longitude = 30.061900 WHERE name = 'Kigali University Teaching Hospital (CHUK)';
+UPDATE support_resources SET latitude = -1.944700, longitude = 30.093600 WHERE name = 'King Faisal Hospital';
+UPDATE support_resources SET latitude = -1.948000, longitude = 30.060000 WHERE name = 'Polyclinic du Plateau';
+UPDATE support_resources SET latitude = -1.953600, longitude = 30.091800 WHERE name = 'Health Development Initiative (HDI)';
+UPDATE support_resources SET latitude = -1.950000, longitude = 30.059000 WHERE name = 'Rwandan Association for Family Welfare (ARBEF)';
+UPDATE support_resources SET latitude = -1.947000, longitude = 30.090000 WHERE name = 'Youth Action Rwanda';
+UPDATE support_resources SET latitude = -1.953000, longitude = 30.061000 WHERE name = 'Kigali Counseling Center';
+UPDATE support_resources SET latitude = -2.596700, longitude = 29.739400 WHERE name = 'Huye Counseling Services';
+UPDATE support_resources SET latitude = -1.499800, longitude = 29.634500 WHERE name = 'Musanze Youth Center';
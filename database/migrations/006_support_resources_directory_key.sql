@@ -0,0 +1,9 @@
+-- Index for the paged services directory (SupportResource.ALL_RESOURCES_PAGE).
+-- City is nullable, so the listing is keyed on COALESCE(city, '') rather than city:
+-- a NULL cursor value would match no later row. Type is an ENUM, which MySQL sorts
+-- by declaration order but compares with a string alphabetically, so the key uses
+-- its text, CAST(type AS CHAR(20)), for both. These are functional key parts on
+-- MySQL (8.0.13+) and an expression index on SQLite; the plain (city, type, name)
+-- index from 004 still serves ORDER BY city, type, name.
+CREATE INDEX idx_support_resources_directory_key
+    ON support_resources ((COALESCE(city, '')), (CAST(type AS CHAR(20))), name);
@@ -4,16 +4,15 @@ import sys
 sys.path.append('.')
 
 from config.database import db_manager
+from config.query_stats import QueryStats, format_stats_table
 from datetime import datetime
 
 class AdminTool:
     def __init__(self):
         self.db_manager = db_manager
-        if not self.db_manager.connection or not self.db_manager.connection.is_connected():
-            self.db_manager.connect()
     
     def show_pending_questions(self):
-        """Show all pending questions that need answers"""
+        """Show all pending questions that need answers, returning their IDs"""
         query = """
             SELECT question_id, username, question_text, category, created_at
             FROM anonymous_questions 
@@ -21,41 +20,42 @@ class AdminTool:
             ORDER BY created_at ASC
         """
         
-        questions = self.db_manager.execute_query(query)
-        
-        if not questions:
-            print("No pending questions.")
-            return
-        
-        print(f"\n{'='*80}")
-        print("PENDING QUESTIONS NEEDING EXPERT ANSWERS")
-        print(f"{'='*80}")
-        
-        for i, q in enumerate(questions, 1):
+        # Stream the backlog instead of loading every pending question at once
+        pending_ids = []
+        for i, q in enumerate(self.db_manager.iter_query(query), 1):
+            if i == 1:
+                print(f"\n{'='*80}")
+                print("PENDING QUESTIONS NEEDING EXPERT ANSWERS")
+                print(f"{'='*80}")
+            
             print(f"\n{i}. Question ID: {q['question_id']}")
             print(f"   Category: {q['category'].title()}")
             print(f"   Asked: {q['created_at']}")
             print(f"   Question: {q['question_text']}")
             print("-" * 80)
+            pending_ids.append(q['question_id'])
         
-        return questions
+        if not pending_ids:
+            print("No pending questions.")
+            return
+        
+        return pending_ids
     
     def add_expert_answer(self, question_id, answer_text):
         """Add an expert answer to a question"""
         try:
-            # Add the answer
             answer_query = """
                 INSERT INTO anonymous_answers (question_id, answer_text, is_verified, helpful_votes)
                 VALUES (%s, %s, %s, %s)
             """
+            update_query = "UPDATE anonymous_questions SET is_answered = TRUE WHERE question_id = %s"
             
-            result = self.db_manager.execute_query(answer_query, (question_id, answer_text, True, 0))
+            # Add the answer and mark the question as answered atomically
+            with self.db_manager.transaction() as unit:
+                unit.add(answer_query, (question_id, answer_text, True, 0))
+                unit.add(update_query, (question_id,))
             
-            if result is not None:
-                # Mark question as answered
-                update_query = "UPDATE anonymous_questions SET is_answered = TRUE WHERE question_id = %s"
-                self.db_manager.execute_query(update_query, (question_id,))
-                
+            if unit.committed:
                 print(f"✅ Expert answer added to question {question_id}")
                 return True
             
@@ -65,6 +65,51 @@ class AdminTool:
             print(f"❌ Error adding answer: {e}")
             return False
     
+    def show_query_stats(self):
+        """Show per-query latency statistics and optionally dump them as JSON"""
+        saved = QueryStats.load_json(self.db_manager.query_stats_path)
+        
+        print(f"\n{'='*110}")
+        print("QUERY PERFORMANCE STATISTICS")
+        print(f"{'='*110}")
+        
+        if saved and saved.get('queries'):
+            print(f"\nApplication (saved {saved['generated_at']}, since {saved['collected_since']}):")
+            print(format_stats_table(saved['queries']))
+        else:
+            print("\nNo saved application statistics found.")
+        
+        current = self.db_manager.query_stats.snapshot()
+        if current:
+            print("\nThis admin session:")
+            print(format_stats_table(current))
+        
+        cache = self.db_manager.result_cache_stats()
+        print(f"\nResult cache: {cache['hits']} hits, {cache['misses']} misses "
+              f"(hit rate {cache['hit_rate']:.0%}), {cache['entries']} entries, "
+              f"{cache['invalidations']} invalidated, {cache['evictions']} evicted, "
+              f"{cache['stale_hits']} served stale")
+        
+        breaker = self.db_manager.breaker_stats()
+        liveness = self.db_manager.liveness_stats()
+        print(f"Circuit breaker: {breaker['state']}, tripped {breaker['trips']} time(s), "
+              f"{breaker['rejected']} call(s) failed fast; {liveness['timeouts']} query timeout(s)")
+        
+        print(f"\nSlow queries (>= {self.db_manager.query_stats.slow_query_ms:.0f} ms) are logged to "
+              f"{self.db_manager.query_stats.slow_log_path}")
+        
+        dump = input("\nDump this session's statistics as JSON? (y/n): ").strip().lower()
+        if dump == 'y':
+            path = input("File path (press Enter to print instead): ").strip()
+            if path:
+                try:
+                    self.db_manager.query_stats.dump_json(path)
+                    print(f"✅ Statistics written to {path}")
+                except OSError as e:
+                    print(f"❌ Could not write statistics: {e}")
+            else:
+                print(self.db_manager.query_stats.to_json())
+    
     def run_interactive_mode(self):
         """Run interactive mode for experts to answer questions"""
         print("Welcome to the Expert Q&A Admin Tool")
@@ -74,22 +119,22 @@ class AdminTool:
             print("\nOptions:")
             print("1. View pending questions")
             print("2. Answer a question")
-            print("3. Exit")
+            print("3. View query performance statistics")
+            print("4. Exit")
             
-            choice = input("\nEnter choice (1-3): ").strip()
+            choice = input("\nEnter choice (1-4): ").strip()
             
             if choice == '1':
                 self.show_pending_questions()
                 
             elif choice == '2':
-                questions = self.show_pending_questions()
-                if questions:
+                pending_ids = self.show_pending_questions()
+                if pending_ids:
                     try:
                         q_id = int(input("\nEnter question ID to answer: "))
                         
                         # Verify question exists and is pending
-                        valid_ids = [q['question_id'] for q in questions]
-                        if q_id not in valid_ids:
+                        if q_id not in pending_ids:
                             print("❌ Invalid question ID")
                             continue
                         
@@ -118,6 +163,9 @@ class AdminTool:
                         print(f"❌ Error: {e}")
                         
             elif choice == '3':
+                self.show_query_stats()
+                
+            elif choice == '4':
                 print("Goodbye!")
                 break
                 
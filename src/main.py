@@ -6,6 +6,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 from config.database import db_manager
+from config.counters import counter_aggregator
 from src.ui.auth_ui import AuthUI
 from src.ui.menu_handler import MenuHandler
 from src.utils.helpers import clear_screen, print_header, print_emergency_contacts
@@ -33,6 +34,7 @@ class TeenagePregnancyAwarenessSystem:
         else:
             print(f"{Fore.RED}❌ Failed to connect to database{Style.RESET_ALL}")
             print(f"{Fore.YELLOW}Please ensure MySQL is running and database is configured{Style.RESET_ALL}")
+            print(f"{Fore.YELLOW}To run offline, set DB_BACKEND=sqlite to use a local database file{Style.RESET_ALL}")
             return False
     
     def run(self):
@@ -126,6 +128,12 @@ class TeenagePregnancyAwarenessSystem:
     def cleanup(self):
         """Clean up resources before exit."""
         try:
+            # Write back counter increments still held in memory
+            counter_aggregator.flush()
+            
+            # Keep this session's query statistics for the admin tool
+            db_manager.save_query_stats()
+            
             # Close database connection
             db_manager.disconnect()
         except Exception as e:
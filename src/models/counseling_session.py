@@ -1,9 +1,55 @@
 from datetime import datetime
 from colorama import Fore, Style
 from config.database import db_manager
+from config.async_database import async_db_manager
+from config.pagination import KeysetQuery, Page
+from config.rows import RowMapper
 
 class CounselingSession:
     """Model for counseling sessions."""
+
+    __slots__ = ('session_id', 'username', 'name', 'topic', 'preferred_date', 'status', 'notes',
+                 'created_at', 'updated_at')
+
+    mapper = RowMapper('session_id', 'username', 'topic', 'preferred_date', 'status', 'notes',
+                       'created_at', 'updated_at', name='client_name')
+    
+    CREATE_SESSION_QUERY = """
+    INSERT INTO counseling_sessions (username, client_name, topic, preferred_date, status, notes)
+    VALUES (%s, %s, %s, %s, 'scheduled', %s)
+    """
+
+    USER_SESSIONS_QUERY = """
+    SELECT session_id, username, client_name, topic, preferred_date, status, notes, created_at, updated_at
+    FROM counseling_sessions 
+    WHERE username = %s 
+    ORDER BY preferred_date DESC, created_at DESC
+    """
+
+    ALL_SESSIONS_QUERY = """
+    SELECT session_id, username, client_name, topic, preferred_date, status, notes, created_at, updated_at
+    FROM counseling_sessions 
+    ORDER BY preferred_date DESC, created_at DESC
+    """
+
+    # Same order as the listings above; session_id makes the key unique
+    SESSION_PAGE_KEY = ('preferred_date', 'created_at', 'session_id')
+
+    USER_SESSIONS_PAGE = KeysetQuery("""
+    SELECT session_id, username, client_name, topic, preferred_date, status, notes, created_at, updated_at
+    FROM counseling_sessions
+    """, SESSION_PAGE_KEY, where="username = %s")
+
+    ALL_SESSIONS_PAGE = KeysetQuery("""
+    SELECT session_id, username, client_name, topic, preferred_date, status, notes, created_at, updated_at
+    FROM counseling_sessions
+    """, SESSION_PAGE_KEY)
+
+    SESSION_BY_ID_QUERY = """
+    SELECT session_id, username, client_name, topic, preferred_date, status, notes, created_at, updated_at
+    FROM counseling_sessions 
+    WHERE session_id = %s
+    """
     
     def __init__(self, session_id=None, username=None, name=None, topic=None, 
                  preferred_date=None, status='scheduled', notes=None):
@@ -20,10 +66,7 @@ class CounselingSession:
     @classmethod
     def create_session(cls, username, name, topic, preferred_date, notes=None):
         """Create a new counseling session."""
-        insert_query = """
-        INSERT INTO counseling_sessions (username, client_name, topic, preferred_date, status, notes)
-        VALUES (%s, %s, %s, %s, 'scheduled', %s)
-        """
+        insert_query = cls.CREATE_SESSION_QUERY
         
         try:
             # If name is empty, use "Anonymous"
@@ -43,33 +86,10 @@ class CounselingSession:
     @classmethod
     def get_user_sessions(cls, username):
         """Get all sessions for a specific user."""
-        query = """
-        SELECT session_id, username, client_name, topic, preferred_date, status, notes, created_at, updated_at
-        FROM counseling_sessions 
-        WHERE username = %s 
-        ORDER BY preferred_date DESC, created_at DESC
-        """
+        query = cls.USER_SESSIONS_QUERY
         
         try:
-            result = db_manager.execute_query(query, (username,))
-            sessions = []
-            
-            if result:
-                for row in result:
-                    session = cls(
-                        session_id=row['session_id'],
-                        username=row['username'],
-                        name=row['client_name'],
-                        topic=row['topic'],
-                        preferred_date=row['preferred_date'],
-                        status=row['status'],
-                        notes=row['notes']
-                    )
-                    session.created_at = row['created_at']
-                    session.updated_at = row['updated_at']
-                    sessions.append(session)
-            
-            return sessions
+            return cls.mapper.hydrate(db_manager.execute_rows(query, (username,)))
         except Exception as e:
             print(f"Error retrieving sessions: {e}")
             return []
@@ -77,68 +97,89 @@ class CounselingSession:
     @classmethod
     def get_all_sessions(cls):
         """Get all sessions (for admin/counselor view)."""
-        query = """
-        SELECT session_id, username, client_name, topic, preferred_date, status, notes, created_at, updated_at
-        FROM counseling_sessions 
-        ORDER BY preferred_date DESC, created_at DESC
-        """
+        query = cls.ALL_SESSIONS_QUERY
         
         try:
-            result = db_manager.execute_query(query)
-            sessions = []
-            
-            if result:
-                for row in result:
-                    session = cls(
-                        session_id=row['session_id'],
-                        username=row['username'],
-                        name=row['client_name'],
-                        topic=row['topic'],
-                        preferred_date=row['preferred_date'],
-                        status=row['status'],
-                        notes=row['notes']
-                    )
-                    session.created_at = row['created_at']
-                    session.updated_at = row['updated_at']
-                    sessions.append(session)
-            
-            return sessions
+            return cls.mapper.hydrate(db_manager.execute_rows(query))
         except Exception as e:
             print(f"Error retrieving all sessions: {e}")
             return []
     
+    @classmethod
+    def get_user_sessions_page(cls, username, after=None, before=None, page_size=10):
+        """Get one :class:`Page` of a user's sessions.
+
+        ``after``/``before`` are cursors from a previous page's
+        ``next_after``/``previous_before``.
+        """
+        try:
+            page = db_manager.execute_page(cls.USER_SESSIONS_PAGE, (username,), after, before, page_size,
+                                           dictionary=False)
+            return page.map(cls.mapper.hydrate) if page is not None else Page()
+        except Exception as e:
+            print(f"Error retrieving sessions: {e}")
+            return Page()
+    
+    @classmethod
+    def get_all_sessions_page(cls, after=None, before=None, page_size=50):
+        """Get one :class:`Page` of all sessions (for admin/counselor view)."""
+        try:
+            page = db_manager.execute_page(cls.ALL_SESSIONS_PAGE, None, after, before, page_size,
+                                           dictionary=False)
+            return page.map(cls.mapper.hydrate) if page is not None else Page()
+        except Exception as e:
+            print(f"Error retrieving all sessions: {e}")
+            return Page()
+    
+    @classmethod
+    def iter_all_sessions(cls, batch_size=500):
+        """Yield all sessions, streaming and hydrating them one batch at a time."""
+        for batch in db_manager.iter_query_batches(cls.ALL_SESSIONS_QUERY, batch_size=batch_size,
+                                                   dictionary=False):
+            yield from cls.mapper.hydrate(batch)
+    
     @classmethod
     def get_session_by_id(cls, session_id):
         """Get a specific session by ID."""
-        query = """
-        SELECT session_id, username, client_name, topic, preferred_date, status, notes, created_at, updated_at
-        FROM counseling_sessions 
-        WHERE session_id = %s
-        """
+        query = cls.SESSION_BY_ID_QUERY
         
         try:
-            result = db_manager.execute_query(query, (session_id,))
-            
-            if result and len(result) > 0:
-                row = result[0]
-                session = cls(
-                    session_id=row['session_id'],
-                    username=row['username'],
-                    name=row['client_name'],
-                    topic=row['topic'],
-                    preferred_date=row['preferred_date'],
-                    status=row['status'],
-                    notes=row['notes']
-                )
-                session.created_at = row['created_at']
-                session.updated_at = row['updated_at']
-                return session
-            
-            return None
+            return cls.mapper.first(db_manager.execute_rows(query, (session_id,)))
         except Exception as e:
             print(f"Error retrieving session: {e}")
             return None
     
+    @classmethod
+    async def create_session_async(cls, username, name, topic, preferred_date, notes=None):
+        """Create a new counseling session without blocking the event loop."""
+        display_name = name.strip() if name and name.strip() else "Anonymous"
+        result = await async_db_manager.execute(
+            cls.CREATE_SESSION_QUERY,
+            (username, display_name, topic, preferred_date, notes)
+        )
+        
+        if result is not None:
+            return True, "Session booked successfully!"
+        return False, "Failed to book session"
+    
+    @classmethod
+    async def get_user_sessions_async(cls, username):
+        """Get all sessions for a user without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.USER_SESSIONS_QUERY, (username,))
+        return cls.mapper.hydrate(result)
+    
+    @classmethod
+    async def get_all_sessions_async(cls):
+        """Get all sessions without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.ALL_SESSIONS_QUERY)
+        return cls.mapper.hydrate(result)
+    
+    @classmethod
+    async def get_session_by_id_async(cls, session_id):
+        """Get a specific session by ID without blocking the event loop."""
+        row = await async_db_manager.fetch_one(cls.SESSION_BY_ID_QUERY, (session_id,))
+        return cls.mapper.from_row(row)
+    
     def update_session(self, name=None, topic=None, preferred_date=None, notes=None):
         """Update session details."""
         update_query = """
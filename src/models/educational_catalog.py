@@ -0,0 +1,151 @@
+import os
+import threading
+import time
+from config.database import db_manager
+from src.models.educational_module import EducationalModule
+
+
+class ModuleCatalog:
+    """Process-wide, in-memory catalog of the educational modules.
+
+    The module listing is loaded once and indexed by id, category and
+    difficulty, so menus are served from memory. At most every
+    ``check_interval`` seconds a read revalidates it by comparing the table's
+    change stamp, ``MAX(updated_at)`` and ``COUNT(*)``, with the one seen at
+    load time, and reloads the listing only when it changed. The stamp and
+    reload bypass the result cache, so writes from other processes are seen
+    within one interval. Modules are listing rows: their content loads on
+    first access and then stays in the catalog.
+
+    The stamp and listing queries run outside the lock, by one reader at a
+    time; meanwhile the others keep serving the loaded catalog. While the
+    database is unreachable the last loaded catalog keeps being served.
+    ``check_interval=0`` revalidates on every read.
+    """
+
+    STAMP_QUERY = "SELECT MAX(updated_at) AS changed, COUNT(*) AS modules FROM educational_modules"
+
+    def __init__(self, check_interval=30):
+        self.check_interval = check_interval
+        self._modules = []
+        self._by_id = {}
+        self._by_category = {}
+        self._by_difficulty = {}
+        self._stamp = None
+        self._checked_at = None
+        self._checking = False
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        # Counters for tuning
+        self.hits = 0
+        self.checks = 0
+        self.reloads = 0
+
+    def modules(self):
+        """All modules in menu order (category, difficulty, title)."""
+        self._revalidate()
+        return list(self._modules)
+
+    def get(self, module_id):
+        """The module with ``module_id``, or None."""
+        self._revalidate()
+        return self._by_id.get(module_id)
+
+    def by_category(self, category):
+        """Modules of one category, by difficulty and title."""
+        self._revalidate()
+        return list(self._by_category.get(category, ()))
+
+    def by_difficulty(self, difficulty_level):
+        """Modules of one difficulty level, in menu order."""
+        self._revalidate()
+        return list(self._by_difficulty.get(difficulty_level, ()))
+
+    def categories(self):
+        """Categories that have modules, in the order the ENUM declares them."""
+        self._revalidate()
+        return [category for category in EducationalModule.CATEGORIES if category in self._by_category]
+
+    def invalidate(self):
+        """Reload on the next read, e.g. after this process changed the modules."""
+        with self._lock:
+            self._checked_at = None
+            self._stamp = None
+            self._generation += 1
+
+    def _revalidate(self):
+        with self._lock:
+            now = time.monotonic()
+            fresh = self._checked_at is not None and now - self._checked_at < self.check_interval
+            if fresh or (self._checking and self._modules):
+                self.hits += 1
+                return
+
+            self._checking = True
+            self.checks += 1
+            known, generation = self._stamp, self._generation
+
+        stamp = listing = None
+        try:
+            stamp = self._read_stamp()
+            if stamp is not None and stamp != known:
+                listing = self._read_listing()
+        finally:
+            with self._lock:
+                self._checking = False
+                if stamp is None:
+                    # Unreachable: keep serving what we have, try again after the interval
+                    self._checked_at = now if self._modules else None
+                else:
+                    if listing is not None:
+                        self._install(listing)
+                        self._stamp = stamp
+                    # Invalidated meanwhile: the next read checks again
+                    self._checked_at = now if self._generation == generation else None
+
+    def _read_stamp(self):
+        result = db_manager.execute_query(self.STAMP_QUERY, cached=False)
+        if not result:
+            return None
+        return result[0]['changed'], result[0]['modules']
+
+    def _read_listing(self):
+        """The modules in menu order, or None if they could not be read."""
+        rows = db_manager.execute_rows(EducationalModule.ALL_MODULES_QUERY, cached=False)
+        if rows is None:
+            return None
+
+        # ORDER BY sorts the ENUMs alphabetically on SQLite; use the declared order everywhere
+        categories = {category: rank for rank, category in enumerate(EducationalModule.CATEGORIES)}
+        levels = {level: rank for rank, level in enumerate(EducationalModule.DIFFICULTY_LEVELS)}
+        return sorted(EducationalModule.mapper.hydrate(rows), key=lambda module: (
+            categories.get(module.category, len(categories)),
+            levels.get(module.difficulty_level, len(levels)),
+            module.title,
+        ))
+
+    def _install(self, modules):
+        """Replace the catalog with ``modules``."""
+        by_category, by_difficulty = {}, {}
+        for module in modules:
+            by_category.setdefault(module.category, []).append(module)
+            by_difficulty.setdefault(module.difficulty_level, []).append(module)
+
+        self._modules = modules
+        self._by_id = {module.module_id: module for module in modules}
+        self._by_category = by_category
+        self._by_difficulty = by_difficulty
+        self.reloads += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'modules': len(self._modules),
+                'hits': self.hits,
+                'checks': self.checks,
+                'reloads': self.reloads,
+            }
+
+
+module_catalog = ModuleCatalog(check_interval=float(os.getenv('EDUCATION_CATALOG_CHECK_INTERVAL', 30)))
@@ -1,9 +1,53 @@
 from datetime import datetime
 from colorama import Fore, Style
+from config.circuit_breaker import DatabaseUnavailableError
 from config.database import db_manager
+from config.async_database import async_db_manager
+from config.rows import RowMapper
 
 class EducationalModule:
     """Model for educational modules/topics."""
+
+    __slots__ = ('module_id', 'title', 'content', 'category', 'difficulty_level', 'created_at', 'updated_at')
+
+    # ENUM values in declaration order, which is how MySQL sorts them
+    CATEGORIES = ('reproductive_health', 'pregnancy_risks', 'contraception', 'puberty', 'stds')
+    DIFFICULTY_LEVELS = ('beginner', 'intermediate', 'advanced')
+
+    # Columns the listings leave out; loaded together on first access
+    DEFERRED = ('content', 'created_at', 'updated_at')
+
+    mapper = RowMapper(*__slots__, deferred=DEFERRED)
+    
+    ALL_MODULES_QUERY = """
+    SELECT module_id, title, category, difficulty_level
+    FROM educational_modules 
+    ORDER BY category, difficulty_level, title
+    """
+
+    MODULE_BY_ID_QUERY = """
+    SELECT module_id, title, content, category, difficulty_level, created_at, updated_at
+    FROM educational_modules 
+    WHERE module_id = %s
+    """
+
+    MODULES_BY_CATEGORY_QUERY = """
+    SELECT module_id, title, category, difficulty_level
+    FROM educational_modules 
+    WHERE category = %s
+    ORDER BY difficulty_level, title
+    """
+
+    DEFERRED_COLUMNS_QUERY = """
+    SELECT module_id, content, created_at, updated_at
+    FROM educational_modules 
+    WHERE module_id IN ({ids})
+    """
+
+    # Modules per deferred-column query
+    DEFERRED_BATCH_SIZE = 200
+
+    ALL_CATEGORIES_QUERY = "SELECT DISTINCT category FROM educational_modules ORDER BY category"
     
     def __init__(self, module_id=None, title=None, content=None, category=None, difficulty_level='beginner'):
         self.module_id = module_id
@@ -14,33 +58,69 @@ class EducationalModule:
         self.created_at = None
         self.updated_at = None
     
+    def __getattr__(self, name):
+        """Load the deferred columns of a listed module on first access.
+
+        Raises :class:`DatabaseUnavailableError` when they cannot be read
+        and :class:`LookupError` when the module was deleted since it was
+        listed; the next access tries again.
+        """
+        # Only reached for slots left unset, i.e. deferred columns of a listed module
+        if name not in self.DEFERRED:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        
+        if not self.load_deferred([self]):
+            raise DatabaseUnavailableError(f"Content of module {self.module_id} could not be loaded")
+        try:
+            return object.__getattribute__(self, name)
+        except AttributeError:
+            raise LookupError(f"Module {self.module_id} no longer exists") from None
+    
+    def is_loaded(self):
+        """Whether the deferred columns (content, timestamps) are loaded."""
+        try:
+            object.__getattribute__(self, 'content')
+            return True
+        except AttributeError:
+            return False
+    
+    @classmethod
+    def load_deferred(cls, modules):
+        """Load content and timestamps of listed modules, a batch per query.
+        
+        Modules that already have them are skipped, so calling this before
+        showing several modules costs at most one query per batch. Returns
+        False if a batch could not be read.
+        """
+        pending = {module.module_id: module for module in modules if not module.is_loaded()}
+        ids = list(pending)
+        
+        loaded = True
+        for start in range(0, len(ids), cls.DEFERRED_BATCH_SIZE):
+            batch = ids[start:start + cls.DEFERRED_BATCH_SIZE]
+            query = cls.DEFERRED_COLUMNS_QUERY.format(ids=", ".join(["%s"] * len(batch)))
+            try:
+                rows = db_manager.execute_rows(query, tuple(batch))
+            except Exception as e:
+                print(f"Error loading module content: {e}")
+                return False
+            if rows is None:
+                loaded = False
+                continue
+            
+            module_id, deferred = rows.getter('module_id'), rows.getter(*cls.DEFERRED)
+            for row in rows:
+                module = pending[module_id(row)]
+                module.content, module.created_at, module.updated_at = deferred(row)
+        return loaded
+    
     @classmethod
     def get_all_modules(cls):
         """Get all educational modules."""
-        query = """
-        SELECT module_id, title, content, category, difficulty_level, created_at, updated_at
-        FROM educational_modules 
-        ORDER BY category, difficulty_level, title
-        """
+        query = cls.ALL_MODULES_QUERY
         
         try:
-            result = db_manager.execute_query(query)
-            modules = []
-            
-            if result:
-                for row in result:
-                    module = cls(
-                        module_id=row['module_id'],
-                        title=row['title'],
-                        content=row['content'],
-                        category=row['category'],
-                        difficulty_level=row['difficulty_level']
-                    )
-                    module.created_at = row['created_at']
-                    module.updated_at = row['updated_at']
-                    modules.append(module)
-            
-            return modules
+            return cls.mapper.hydrate(db_manager.execute_rows(query))
         except Exception as e:
             print(f"Error retrieving modules: {e}")
             return []
@@ -48,29 +128,10 @@ class EducationalModule:
     @classmethod
     def get_module_by_id(cls, module_id):
         """Get a specific module by ID."""
-        query = """
-        SELECT module_id, title, content, category, difficulty_level, created_at, updated_at
-        FROM educational_modules 
-        WHERE module_id = %s
-        """
+        query = cls.MODULE_BY_ID_QUERY
         
         try:
-            result = db_manager.execute_query(query, (module_id,))
-            
-            if result and len(result) > 0:
-                row = result[0]
-                module = cls(
-                    module_id=row['module_id'],
-                    title=row['title'],
-                    content=row['content'],
-                    category=row['category'],
-                    difficulty_level=row['difficulty_level']
-                )
-                module.created_at = row['created_at']
-                module.updated_at = row['updated_at']
-                return module
-            
-            return None
+            return cls.mapper.first(db_manager.execute_rows(query, (module_id,)))
         except Exception as e:
             print(f"Error retrieving module: {e}")
             return None
@@ -78,31 +139,10 @@ class EducationalModule:
     @classmethod
     def get_modules_by_category(cls, category):
         """Get all modules in a specific category."""
-        query = """
-        SELECT module_id, title, content, category, difficulty_level, created_at, updated_at
-        FROM educational_modules 
-        WHERE category = %s
-        ORDER BY difficulty_level, title
-        """
+        query = cls.MODULES_BY_CATEGORY_QUERY
         
         try:
-            result = db_manager.execute_query(query, (category,))
-            modules = []
-            
-            if result:
-                for row in result:
-                    module = cls(
-                        module_id=row['module_id'],
-                        title=row['title'],
-                        content=row['content'],
-                        category=row['category'],
-                        difficulty_level=row['difficulty_level']
-                    )
-                    module.created_at = row['created_at']
-                    module.updated_at = row['updated_at']
-                    modules.append(module)
-            
-            return modules
+            return cls.mapper.hydrate(db_manager.execute_rows(query, (category,)))
         except Exception as e:
             print(f"Error retrieving modules by category: {e}")
             return []
@@ -110,7 +150,7 @@ class EducationalModule:
     @classmethod
     def get_all_categories(cls):
         """Get all available categories."""
-        query = "SELECT DISTINCT category FROM educational_modules ORDER BY category"
+        query = cls.ALL_CATEGORIES_QUERY
         
         try:
             result = db_manager.execute_query(query)
@@ -119,6 +159,30 @@ class EducationalModule:
             print(f"Error retrieving categories: {e}")
             return []
     
+    @classmethod
+    async def get_all_modules_async(cls):
+        """Get all educational modules without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.ALL_MODULES_QUERY)
+        return cls.mapper.hydrate(result)
+    
+    @classmethod
+    async def get_module_by_id_async(cls, module_id):
+        """Get a specific module by ID without blocking the event loop."""
+        row = await async_db_manager.fetch_one(cls.MODULE_BY_ID_QUERY, (module_id,))
+        return cls.mapper.from_row(row)
+    
+    @classmethod
+    async def get_modules_by_category_async(cls, category):
+        """Get all modules in a category without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.MODULES_BY_CATEGORY_QUERY, (category,))
+        return cls.mapper.hydrate(result)
+    
+    @classmethod
+    async def get_all_categories_async(cls):
+        """Get all available categories without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.ALL_CATEGORIES_QUERY)
+        return [row['category'] for row in result] if result else []
+    
     @classmethod
     def create_default_modules(cls):
         """Create default educational modules if they don't exist."""
@@ -170,14 +234,11 @@ class EducationalModule:
              "Comprehensive care involves medical, emotional, and social support.")
         ]
         
-        insert_query = """
-        INSERT INTO educational_modules (title, category, difficulty_level, content) 
-        VALUES (%s, %s, %s, %s)
-        """
+        columns = ('title', 'category', 'difficulty_level', 'content')
         
         try:
-            result = db_manager.execute_many(insert_query, default_modules)
-            if result:
+            result = db_manager.bulk_insert('educational_modules', columns, default_modules)
+            if result.rows and not result.failed:
                 print(f"{Fore.GREEN}✅ Default educational modules created successfully!{Style.RESET_ALL}")
                 return True
             return False
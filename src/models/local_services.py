@@ -1,13 +1,77 @@
 from datetime import datetime
 from colorama import Fore, Style
 from config.database import db_manager
+from config.async_database import async_db_manager
+from config.pagination import KeysetQuery, Page
+from config.rows import RowMapper
 
 class SupportResource:
     """Model for support resources (clinics, NGOs, hotlines, etc.)."""
+
+    __slots__ = ('resource_id', 'name', 'resource_type', 'description', 'phone', 'email', 'address',
+                 'city', 'country', 'website', 'is_available_24_7', 'latitude', 'longitude', 'created_at')
+
+    mapper = RowMapper('resource_id', 'name', 'description', 'phone', 'email', 'address', 'city',
+                       'country', 'website', 'is_available_24_7', 'latitude', 'longitude', 'created_at',
+                       resource_type='type')
+
+    # support_resources.type values in ENUM declaration order, which is how MySQL sorts them
+    TYPES = ('clinic', 'ngo', 'hotline', 'counseling_center')
+    
+    ALL_RESOURCES_QUERY = """
+    SELECT resource_id, name, type, description, phone, email, address, 
+           city, country, website, is_available_24_7, latitude, longitude, created_at
+    FROM support_resources 
+    ORDER BY city, type, name
+    """
+
+    RESOURCES_BY_TYPE_QUERY = """
+    SELECT resource_id, name, type, description, phone, email, address, 
+           city, country, website, is_available_24_7, latitude, longitude, created_at
+    FROM support_resources 
+    WHERE type = %s
+    ORDER BY city, name
+    """
+
+    RESOURCES_BY_CITY_QUERY = """
+    SELECT resource_id, name, type, description, phone, email, address, 
+           city, country, website, is_available_24_7, latitude, longitude, created_at
+    FROM support_resources 
+    WHERE city LIKE %s
+    ORDER BY type, name
+    """
+
+    RESOURCES_24_7_QUERY = """
+    SELECT resource_id, name, type, description, phone, email, address, 
+           city, country, website, is_available_24_7, latitude, longitude, created_at
+    FROM support_resources 
+    WHERE is_available_24_7 = TRUE
+    ORDER BY type, city, name
+    """
+
+    # Directory order (city, type, name); resource_id makes the key unique. City is
+    # nullable and a NULL cursor value matches nothing, so the key reads it as ''.
+    # MySQL sorts an ENUM by its declaration order but compares it with a string
+    # alphabetically, so the key sorts and seeks on the type's text instead
+    ALL_RESOURCES_PAGE = KeysetQuery("""
+    SELECT resource_id, name, type, description, phone, email, address, 
+           city, country, website, is_available_24_7, latitude, longitude, created_at,
+           COALESCE(city, '') AS city_key, CAST(type AS CHAR(20)) AS type_key
+    FROM support_resources
+    """, ("COALESCE(city, '')", 'CAST(type AS CHAR(20))', 'name', 'resource_id'), descending=False,
+        columns=('city_key', 'type_key', 'name', 'resource_id'))
+
+    ALL_CITIES_QUERY = "SELECT DISTINCT city FROM support_resources WHERE city IS NOT NULL ORDER BY city"
+
+    ALL_TYPES_QUERY = "SELECT DISTINCT type FROM support_resources ORDER BY type"
+
+    # Seconds a directory query may run: people in crisis are better served by the
+    # cached directory or the emergency contacts than by a long wait
+    QUERY_TIMEOUT = 2
     
     def __init__(self, resource_id=None, name=None, resource_type=None, description=None,
                  phone=None, email=None, address=None, city=None, country='Rwanda',
-                 website=None, is_available_24_7=False):
+                 website=None, is_available_24_7=False, latitude=None, longitude=None):
         self.resource_id = resource_id
         self.name = name
         self.resource_type = resource_type
@@ -19,79 +83,51 @@ class SupportResource:
         self.country = country
         self.website = website
         self.is_available_24_7 = is_available_24_7
+        self.latitude = latitude
+        self.longitude = longitude
         self.created_at = None
     
     @classmethod
     def get_all_resources(cls):
         """Get all support resources."""
-        query = """
-        SELECT resource_id, name, type, description, phone, email, address, 
-               city, country, website, is_available_24_7, created_at
-        FROM support_resources 
-        ORDER BY city, type, name
-        """
+        query = cls.ALL_RESOURCES_QUERY
         
         try:
-            result = db_manager.execute_query(query)
-            resources = []
-            
-            if result:
-                for row in result:
-                    resource = cls(
-                        resource_id=row['resource_id'],
-                        name=row['name'],
-                        resource_type=row['type'],
-                        description=row['description'],
-                        phone=row['phone'],
-                        email=row['email'],
-                        address=row['address'],
-                        city=row['city'],
-                        country=row['country'],
-                        website=row['website'],
-                        is_available_24_7=row['is_available_24_7']
-                    )
-                    resource.created_at = row['created_at']
-                    resources.append(resource)
-            
-            return resources
+            return cls.mapper.hydrate(db_manager.execute_rows(query, timeout=cls.QUERY_TIMEOUT))
         except Exception as e:
             print(f"Error retrieving resources: {e}")
             return []
     
+    @classmethod
+    def get_resources_page(cls, after=None, before=None, page_size=10):
+        """Get one :class:`Page` of the directory, in city, type and name order.
+
+        ``after``/``before`` are cursors from a previous page's
+        ``next_after``/``previous_before``. Resources without a city sort
+        first.
+        """
+        try:
+            page = db_manager.execute_page(cls.ALL_RESOURCES_PAGE, None, after, before, page_size,
+                                           dictionary=False, timeout=cls.QUERY_TIMEOUT)
+            return page.map(cls.mapper.hydrate) if page is not None else Page()
+        except Exception as e:
+            print(f"Error retrieving resources: {e}")
+            return Page()
+    
+    @classmethod
+    def iter_all_resources(cls, batch_size=500):
+        """Yield all support resources, streaming and hydrating them one batch at a time."""
+        for batch in db_manager.iter_query_batches(cls.ALL_RESOURCES_QUERY, batch_size=batch_size,
+                                                   dictionary=False):
+            yield from cls.mapper.hydrate(batch)
+    
     @classmethod
     def get_resources_by_type(cls, resource_type):
         """Get resources by type."""
-        query = """
-        SELECT resource_id, name, type, description, phone, email, address, 
-               city, country, website, is_available_24_7, created_at
-        FROM support_resources 
-        WHERE type = %s
-        ORDER BY city, name
-        """
+        query = cls.RESOURCES_BY_TYPE_QUERY
         
         try:
-            result = db_manager.execute_query(query, (resource_type,))
-            resources = []
-            
-            if result:
-                for row in result:
-                    resource = cls(
-                        resource_id=row['resource_id'],
-                        name=row['name'],
-                        resource_type=row['type'],
-                        description=row['description'],
-                        phone=row['phone'],
-                        email=row['email'],
-                        address=row['address'],
-                        city=row['city'],
-                        country=row['country'],
-                        website=row['website'],
-                        is_available_24_7=row['is_available_24_7']
-                    )
-                    resource.created_at = row['created_at']
-                    resources.append(resource)
-            
-            return resources
+            return cls.mapper.hydrate(db_manager.execute_rows(query, (resource_type,), timeout=cls.QUERY_TIMEOUT))
         except Exception as e:
             print(f"Error retrieving resources by type: {e}")
             return []
@@ -99,38 +135,11 @@ class SupportResource:
     @classmethod
     def get_resources_by_city(cls, city):
         """Get resources by city."""
-        query = """
-        SELECT resource_id, name, type, description, phone, email, address, 
-               city, country, website, is_available_24_7, created_at
-        FROM support_resources 
-        WHERE city LIKE %s
-        ORDER BY type, name
-        """
+        query = cls.RESOURCES_BY_CITY_QUERY
         
         try:
             search_city = f"%{city}%"
-            result = db_manager.execute_query(query, (search_city,))
-            resources = []
-            
-            if result:
-                for row in result:
-                    resource = cls(
-                        resource_id=row['resource_id'],
-                        name=row['name'],
-                        resource_type=row['type'],
-                        description=row['description'],
-                        phone=row['phone'],
-                        email=row['email'],
-                        address=row['address'],
-                        city=row['city'],
-                        country=row['country'],
-                        website=row['website'],
-                        is_available_24_7=row['is_available_24_7']
-                    )
-                    resource.created_at = row['created_at']
-                    resources.append(resource)
-            
-            return resources
+            return cls.mapper.hydrate(db_manager.execute_rows(query, (search_city,), timeout=cls.QUERY_TIMEOUT))
         except Exception as e:
             print(f"Error retrieving resources by city: {e}")
             return []
@@ -138,37 +147,10 @@ class SupportResource:
     @classmethod
     def get_24_7_resources(cls):
         """Get all 24/7 available resources."""
-        query = """
-        SELECT resource_id, name, type, description, phone, email, address, 
-               city, country, website, is_available_24_7, created_at
-        FROM support_resources 
-        WHERE is_available_24_7 = TRUE
-        ORDER BY type, city, name
-        """
+        query = cls.RESOURCES_24_7_QUERY
         
         try:
-            result = db_manager.execute_query(query)
-            resources = []
-            
-            if result:
-                for row in result:
-                    resource = cls(
-                        resource_id=row['resource_id'],
-                        name=row['name'],
-                        resource_type=row['type'],
-                        description=row['description'],
-                        phone=row['phone'],
-                        email=row['email'],
-                        address=row['address'],
-                        city=row['city'],
-                        country=row['country'],
-                        website=row['website'],
-                        is_available_24_7=row['is_available_24_7']
-                    )
-                    resource.created_at = row['created_at']
-                    resources.append(resource)
-            
-            return resources
+            return cls.mapper.hydrate(db_manager.execute_rows(query, timeout=cls.QUERY_TIMEOUT))
         except Exception as e:
             print(f"Error retrieving 24/7 resources: {e}")
             return []
@@ -176,10 +158,10 @@ class SupportResource:
     @classmethod
     def get_all_cities(cls):
         """Get all available cities."""
-        query = "SELECT DISTINCT city FROM support_resources WHERE city IS NOT NULL ORDER BY city"
+        query = cls.ALL_CITIES_QUERY
         
         try:
-            result = db_manager.execute_query(query)
+            result = db_manager.execute_query(query, timeout=cls.QUERY_TIMEOUT)
             return [row['city'] for row in result] if result else []
         except Exception as e:
             print(f"Error retrieving cities: {e}")
@@ -188,15 +170,51 @@ class SupportResource:
     @classmethod
     def get_all_types(cls):
         """Get all available resource types."""
-        query = "SELECT DISTINCT type FROM support_resources ORDER BY type"
+        query = cls.ALL_TYPES_QUERY
         
         try:
-            result = db_manager.execute_query(query)
+            result = db_manager.execute_query(query, timeout=cls.QUERY_TIMEOUT)
             return [row['type'] for row in result] if result else []
         except Exception as e:
             print(f"Error retrieving types: {e}")
             return []
     
+    @classmethod
+    async def get_all_resources_async(cls):
+        """Get all support resources without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.ALL_RESOURCES_QUERY)
+        return cls.mapper.hydrate(result)
+    
+    @classmethod
+    async def get_resources_by_type_async(cls, resource_type):
+        """Get resources by type without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.RESOURCES_BY_TYPE_QUERY, (resource_type,))
+        return cls.mapper.hydrate(result)
+    
+    @classmethod
+    async def get_resources_by_city_async(cls, city):
+        """Get resources by city without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.RESOURCES_BY_CITY_QUERY, (f"%{city}%",))
+        return cls.mapper.hydrate(result)
+    
+    @classmethod
+    async def get_24_7_resources_async(cls):
+        """Get all 24/7 available resources without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.RESOURCES_24_7_QUERY)
+        return cls.mapper.hydrate(result)
+    
+    @classmethod
+    async def get_all_cities_async(cls):
+        """Get all available cities without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.ALL_CITIES_QUERY)
+        return [row['city'] for row in result] if result else []
+    
+    @classmethod
+    async def get_all_types_async(cls):
+        """Get all available resource types without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.ALL_TYPES_QUERY)
+        return [row['type'] for row in result] if result else []
+    
     @classmethod
     def create_default_resources(cls):
         """Create default support resources if they don't exist."""
@@ -216,76 +234,73 @@ class SupportResource:
             ("Kigali University Teaching Hospital (CHUK)", "clinic", 
              "Main public hospital in Kigali providing comprehensive healthcare including reproductive health services.",
              "+250 252 575 555", "info@chuk.gov.rw", "KN 4 Ave, Kigali", "Kigali", "Rwanda", 
-             "https://www.chuk.gov.rw", True),
+             "https://www.chuk.gov.rw", True, -1.9441, 30.0619),
             
             ("King Faisal Hospital", "clinic",
              "Private hospital offering quality healthcare services including maternal and reproductive health.",
              "+250 252 582 421", "info@kfh.rw", "KG 544 St, Kigali", "Kigali", "Rwanda",
-             "https://www.kfh.rw", True),
+             "https://www.kfh.rw", True, -1.9447, 30.0936),
             
             ("Polyclinic du Plateau", "clinic",
              "Private clinic providing reproductive health and family planning services.",
              "+250 252 572 613", "info@polycliniqueduplateau.rw", "KN 67 St, Kigali", "Kigali", "Rwanda",
-             None, False),
+             None, False, -1.948, 30.06),
             
             # NGOs
             ("Health Development Initiative (HDI)", "ngo",
              "NGO focused on adolescent reproductive health and education programs.",
              "+250 252 571 234", "info@hdi.rw", "KG 15 Ave, Kigali", "Kigali", "Rwanda",
-             "https://www.hdi.rw", False),
+             "https://www.hdi.rw", False, -1.9536, 30.0918),
             
             ("Rwandan Association for Family Welfare (ARBEF)", "ngo",
              "Organization providing family planning and reproductive health services.",
              "+250 252 570 987", "arbef@rwanda.com", "KN 12 St, Kigali", "Kigali", "Rwanda",
-             None, False),
+             None, False, -1.95, 30.059),
             
             ("Youth Action Rwanda", "ngo",
              "Youth-focused organization providing education and support for teenagers.",
              "+250 252 569 876", "info@youthactionrwanda.org", "KG 45 St, Kigali", "Kigali", "Rwanda",
-             "https://www.youthactionrwanda.org", False),
+             "https://www.youthactionrwanda.org", False, -1.947, 30.09),
             
             # Hotlines
             ("National Mental Health Helpline", "hotline",
              "24/7 mental health support and crisis intervention services.",
              "114", None, None, "National", "Rwanda",
-             None, True),
+             None, True, None, None),
             
             ("Teen Support Hotline", "hotline",
              "Confidential support line for teenagers facing various challenges.",
              "+250 788 123 456", "support@teensupport.rw", None, "National", "Rwanda",
-             None, True),
+             None, True, None, None),
             
             ("Gender-Based Violence Hotline", "hotline",
              "24/7 support for victims of gender-based violence.",
              "3677", "gbv@police.gov.rw", None, "National", "Rwanda",
-             "https://www.police.gov.rw", True),
+             "https://www.police.gov.rw", True, None, None),
             
             # Counseling Centers
             ("Kigali Counseling Center", "counseling_center",
              "Professional counseling services for individuals and families.",
              "+250 252 564 321", "counseling@kcc.rw", "KN 23 Ave, Kigali", "Kigali", "Rwanda",
-             None, False),
+             None, False, -1.953, 30.061),
             
             ("Huye Counseling Services", "counseling_center",
              "Counseling and psychological support services in Southern Province.",
              "+250 252 530 789", "info@huyecounseling.rw", "Main Street, Huye", "Huye", "Rwanda",
-             None, False),
+             None, False, -2.5967, 29.7394),
             
             ("Musanze Youth Center", "counseling_center",
              "Youth counseling and support services in Northern Province.",
              "+250 252 546 123", "youth@musanze.gov.rw", "City Center, Musanze", "Musanze", "Rwanda",
-             None, False)
+             None, False, -1.4998, 29.6345)
         ]
         
-        insert_query = """
-        INSERT INTO support_resources (name, type, description, phone, email, address, 
-                                     city, country, website, is_available_24_7) 
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        columns = ('name', 'type', 'description', 'phone', 'email', 'address',
+                   'city', 'country', 'website', 'is_available_24_7', 'latitude', 'longitude')
         
         try:
-            result = db_manager.execute_many(insert_query, default_resources)
-            if result:
+            result = db_manager.bulk_insert('support_resources', columns, default_resources)
+            if result.rows and not result.failed:
                 print(f"{Fore.GREEN}✅ Default support resources loaded successfully!{Style.RESET_ALL}")
                 return True
             return False
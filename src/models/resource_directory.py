@@ -0,0 +1,293 @@
+import os
+import threading
+import time
+from config.database import db_manager
+from src.models.local_services import SupportResource
+from src.utils.fuzzy import TrigramIndex, normalize_place as normalize_city
+from src.utils.geo import KDTree
+
+
+# Resource types rank in ENUM order, as ORDER BY type sorts them on MySQL
+_TYPE_RANK = {resource_type: rank for rank, resource_type in enumerate(SupportResource.TYPES)}
+
+
+def _type_rank(resource_type):
+    return _TYPE_RANK.get(resource_type, len(_TYPE_RANK)), resource_type
+
+
+def _directory_order(resource):
+    return ((resource.city or '').casefold(), _type_rank(resource.resource_type), resource.name.casefold(),
+            resource.resource_id)
+
+
+class ResourceDirectory:
+    """Process-wide, in-memory support resource directory with faceted lookups.
+
+    Resources are kept by id with inverted indexes on type, normalized city
+    and the 24/7 flag; a lookup intersects the id sets of the requested
+    facets, so filters such as "clinics in Huye open 24/7" never reach the
+    database. Resources with coordinates are also kept in a k-d tree for
+    nearest-service lookups, rebuilt on the first such lookup after a change.
+    City names, and from the first name search on facility names, are kept
+    in trigram indexes for typo-tolerant search.
+
+    At most every ``check_interval`` seconds a lookup compares the table's
+    stamp (row count, highest id, latest ``created_at``) with what is loaded.
+    New rows are fetched by id and added to the indexes; any other change
+    (deleted rows) reloads the directory. Resources have no update
+    timestamp, so edits are picked up by a full reload every
+    ``reload_interval`` seconds. While the database is unreachable the loaded
+    directory keeps being served.
+    """
+
+    STAMP_QUERY = """
+    SELECT COUNT(*) AS resources, MAX(resource_id) AS last_id, MAX(created_at) AS last_created
+    FROM support_resources
+    """
+
+    NEW_RESOURCES_QUERY = """
+    SELECT resource_id, name, type, description, phone, email, address,
+           city, country, website, is_available_24_7, latitude, longitude, created_at
+    FROM support_resources
+    WHERE resource_id > %s
+    ORDER BY resource_id
+    """
+
+    def __init__(self, check_interval=30, reload_interval=600):
+        self.check_interval = check_interval
+        self.reload_interval = reload_interval
+        self._by_id = {}
+        self._by_type = {}
+        self._by_city = {}
+        self._city_names = {}
+        self._open_24_7 = set()
+        self._tree = None
+        self._city_names_index = TrigramIndex()
+        self._resource_names_index = None
+        # Bumped by every full reload
+        self._generation = 0
+        self._stamp = None
+        self._checked_at = None
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+        # Counters for tuning
+        self.lookups = 0
+        self.checks = 0
+        self.reloads = 0
+        self.incremental_refreshes = 0
+
+    def find(self, resource_type=None, city=None, open_24_7=None):
+        """Resources matching every given facet, in directory order (city, type, name).
+
+        ``city`` matches the normalized city name exactly, or else every city
+        containing it ("kig" finds Kigali). ``open_24_7=True`` keeps 24/7
+        resources only, ``False`` the others.
+        """
+        return sorted(self._select(resource_type, city, open_24_7), key=_directory_order)
+
+    def by_type(self, resource_type):
+        """Resources of one type, by city and name."""
+        return sorted(self._select(resource_type=resource_type),
+                      key=lambda r: ((r.city or '').casefold(), r.name.casefold()))
+
+    def in_city(self, city):
+        """Resources in a city, by type and name."""
+        return sorted(self._select(city=city), key=lambda r: (_type_rank(r.resource_type), r.name.casefold()))
+
+    def open_24_7(self):
+        """Resources available 24/7, by type, city and name."""
+        return sorted(self._select(open_24_7=True),
+                      key=lambda r: (_type_rank(r.resource_type), (r.city or '').casefold(), r.name.casefold()))
+
+    def nearest(self, latitude, longitude, count=5, resource_type=None, open_24_7=None, max_km=None):
+        """The ``count`` resources closest to a point, as ``[(resource, distance_km)]``.
+
+        Takes the same facet filters as :meth:`find`; resources without
+        coordinates are never returned.
+        """
+        with self._lock:
+            self._revalidate()
+            self.lookups += 1
+            if self._tree is None:
+                self._tree = KDTree(
+                    (resource.latitude, resource.longitude, resource) for resource in self._by_id.values()
+                    if resource.latitude is not None and resource.longitude is not None
+                )
+            ids = self._matching(resource_type, None, open_24_7)
+            accept = None if ids is None else (lambda resource: resource.resource_id in ids)
+            return self._tree.nearest(latitude, longitude, count, accept, max_km)
+
+    def match_cities(self, query, limit=3):
+        """Cities spelled like ``query`` ("Kigli", "Musanzi") as ``[(city, similarity)]``, best first."""
+        with self._lock:
+            self._revalidate()
+            self.lookups += 1
+            return self._city_names_index.search(query, limit)
+
+    def match_names(self, query, limit=5):
+        """Resources whose name is spelled like ``query`` as ``[(resource, similarity)]``, best first.
+
+        The name index is built on the first call after a (re)load, outside
+        the lock so other lookups are not held up, then swapped in. Searches
+        run under the lock, as new rows are added to the installed index.
+        """
+        with self._lock:
+            self._revalidate()
+            self.lookups += 1
+            if self._resource_names_index is not None:
+                return self._resource_names_index.search(query, limit)
+            generation = self._generation
+            resources = list(self._by_id.values())
+
+        index = TrigramIndex()
+        for resource in resources:
+            index.add(resource.resource_id, resource.name, resource)
+
+        with self._lock:
+            # Install unless a reload replaced the directory meanwhile; catch up on added rows
+            if self._generation == generation and self._resource_names_index is None:
+                for resource_id, resource in self._by_id.items():
+                    if resource_id not in index:
+                        index.add(resource_id, resource.name, resource)
+                self._resource_names_index = index
+            return index.search(query, limit)
+
+    def _select(self, resource_type=None, city=None, open_24_7=None):
+        with self._lock:
+            self._revalidate()
+            self.lookups += 1
+            ids = self._matching(resource_type, city, open_24_7)
+            return [self._by_id[resource_id] for resource_id in (self._by_id if ids is None else ids)]
+
+    def _matching(self, resource_type, city, open_24_7):
+        """Ids matching every given facet, or None when no facet is given."""
+        facets = []
+        if resource_type is not None:
+            facets.append(self._by_type.get(resource_type, set()))
+        if city is not None:
+            facets.append(self._city_ids(city))
+        if open_24_7 is not None:
+            facets.append(self._open_24_7 if open_24_7 else self._by_id.keys() - self._open_24_7)
+
+        if not facets:
+            return None
+        facets.sort(key=len)
+        return facets[0].intersection(*facets[1:])
+
+    def get(self, resource_id):
+        with self._lock:
+            self._revalidate()
+            return self._by_id.get(resource_id)
+
+    def cities(self):
+        """City names (as first seen) that have resources, sorted."""
+        with self._lock:
+            self._revalidate()
+            return sorted(self._city_names.values(), key=str.casefold)
+
+    def types(self):
+        """Resource types that have resources, in ENUM order."""
+        with self._lock:
+            self._revalidate()
+            return sorted(self._by_type, key=_type_rank)
+
+    def invalidate(self):
+        """Reload on the next lookup, e.g. after this process changed the resources."""
+        with self._lock:
+            self._checked_at = None
+            self._loaded_at = None
+
+    def _city_ids(self, city):
+        key = normalize_city(city)
+        ids = self._by_city.get(key)
+        if ids is not None:
+            return ids
+        return set().union(*(ids for name, ids in self._by_city.items() if key in name))
+
+    def _revalidate(self):
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return
+
+        self.checks += 1
+        result = db_manager.execute_query(self.STAMP_QUERY, timeout=SupportResource.QUERY_TIMEOUT,
+                                          cached=False)
+        if not result:
+            # Unreachable: keep serving what we have, try again after the interval
+            self._checked_at = now if self._by_id else None
+            return
+
+        stamp = (result[0]['resources'], result[0]['last_id'], result[0]['last_created'])
+        reload_due = self._loaded_at is None or now - self._loaded_at >= self.reload_interval
+        if reload_due or stamp != self._stamp:
+            refreshed = (not reload_due and self._add_new(stamp[0])) or self._load(now)
+            if refreshed:
+                self._stamp = stamp
+        self._checked_at = now
+
+    def _add_new(self, count):
+        """Add the rows created since the last refresh; False if they do not account for ``count``."""
+        known_last_id = self._stamp[1] or 0
+        rows = db_manager.execute_rows(self.NEW_RESOURCES_QUERY, (known_last_id,),
+                                       timeout=SupportResource.QUERY_TIMEOUT, cached=False)
+        if rows is None:
+            return False
+        new = SupportResource.mapper.hydrate(rows)
+        if len(self._by_id) + len(new) != count:
+            return False
+
+        for resource in new:
+            self._index(resource)
+        self._tree = None
+        self.incremental_refreshes += 1
+        return True
+
+    def _load(self, now):
+        """Rebuild the directory from a full listing; False if it could not be read."""
+        rows = db_manager.execute_rows(SupportResource.ALL_RESOURCES_QUERY,
+                                       timeout=SupportResource.QUERY_TIMEOUT, cached=False)
+        if rows is None:
+            return False
+
+        self._by_id, self._by_type, self._by_city, self._city_names = {}, {}, {}, {}
+        self._open_24_7 = set()
+        self._tree = None
+        self._city_names_index, self._resource_names_index = TrigramIndex(), None
+        for resource in SupportResource.mapper.hydrate(rows):
+            self._index(resource)
+        self._loaded_at = now
+        self._generation += 1
+        self.reloads += 1
+        return True
+
+    def _index(self, resource):
+        resource_id = resource.resource_id
+        self._by_id[resource_id] = resource
+        self._by_type.setdefault(resource.resource_type, set()).add(resource_id)
+        if resource.city:
+            key = normalize_city(resource.city)
+            self._by_city.setdefault(key, set()).add(resource_id)
+            if key not in self._city_names:
+                self._city_names[key] = resource.city
+                self._city_names_index.add(key, resource.city)
+        if resource.is_available_24_7:
+            self._open_24_7.add(resource_id)
+        if self._resource_names_index is not None:
+            self._resource_names_index.add(resource_id, resource.name, resource)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'resources': len(self._by_id),
+                'lookups': self.lookups,
+                'checks': self.checks,
+                'reloads': self.reloads,
+                'incremental_refreshes': self.incremental_refreshes,
+            }
+
+
+resource_directory = ResourceDirectory(
+    check_interval=float(os.getenv('DIRECTORY_CHECK_INTERVAL', 30)),
+    reload_interval=float(os.getenv('DIRECTORY_RELOAD_INTERVAL', 600))
+)
@@ -1,9 +1,26 @@
 from datetime import datetime
 from config.database import db_manager
+from config.async_database import async_db_manager
+from config.rows import RowMapper
 
 
 class User:
     """Represents a user with simple username authentication."""
+
+    __slots__ = ('username', 'age', 'created_at', 'last_login', 'is_active')
+
+    mapper = RowMapper(*__slots__)
+    
+    USER_QUERY = "SELECT * FROM users WHERE username = %s AND is_active = TRUE"
+
+    PROGRESS_SUMMARY_QUERY = """
+    SELECT 
+        COUNT(*) as total_modules,
+        SUM(completed) as completed_modules,
+        AVG(score) as average_score
+    FROM user_progress 
+    WHERE username = %s
+    """
     
     def __init__(self, username=None, age=None):
         self.username = username
@@ -53,18 +70,13 @@ class User:
     @classmethod
     def get_user(cls, username):
         """Get a user by username."""
-        query = "SELECT * FROM users WHERE username = %s AND is_active = TRUE"
+        query = cls.USER_QUERY
         
         try:
             result = db_manager.execute_query(query, (username,))
             
             if result and len(result) > 0:
-                user_data = result[0]
-                user = cls(user_data['username'], user_data['age'])
-                user.created_at = user_data['created_at']
-                user.last_login = user_data['last_login']
-                user.is_active = user_data['is_active']
-                return user
+                return cls.mapper.from_row(result[0])
             else:
                 return None
                 
@@ -72,6 +84,12 @@ class User:
             print(f"Error retrieving user: {str(e)}")
             return None
     
+    @classmethod
+    async def get_user_async(cls, username):
+        """Get a user by username without blocking the event loop."""
+        row = await async_db_manager.fetch_one(cls.USER_QUERY, (username,))
+        return cls.mapper.from_row(row)
+    
     @classmethod
     def username_exists(cls, username):
         """Check if username already exists."""
@@ -117,28 +135,45 @@ class User:
             print(f"Error deactivating user: {str(e)}")
             return False
     
+    @classmethod
+    def get_user_with_progress(cls, username):
+        """Get a user and their progress summary in a single round trip.
+        
+        Returns ``(user, progress)``; ``user`` is None if not found.
+        """
+        try:
+            results = db_manager.execute_pipeline([
+                (cls.USER_QUERY, (username,)),
+                (cls.PROGRESS_SUMMARY_QUERY, (username,)),
+            ])
+            
+            if not results or not results[0]:
+                return None, None
+            
+            user_rows, progress_rows = results
+            return cls.mapper.from_row(user_rows[0]), cls._progress_from_rows(progress_rows)
+                
+        except Exception as e:
+            print(f"Error retrieving user progress: {str(e)}")
+            return None, None
+    
+    @staticmethod
+    def _progress_from_rows(result):
+        if result and len(result) > 0:
+            return result[0]
+        return {
+            'total_modules': 0,
+            'completed_modules': 0,
+            'average_score': 0
+        }
+    
     def get_progress_summary(self):
         """Get user's learning progress summary."""
-        query = """
-        SELECT 
-            COUNT(*) as total_modules,
-            SUM(completed) as completed_modules,
-            AVG(score) as average_score
-        FROM user_progress 
-        WHERE username = %s
-        """
+        query = self.PROGRESS_SUMMARY_QUERY
         
         try:
             result = db_manager.execute_query(query, (self.username,))
-            
-            if result and len(result) > 0:
-                return result[0]
-            else:
-                return {
-                    'total_modules': 0,
-                    'completed_modules': 0,
-                    'average_score': 0
-                }
+            return self._progress_from_rows(result)
                 
         except Exception as e:
             print(f"Error getting progress summary: {str(e)}")
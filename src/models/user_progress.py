@@ -1,8 +1,29 @@
 from config.database import db_manager
+from config.async_database import async_db_manager
 
 
 class UserProgress:
     """Model for tracking user progress on educational modules."""
+
+    __slots__ = ('username', 'module_id', 'completed', 'completion_date', 'score')
+    
+    PROGRESS_QUERY = """
+    SELECT 
+        (SELECT COUNT(*) FROM educational_modules) as total_modules,
+        COUNT(CASE WHEN completed = TRUE THEN 1 END) as completed_modules,
+        AVG(CASE WHEN completed = TRUE AND score > 0 THEN score END) as average_score
+    FROM user_progress 
+    WHERE username = %s
+    """
+
+    COMPLETED_MODULES_QUERY = """
+    SELECT em.title, up.completion_date, up.score
+    FROM user_progress up
+    JOIN educational_modules em ON up.module_id = em.module_id
+    WHERE up.username = %s AND up.completed = TRUE
+    ORDER BY up.completion_date DESC
+    LIMIT %s
+    """
     
     def __init__(self, username=None, module_id=None, completed=False, score=0):
         self.username = username
@@ -14,32 +35,17 @@ class UserProgress:
     @classmethod
     def mark_completed(cls, username, module_id, score=0):
         """Mark a module as completed for a user."""
-        # Check if progress record exists
-        check_query = """
-        SELECT progress_id FROM user_progress 
-        WHERE username = %s AND module_id = %s
+        # Single upsert on (username, module_id): atomic even with concurrent writers
+        upsert_query = """
+        INSERT INTO user_progress (username, module_id, completed, completion_date, score)
+        VALUES (%s, %s, TRUE, NOW(), %s)
+        ON DUPLICATE KEY UPDATE
+            completed = TRUE, completion_date = NOW(), score = VALUES(score)
         """
         
         try:
-            result = db_manager.execute_query(check_query, (username, module_id))
-            
-            if result and len(result) > 0:
-                # Update existing record
-                update_query = """
-                UPDATE user_progress 
-                SET completed = TRUE, completion_date = NOW(), score = %s
-                WHERE username = %s AND module_id = %s
-                """
-                db_manager.execute_query(update_query, (score, username, module_id))
-            else:
-                # Create new record
-                insert_query = """
-                INSERT INTO user_progress (username, module_id, completed, completion_date, score)
-                VALUES (%s, %s, TRUE, NOW(), %s)
-                """
-                db_manager.execute_query(insert_query, (username, module_id, score))
-            
-            return True
+            result = db_manager.execute_query(upsert_query, (username, module_id, score))
+            return result is not None
         except Exception as e:
             print(f"Error marking module as completed: {e}")
             return False
@@ -47,30 +53,11 @@ class UserProgress:
     @classmethod
     def get_user_progress(cls, username):
         """Get user's learning progress summary."""
-        progress_query = """
-        SELECT 
-            (SELECT COUNT(*) FROM educational_modules) as total_modules,
-            COUNT(CASE WHEN completed = TRUE THEN 1 END) as completed_modules,
-            AVG(CASE WHEN completed = TRUE AND score > 0 THEN score END) as average_score
-        FROM user_progress 
-        WHERE username = %s
-        """
-        
         try:
-            result = db_manager.execute_query(progress_query, (username,))
+            result = db_manager.execute_query(cls.PROGRESS_QUERY, (username,))
             
             if result and len(result) > 0:
-                data = result[0]
-                total = data['total_modules'] or 0
-                completed = data['completed_modules'] or 0
-                avg_score = data['average_score'] or 0
-                
-                return {
-                    "total": total,
-                    "completed": completed,
-                    "percentage": (completed / total * 100) if total > 0 else 0,
-                    "average_score": float(avg_score) if avg_score else 0
-                }
+                return cls._summarize(result[0])
             
             return {"total": 0, "completed": 0, "percentage": 0, "average_score": 0}
         except Exception as e:
@@ -80,18 +67,37 @@ class UserProgress:
     @classmethod
     def get_completed_modules(cls, username, limit=3):
         """Get recently completed modules for a user."""
-        query = """
-        SELECT em.title, up.completion_date, up.score
-        FROM user_progress up
-        JOIN educational_modules em ON up.module_id = em.module_id
-        WHERE up.username = %s AND up.completed = TRUE
-        ORDER BY up.completion_date DESC
-        LIMIT %s
-        """
-        
         try:
-            result = db_manager.execute_query(query, (username, limit))
+            result = db_manager.execute_query(cls.COMPLETED_MODULES_QUERY, (username, limit))
             return result if result else []
         except Exception as e:
             print(f"Error getting completed modules: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    @staticmethod
+    def _summarize(data):
+        """Turn a progress aggregate row into the summary dictionary."""
+        total = data['total_modules'] or 0
+        completed = data['completed_modules'] or 0
+        avg_score = data['average_score'] or 0
+        
+        return {
+            "total": total,
+            "completed": completed,
+            "percentage": (completed / total * 100) if total > 0 else 0,
+            "average_score": float(avg_score) if avg_score else 0
+        }
+    
+    @classmethod
+    async def get_user_progress_async(cls, username):
+        """Get user's learning progress summary without blocking the event loop."""
+        row = await async_db_manager.fetch_one(cls.PROGRESS_QUERY, (username,))
+        if row:
+            return cls._summarize(row)
+        return {"total": 0, "completed": 0, "percentage": 0, "average_score": 0}
+    
+    @classmethod
+    async def get_completed_modules_async(cls, username, limit=3):
+        """Get recently completed modules without blocking the event loop."""
+        result = await async_db_manager.fetch_all(cls.COMPLETED_MODULES_QUERY, (username, limit))
+        return result if result else []
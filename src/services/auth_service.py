@@ -129,7 +129,10 @@ class AuthService:
         if not self.current_user:
             return None
         
-        progress = self.current_user.get_progress_summary()
+        # Refresh the account row and load progress in one round trip
+        user, progress = User.get_user_with_progress(self.current_user.username)
+        if user is not None:
+            self.current_user = user
         
         return {
             'username': self.current_user.username,
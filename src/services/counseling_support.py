@@ -2,39 +2,10 @@ from datetime import datetime
 from colorama import Fore, Style
 from config.database import db_manager
 from src.models.counseling_session import CounselingSession
+from src.utils.helpers import print_unavailable_notice
 
 class CounselingSupport:
     
-    def __init__(self):
-        # Ensure database connection is established
-        if not db_manager.connection or not db_manager.connection.is_connected():
-            db_manager.connect()
-        
-        # Create counseling sessions table if it doesn't exist
-        self._create_sessions_table()
-    
-    def _create_sessions_table(self):
-        """Create counseling sessions table if it doesn't exist."""
-        create_query = """
-        CREATE TABLE IF NOT EXISTS counseling_sessions (
-            session_id INT AUTO_INCREMENT PRIMARY KEY,
-            username VARCHAR(20) NOT NULL,
-            client_name VARCHAR(255) NOT NULL,
-            topic TEXT NOT NULL,
-            preferred_date DATE NOT NULL,
-            status ENUM('scheduled', 'completed', 'cancelled', 'rescheduled') DEFAULT 'scheduled',
-            notes TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            FOREIGN KEY (username) REFERENCES users(username) ON DELETE CASCADE
-        )
-        """
-        
-        try:
-            db_manager.execute_query(create_query)
-        except Exception as e:
-            print(f"Note: Counseling sessions table may already exist: {e}")
-    
     def display_topics(self):
         """Display available support topics."""
         print(f"\n{Fore.CYAN}📋 Available Support Topics:{Style.RESET_ALL}")
@@ -103,12 +74,36 @@ class CounselingSupport:
         
         return success
     
+    def display_session(self, idx, session):
+        """Display one session of a numbered listing."""
+        status_color = {
+            'scheduled': Fore.BLUE,
+            'completed': Fore.GREEN,
+            'cancelled': Fore.RED,
+            'rescheduled': Fore.YELLOW
+        }.get(session.status, Fore.WHITE)
+        
+        print(f"\n{Fore.CYAN}{idx}. Session #{session.session_id}{Style.RESET_ALL}")
+        print(f"   👤 Name: {session.name}")
+        print(f"   📝 Topic: {session.topic}")
+        print(f"   📅 Date: {session.preferred_date}")
+        print(f"   {status_color}📊 Status: {session.status.title()}{Style.RESET_ALL}")
+        
+        if session.notes:
+            print(f"   📄 Notes: {session.notes}")
+        
+        print(f"   🕒 Booked: {session.created_at.strftime('%Y-%m-%d %H:%M') if session.created_at else 'Unknown'}")
+    
     def view_sessions(self, username):
         """View all sessions for a user."""
         print(f"\n{Fore.GREEN}--- 📋 Your Booked Sessions ---{Style.RESET_ALL}")
         
         sessions = CounselingSession.get_user_sessions(username)
         
+        if not sessions and not db_manager.is_available():
+            print_unavailable_notice("Your sessions")
+            return []
+        
         if not sessions:
             print(f"{Fore.YELLOW}📝 No sessions booked yet.{Style.RESET_ALL}")
             print("Book your first session to get started with counseling support!")
@@ -118,27 +113,53 @@ class CounselingSupport:
         print("=" * 80)
         
         for idx, session in enumerate(sessions, start=1):
-            status_color = {
-                'scheduled': Fore.BLUE,
-                'completed': Fore.GREEN,
-                'cancelled': Fore.RED,
-                'rescheduled': Fore.YELLOW
-            }.get(session.status, Fore.WHITE)
-            
-            print(f"\n{Fore.CYAN}{idx}. Session #{session.session_id}{Style.RESET_ALL}")
-            print(f"   👤 Name: {session.name}")
-            print(f"   📝 Topic: {session.topic}")
-            print(f"   📅 Date: {session.preferred_date}")
-            print(f"   {status_color}📊 Status: {session.status.title()}{Style.RESET_ALL}")
-            
-            if session.notes:
-                print(f"   📄 Notes: {session.notes}")
-            
-            print(f"   🕒 Booked: {session.created_at.strftime('%Y-%m-%d %H:%M') if session.created_at else 'Unknown'}")
+            self.display_session(idx, session)
         
         print("\n" + "=" * 80)
         return sessions
     
+    def browse_sessions(self, username, page_size=5):
+        """Page through a user's sessions."""
+        after = before = None
+        first = 1
+        
+        while True:
+            print(f"\n{Fore.GREEN}--- 📋 Your Booked Sessions ---{Style.RESET_ALL}")
+            
+            sessions = CounselingSession.get_user_sessions_page(username, after=after, before=before,
+                                                                page_size=page_size)
+            
+            if not sessions:
+                if not db_manager.is_available():
+                    print_unavailable_notice("Your sessions")
+                elif first == 1:
+                    print(f"{Fore.YELLOW}📝 No sessions booked yet.{Style.RESET_ALL}")
+                    print("Book your first session to get started with counseling support!")
+                return
+            
+            print("=" * 80)
+            for idx, session in enumerate(sessions, start=first):
+                self.display_session(idx, session)
+            print("\n" + "=" * 80)
+            
+            options = []
+            if sessions.has_next:
+                options.append("n = next page")
+            if sessions.has_previous:
+                options.append("p = previous page")
+            if not options:
+                return
+            
+            choice = input(f"\n{Fore.YELLOW}{', '.join(options)}, Enter = done: {Style.RESET_ALL}").strip().lower()
+            if choice == 'n' and sessions.has_next:
+                after, before = sessions.next_after, None
+                first += len(sessions)
+            elif choice == 'p' and sessions.has_previous:
+                after, before = None, sessions.previous_before
+                first = max(1, first - page_size)
+            else:
+                return
+    
     def edit_session(self, username):
         """Edit a counseling session."""
         print(f"\n{Fore.YELLOW}--- ✏️ Edit a Counseling Session ---{Style.RESET_ALL}")
@@ -287,7 +308,7 @@ def run_counseling_support(username=None):
                 input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
             
             elif choice == '3':
-                support.view_sessions(username)
+                support.browse_sessions(username)
                 input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
             
             elif choice == '4':
@@ -1,26 +1,25 @@
 from datetime import datetime
 from colorama import Fore, Style
-from config.database import db_manager
+from config.circuit_breaker import DatabaseUnavailableError
+from src.models.educational_catalog import module_catalog
 from src.models.educational_module import EducationalModule
 from src.models.user_progress import UserProgress
+from src.utils.helpers import print_unavailable_notice
 
 
 class EducationalResources:
     
     def __init__(self):
-        # Ensure database connection is established
-        if not db_manager.connection or not db_manager.connection.is_connected():
-            db_manager.connect()
-        
         # Create default modules if they don't exist
-        EducationalModule.create_default_modules()
+        if not module_catalog.modules() and EducationalModule.create_default_modules():
+            module_catalog.invalidate()
     
     def display_topics_menu(self):
         """Display available educational topics."""
         print(f"\n{Fore.CYAN}📚 AVAILABLE EDUCATIONAL TOPICS:{Style.RESET_ALL}")
         print("=" * 50)
         
-        modules = EducationalModule.get_all_modules()
+        modules = module_catalog.modules()
         
         if not modules:
             print(f"{Fore.YELLOW}No topics available yet.{Style.RESET_ALL}")
@@ -45,7 +44,7 @@ class EducationalResources:
     
     def view_topic_content(self, module_id):
         """Display content for a specific topic."""
-        module = EducationalModule.get_module_by_id(module_id)
+        module = module_catalog.get(module_id)
         
         if not module:
             print(f"{Fore.RED}❌ Topic not found.{Style.RESET_ALL}")
@@ -62,7 +61,13 @@ class EducationalResources:
         print(f"{difficulty_color}Difficulty: {module.difficulty_level.title()}{Style.RESET_ALL}")
         
         print("=" * 60)
-        print(f"\n{module.content}")
+        try:
+            print(f"\n{module.content}")
+        except DatabaseUnavailableError:
+            print_unavailable_notice("This topic")
+        except LookupError:
+            module_catalog.invalidate()
+            print(f"{Fore.RED}❌ Topic not found.{Style.RESET_ALL}")
         print("\n" + "=" * 60)
         
         return True
@@ -96,11 +101,11 @@ class EducationalResources:
     
     def get_topics_by_category(self, category):
         """Get all topics in a specific category."""
-        return EducationalModule.get_modules_by_category(category)
+        return module_catalog.by_category(category)
     
     def get_all_categories(self):
         """Get all available categories."""
-        return EducationalModule.get_all_categories()
+        return module_catalog.categories()
 
 
 def display_educational_menu():
@@ -2,16 +2,21 @@ from datetime import datetime
 from colorama import Fore, Style
 from config.database import db_manager
 from src.models.local_services import SupportResource
+from src.models.resource_directory import resource_directory
+from src.utils.geo import find_town, load_gazetteer, match_towns
 
 class LocalServices:
     
     def __init__(self):
-        # Ensure database connection is established
-        if not db_manager.connection or not db_manager.connection.is_connected():
-            db_manager.connect()
-        
         # Create default resources if they don't exist
-        SupportResource.create_default_resources()
+        if not resource_directory.types() and SupportResource.create_default_resources():
+            resource_directory.invalidate()
+    
+    def show_unavailable_notice(self):
+        """Tell the user the directory cannot be reached and show the built-in emergency contacts."""
+        print(f"{Fore.YELLOW}⚠️ The services directory is temporarily unavailable. "
+              f"Please try again in a few minutes.{Style.RESET_ALL}")
+        self.show_emergency_contacts()
     
     def display_resource_types(self):
         """Display available resource types."""
@@ -25,11 +30,13 @@ class LocalServices:
             "counseling_center": "💬 Counseling and therapy centers"
         }
         
-        types = SupportResource.get_all_types()
+        types = resource_directory.types()
         if types:
             for i, resource_type in enumerate(types, 1):
                 description = type_descriptions.get(resource_type, f"📋 {resource_type.replace('_', ' ').title()}")
                 print(f"   {i}. {description}")
+        elif not db_manager.is_available():
+            self.show_unavailable_notice()
         else:
             print(f"{Fore.YELLOW}No service types available yet.{Style.RESET_ALL}")
         
@@ -41,10 +48,12 @@ class LocalServices:
         print(f"\n{Fore.CYAN}📍 Available Cities:{Style.RESET_ALL}")
         print("=" * 30)
         
-        cities = SupportResource.get_all_cities()
+        cities = resource_directory.cities()
         if cities:
             for i, city in enumerate(cities, 1):
                 print(f"   {i}. {city}")
+        elif not db_manager.is_available():
+            self.show_unavailable_notice()
         else:
             print(f"{Fore.YELLOW}No cities available yet.{Style.RESET_ALL}")
         
@@ -93,26 +102,51 @@ class LocalServices:
         
         print("-" * 60)
     
-    def browse_all_services(self):
-        """Browse all available services."""
-        print(f"\n{Fore.GREEN}--- 📋 All Local Services ---{Style.RESET_ALL}")
-        
-        resources = SupportResource.get_all_resources()
-        
-        if not resources:
-            print(f"{Fore.YELLOW}No services available yet.{Style.RESET_ALL}")
-            return
+    def browse_all_services(self, page_size=10):
+        """Browse all available services, one page at a time."""
+        after = before = None
+        page_number = 1
         
-        print(f"\nFound {len(resources)} service(s):")
-        print("=" * 80)
-        
-        current_city = ""
-        for resource in resources:
-            if resource.city != current_city:
-                current_city = resource.city
-                print(f"\n{Fore.MAGENTA}📍 {current_city.upper()}:{Style.RESET_ALL}")
+        while True:
+            print(f"\n{Fore.GREEN}--- 📋 All Local Services (page {page_number}) ---{Style.RESET_ALL}")
             
-            self.display_resource_details(resource)
+            resources = SupportResource.get_resources_page(after=after, before=before, page_size=page_size)
+            
+            if not resources:
+                if not db_manager.is_available():
+                    self.show_unavailable_notice()
+                elif page_number == 1:
+                    print(f"{Fore.YELLOW}No services available yet.{Style.RESET_ALL}")
+                else:
+                    print(f"{Fore.YELLOW}No more services.{Style.RESET_ALL}")
+                return
+            
+            print("=" * 80)
+            current_city = ""
+            for resource in resources:
+                if resource.city != current_city:
+                    current_city = resource.city
+                    print(f"\n{Fore.MAGENTA}📍 {(current_city or 'Other').upper()}:{Style.RESET_ALL}")
+                
+                self.display_resource_details(resource)
+            
+            options = []
+            if resources.has_next:
+                options.append("n = next page")
+            if resources.has_previous:
+                options.append("p = previous page")
+            if not options:
+                return
+            
+            choice = input(f"\n{Fore.YELLOW}{', '.join(options)}, Enter = done: {Style.RESET_ALL}").strip().lower()
+            if choice == 'n' and resources.has_next:
+                after, before = resources.next_after, None
+                page_number += 1
+            elif choice == 'p' and resources.has_previous:
+                after, before = None, resources.previous_before
+                page_number -= 1
+            else:
+                return
     
     def search_by_type(self):
         """Search services by type."""
@@ -131,7 +165,7 @@ class LocalServices:
                 return
             
             selected_type = types[type_index]
-            resources = SupportResource.get_resources_by_type(selected_type)
+            resources = resource_directory.by_type(selected_type)
             
             if resources:
                 print(f"\n{Fore.GREEN}Found {len(resources)} {selected_type.replace('_', ' ')} service(s):{Style.RESET_ALL}")
@@ -139,6 +173,8 @@ class LocalServices:
                 
                 for resource in resources:
                     self.display_resource_details(resource)
+            elif not db_manager.is_available():
+                self.show_unavailable_notice()
             else:
                 print(f"{Fore.YELLOW}No {selected_type.replace('_', ' ')} services found.{Style.RESET_ALL}")
                 
@@ -169,7 +205,9 @@ class LocalServices:
                 # Direct city name input
                 selected_city = choice
             
-            resources = SupportResource.get_resources_by_city(selected_city)
+            resources = resource_directory.in_city(selected_city)
+            if not resources and not choice.isdigit():
+                selected_city, resources = self.match_city(selected_city)
             
             if resources:
                 print(f"\n{Fore.GREEN}Found {len(resources)} service(s) in {selected_city}:{Style.RESET_ALL}")
@@ -177,21 +215,62 @@ class LocalServices:
                 
                 for resource in resources:
                     self.display_resource_details(resource)
-            else:
+            elif not db_manager.is_available():
+                self.show_unavailable_notice()
+            elif not self.show_services_named_like(selected_city):
                 print(f"{Fore.YELLOW}No services found in {selected_city}.{Style.RESET_ALL}")
-                print("Try searching for a nearby city or browse all services.")
+                town = find_town(selected_city)
+                if not town:
+                    town = next((town for town, _ in match_towns(selected_city, limit=1)), None)
+                if town:
+                    self.show_nearest_services(town, count=3)
+                else:
+                    print("Try searching for a nearby city or browse all services.")
                 
         except ValueError:
             print(f"{Fore.RED}❌ Please enter a valid selection.{Style.RESET_ALL}")
     
+    def match_city(self, query):
+        """The city a typed name most likely means, and its services.
+
+        Former town names are resolved through the gazetteer ("Butare" is
+        Huye), misspellings through the directory's city index ("Kigli" is
+        Kigali). Returns ``(query, [])`` when nothing matches.
+        """
+        town = find_town(query)
+        if town:
+            resources = resource_directory.in_city(town.name)
+            if resources:
+                return town.name, resources
+        
+        for city, _ in resource_directory.match_cities(query, limit=1):
+            print(f"{Fore.CYAN}Showing results for {city} (closest match to \"{query}\").{Style.RESET_ALL}")
+            return city, resource_directory.in_city(city)
+        return query, []
+    
+    def show_services_named_like(self, query):
+        """List services whose name is spelled like ``query``; False if there are none."""
+        matches = resource_directory.match_names(query)
+        if not matches:
+            return False
+        
+        print(f"\n{Fore.GREEN}No city called \"{query}\", but these services have similar names:{Style.RESET_ALL}")
+        print("=" * 60)
+        for resource, _ in matches:
+            self.display_resource_details(resource)
+        return True
+    
     def show_24_7_services(self):
         """Show all 24/7 available services."""
         print(f"\n{Fore.GREEN}--- 🕒 24/7 Available Services ---{Style.RESET_ALL}")
         
-        resources = SupportResource.get_24_7_resources()
+        resources = resource_directory.open_24_7()
         
         if not resources:
-            print(f"{Fore.YELLOW}No 24/7 services available yet.{Style.RESET_ALL}")
+            if db_manager.is_available():
+                print(f"{Fore.YELLOW}No 24/7 services available yet.{Style.RESET_ALL}")
+            else:
+                self.show_unavailable_notice()
             return
         
         print(f"\nFound {len(resources)} service(s) available 24/7:")
@@ -202,6 +281,105 @@ class LocalServices:
         
         print(f"\n{Fore.RED}🚨 EMERGENCY: If you're in immediate danger, call 911 or local emergency services!{Style.RESET_ALL}")
     
+    def choose_town(self):
+        """Let the user pick their town from the gazetteer, by number or by name."""
+        towns = load_gazetteer()
+        print(f"\n{Fore.CYAN}📍 Towns:{Style.RESET_ALL}")
+        current_province = ""
+        for i, town in enumerate(towns, 1):
+            if town.province != current_province:
+                current_province = town.province
+                print(f"\n{Fore.MAGENTA}{current_province}:{Style.RESET_ALL}")
+            print(f"   {i}. {town.name} ({town.district})")
+        
+        choice = input(f"\n{Fore.YELLOW}Enter town number (1-{len(towns)}) or type a town name: {Style.RESET_ALL}").strip()
+        if choice.isdigit():
+            if 1 <= int(choice) <= len(towns):
+                return towns[int(choice) - 1]
+            print(f"{Fore.RED}❌ Invalid selection.{Style.RESET_ALL}")
+            return None
+        
+        town = find_town(choice)
+        if not town:
+            print(f"{Fore.RED}❌ Town not found. Pick a number from the list or the nearest larger town.{Style.RESET_ALL}")
+        return town
+    
+    def show_nearest_services(self, town, count=5, resource_type=None, open_24_7=None):
+        """Show the services closest to a town, with their distance."""
+        nearest = resource_directory.nearest(town.latitude, town.longitude, count,
+                                             resource_type=resource_type, open_24_7=open_24_7)
+        if not nearest:
+            if not db_manager.is_available():
+                self.show_unavailable_notice()
+            else:
+                print(f"{Fore.YELLOW}No services with a known location match these filters.{Style.RESET_ALL}")
+            return
+        
+        print(f"\n{Fore.GREEN}Nearest service(s) to {town.name}:{Style.RESET_ALL}")
+        print("=" * 60)
+        for resource, distance in nearest:
+            print(f"\n{Fore.MAGENTA}📏 About {distance:.1f} km away{Style.RESET_ALL}")
+            self.display_resource_details(resource)
+        print("National hotlines are available from anywhere: see Emergency Contacts.")
+    
+    def find_nearest_services(self):
+        """Find the services closest to the user's town."""
+        print(f"\n{Fore.GREEN}--- 📌 Find Nearest Services ---{Style.RESET_ALL}")
+        
+        town = self.choose_town()
+        if not town:
+            return
+        
+        types = resource_directory.types()
+        print("\nPress Enter to include every service type.")
+        for i, resource_type in enumerate(types, 1):
+            print(f"   {i}. {resource_type.replace('_', ' ').title()}")
+        type_choice = input(f"\n{Fore.YELLOW}Service type (1-{len(types)}): {Style.RESET_ALL}").strip()
+        only_24_7 = input(f"{Fore.YELLOW}Open 24/7 only? (y/n): {Style.RESET_ALL}").strip().lower() == 'y'
+        
+        selected_type = None
+        if type_choice:
+            if not type_choice.isdigit() or not 1 <= int(type_choice) <= len(types):
+                print(f"{Fore.RED}❌ Invalid service type.{Style.RESET_ALL}")
+                return
+            selected_type = types[int(type_choice) - 1]
+        
+        self.show_nearest_services(town, resource_type=selected_type, open_24_7=True if only_24_7 else None)
+    
+    def filter_services(self):
+        """Find services matching a type, a city and 24/7 availability at once."""
+        print(f"\n{Fore.GREEN}--- 🎯 Filter Services ---{Style.RESET_ALL}")
+        print("Press Enter to skip a filter.")
+        
+        types = resource_directory.types()
+        for i, resource_type in enumerate(types, 1):
+            print(f"   {i}. {resource_type.replace('_', ' ').title()}")
+        type_choice = input(f"\n{Fore.YELLOW}Service type (1-{len(types)}): {Style.RESET_ALL}").strip()
+        city = input(f"{Fore.YELLOW}City: {Style.RESET_ALL}").strip()
+        only_24_7 = input(f"{Fore.YELLOW}Open 24/7 only? (y/n): {Style.RESET_ALL}").strip().lower() == 'y'
+        
+        selected_type = None
+        if type_choice:
+            if not type_choice.isdigit() or not 1 <= int(type_choice) <= len(types):
+                print(f"{Fore.RED}❌ Invalid service type.{Style.RESET_ALL}")
+                return
+            selected_type = types[int(type_choice) - 1]
+        
+        resources = resource_directory.find(resource_type=selected_type, city=city or None,
+                                            open_24_7=True if only_24_7 else None)
+        
+        if resources:
+            print(f"\n{Fore.GREEN}Found {len(resources)} matching service(s):{Style.RESET_ALL}")
+            print("=" * 60)
+            
+            for resource in resources:
+                self.display_resource_details(resource)
+        elif not db_manager.is_available():
+            self.show_unavailable_notice()
+        else:
+            print(f"{Fore.YELLOW}No services match these filters.{Style.RESET_ALL}")
+            print("Try fewer filters or a nearby city.")
+    
     def show_emergency_contacts(self):
         """Show emergency contact information."""
         print(f"\n{Fore.RED}🚨 EMERGENCY CONTACTS 🚨{Style.RESET_ALL}")
@@ -230,9 +408,11 @@ def display_local_services_menu():
     print("1. 📋 Browse All Services")
     print("2. 🔍 Search by Service Type")
     print("3. 🏙️ Search by City/Location")
-    print("4. 🕒 Show 24/7 Available Services")
-    print("5. 🚨 Emergency Contacts")
-    print("6. 🔙 Return to Main Menu")
+    print("4. 📌 Find Nearest Services to My Town")
+    print("5. 🕒 Show 24/7 Available Services")
+    print("6. 🎯 Filter by Type, City and 24/7")
+    print("7. 🚨 Emergency Contacts")
+    print("8. 🔙 Return to Main Menu")
 
 
 def run_local_services(guest_mode=False):
@@ -246,7 +426,7 @@ def run_local_services(guest_mode=False):
             if guest_mode:
                 print(f"{Fore.GREEN}📋 Available for all users{Style.RESET_ALL}")
             
-            choice = input(f"\n{Fore.YELLOW}Choose an option (1-6): {Style.RESET_ALL}").strip()
+            choice = input(f"\n{Fore.YELLOW}Choose an option (1-8): {Style.RESET_ALL}").strip()
             
             if choice == '1':
                 services.browse_all_services()
@@ -261,19 +441,27 @@ def run_local_services(guest_mode=False):
                 input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
             
             elif choice == '4':
-                services.show_24_7_services()
+                services.find_nearest_services()
                 input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
             
             elif choice == '5':
-                services.show_emergency_contacts()
+                services.show_24_7_services()
                 input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
             
             elif choice == '6':
+                services.filter_services()
+                input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
+            
+            elif choice == '7':
+                services.show_emergency_contacts()
+                input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
+            
+            elif choice == '8':
                 print(f"{Fore.GREEN}Thank you for using local services! Stay safe! 🌸{Style.RESET_ALL}")
                 break
             
             else:
-                print(f"{Fore.RED}❌ Invalid choice. Please select 1-6.{Style.RESET_ALL}")
+                print(f"{Fore.RED}❌ Invalid choice. Please select 1-8.{Style.RESET_ALL}")
                 input(f"{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
                 
     except Exception as e:
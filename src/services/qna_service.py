@@ -4,21 +4,50 @@ import mysql.connector
 from typing import List, Dict, Optional
 from datetime import datetime
 from config.database import db_manager
+from config.async_database import async_db_manager
+from config.counters import counter_aggregator
+from config.pagination import KeysetQuery, Page
 from utils.validators import validate_input
 from utils.security import sanitize_text
 
+# Hot counters are aggregated in memory and written back in batches
+SYSTEM_STATS = counter_aggregator.counter('system_stats', 'stat_name', 'stat_value', upsert=True)
+ANSWER_VOTES = counter_aggregator.counter('anonymous_answers', 'answer_id', 'helpful_votes')
+QUESTION_VOTES = counter_aggregator.counter('anonymous_answers', 'question_id', 'helpful_votes')
+
 class QnAService:
+    # Seconds allowed for the full-table queries (the default DB_QUERY_TIMEOUT suits the rest):
+    # keyword search scans question and answer text, the statistics count whole tables
+    SEARCH_TIMEOUT = 10
+    STATS_TIMEOUT = 15
+    
+    # Paged listings, newest first; question_id breaks ties between equal timestamps.
+    # Answers are counted per question of the page only, so a page never aggregates the table
+    USER_QUESTIONS_PAGE = KeysetQuery("""
+        SELECT q.question_id, q.question_text, q.category, q.is_answered, q.created_at,
+               (SELECT COUNT(*) FROM anonymous_answers a WHERE a.question_id = q.question_id) as answer_count
+        FROM anonymous_questions q
+    """, ('q.created_at', 'q.question_id'), where="q.username = %s")
+    
+    BROWSE_PAGE_SELECT = """
+        SELECT q.question_id, q.question_text, q.category, q.created_at,
+               (SELECT COUNT(*) FROM anonymous_answers a WHERE a.question_id = q.question_id) as answer_count,
+               (SELECT MAX(a.created_at) FROM anonymous_answers a WHERE a.question_id = q.question_id)
+                   as last_answered
+        FROM anonymous_questions q
+    """
+    BROWSE_PAGE = KeysetQuery(BROWSE_PAGE_SELECT, ('q.created_at', 'q.question_id'),
+                              where="q.is_answered = TRUE")
+    BROWSE_CATEGORY_PAGE = KeysetQuery(BROWSE_PAGE_SELECT, ('q.created_at', 'q.question_id'),
+                                       where="q.is_answered = TRUE AND q.category = %s")
+    
     def __init__(self):
+        # The database manager connects lazily and keeps its connections alive
         self.db_manager = db_manager
-        # Ensure database connection
-        if not self.db_manager.connection or not self.db_manager.connection.is_connected():
-            self.db_manager.connect()
     
     def get_connection(self):
-        """Get database connection"""
-        if not self.db_manager.connection or not self.db_manager.connection.is_connected():
-            self.db_manager.connect()
-        return self.db_manager.connection
+        """Borrow a database connection for the duration of a ``with`` block"""
+        return self.db_manager.get_connection()
     
     def submit_question(self, username: str, question_text: str, category: str = 'general') -> bool:
         """Submit a new anonymous question"""
@@ -81,49 +110,102 @@ class QnAService:
             print(f"Error getting user questions: {e}")
             return []
     
-    def browse_questions(self, category: str = None, limit: int = 20) -> List[Dict]:
-        """Browse answered questions"""
+    def get_user_questions_page(self, username: str, after=None, before=None, page_size: int = 10) -> Page:
+        """Get one page of a user's questions, newest first.
+        
+        ``after``/``before`` are cursors from a previous page's
+        ``next_after``/``previous_before``.
+        """
         try:
-            if category and category != 'all':
-                query = """
-                    SELECT q.question_id, q.question_text, q.category, q.created_at,
-                           COUNT(a.answer_id) as answer_count,
-                           MAX(a.created_at) as last_answered
-                    FROM anonymous_questions q
-                    LEFT JOIN anonymous_answers a ON q.question_id = a.question_id
-                    WHERE q.is_answered = TRUE AND q.category = %s
-                    GROUP BY q.question_id, q.question_text, q.category, q.created_at
-                    ORDER BY answer_count DESC, q.created_at DESC
-                    LIMIT %s
-                """
-                questions = self.db_manager.execute_query(query, (category, limit))
-            else:
-                query = """
-                    SELECT q.question_id, q.question_text, q.category, q.created_at,
-                           COUNT(a.answer_id) as answer_count,
-                           MAX(a.created_at) as last_answered
-                    FROM anonymous_questions q
-                    LEFT JOIN anonymous_answers a ON q.question_id = a.question_id
-                    WHERE q.is_answered = TRUE
-                    GROUP BY q.question_id, q.question_text, q.category, q.created_at
-                    ORDER BY answer_count DESC, q.created_at DESC
-                    LIMIT %s
-                """
-                questions = self.db_manager.execute_query(query, (limit,))
+            page = self.db_manager.execute_page(self.USER_QUESTIONS_PAGE, (username,), after, before, page_size)
+            if page is None:
+                return Page()
             
-            if questions:
-                # Add id field for compatibility
-                for q in questions:
-                    q['id'] = q['question_id']
-                    q['answer_count'] = q['answer_count'] or 0
-                return questions
+            for q in page:
+                q['status'] = 'answered' if q['is_answered'] else 'pending'
+                q['answer_count'] = q['answer_count'] or 0
+                q['id'] = q['question_id']
+            return page
             
+        except Exception as e:
+            print(f"Error getting user questions: {e}")
+            return Page()
+    
+    def _browse_query(self, category: str = None, limit: int = 20):
+        """Build the browse query and its parameters"""
+        if category and category != 'all':
+            query = """
+                SELECT q.question_id, q.question_text, q.category, q.created_at,
+                       COUNT(a.answer_id) as answer_count,
+                       MAX(a.created_at) as last_answered
+                FROM anonymous_questions q
+                LEFT JOIN anonymous_answers a ON q.question_id = a.question_id
+                WHERE q.is_answered = TRUE AND q.category = %s
+                GROUP BY q.question_id, q.question_text, q.category, q.created_at
+                ORDER BY answer_count DESC, q.created_at DESC
+                LIMIT %s
+            """
+            return query, (category, limit)
+        
+        query = """
+            SELECT q.question_id, q.question_text, q.category, q.created_at,
+                   COUNT(a.answer_id) as answer_count,
+                   MAX(a.created_at) as last_answered
+            FROM anonymous_questions q
+            LEFT JOIN anonymous_answers a ON q.question_id = a.question_id
+            WHERE q.is_answered = TRUE
+            GROUP BY q.question_id, q.question_text, q.category, q.created_at
+            ORDER BY answer_count DESC, q.created_at DESC
+            LIMIT %s
+        """
+        return query, (limit,)
+    
+    def _prepare_browse_results(self, questions) -> List[Dict]:
+        """Add compatibility fields to browsed questions"""
+        if not questions:
             return []
+        
+        # Add id field for compatibility
+        for q in questions:
+            q['id'] = q['question_id']
+            q['answer_count'] = q['answer_count'] or 0
+        return questions
+    
+    def browse_questions(self, category: str = None, limit: int = 20) -> List[Dict]:
+        """Browse answered questions"""
+        try:
+            query, params = self._browse_query(category, limit)
+            questions = self.db_manager.execute_query(query, params)
+            return self._prepare_browse_results(questions)
             
         except Exception as e:
             print(f"Error browsing questions: {e}")
             return []
     
+    def browse_questions_page(self, category: str = None, after=None, before=None,
+                              page_size: int = 15) -> Page:
+        """Browse answered questions one page at a time, newest first.
+        
+        Unlike :meth:`browse_questions` (most answered first), the order is
+        on indexed columns, so any page is as cheap as the first.
+        """
+        try:
+            if category and category != 'all':
+                page = self.db_manager.execute_page(self.BROWSE_CATEGORY_PAGE, (category,), after, before, page_size)
+            else:
+                page = self.db_manager.execute_page(self.BROWSE_PAGE, None, after, before, page_size)
+            return page.map(self._prepare_browse_results) if page is not None else Page()
+            
+        except Exception as e:
+            print(f"Error browsing questions: {e}")
+            return Page()
+    
+    async def browse_questions_async(self, category: str = None, limit: int = 20) -> List[Dict]:
+        """Browse answered questions without blocking the event loop"""
+        query, params = self._browse_query(category, limit)
+        questions = await async_db_manager.fetch_all(query, params)
+        return self._prepare_browse_results(questions)
+    
     def get_question_with_answers(self, question_id: int) -> Optional[Dict]:
         """Get a specific question with all its answers"""
         try:
@@ -136,7 +218,20 @@ class QnAService:
                 WHERE question_id = %s
             """
             
-            questions = self.db_manager.execute_query(question_query, (question_id,))
+            # Get answers for THIS SPECIFIC question only
+            answers_query = """
+                SELECT answer_id, answer_text, is_verified, helpful_votes, created_at
+                FROM anonymous_answers
+                WHERE question_id = %s
+                ORDER BY is_verified DESC, helpful_votes DESC, created_at ASC
+            """
+            
+            # Fetch both in a single round trip
+            results = self.db_manager.execute_pipeline([
+                (question_query, (question_id,)),
+                (answers_query, (question_id,)),
+            ])
+            questions, answers = results if results else ([], [])
             
             if not questions:
                 print(f"DEBUG: No question found with ID {question_id}")
@@ -153,15 +248,6 @@ class QnAService:
                 question['answers'] = []
                 return question
             
-            # Get answers for THIS SPECIFIC question only
-            answers_query = """
-                SELECT answer_id, answer_text, is_verified, helpful_votes, created_at
-                FROM anonymous_answers
-                WHERE question_id = %s
-                ORDER BY is_verified DESC, helpful_votes DESC, created_at ASC
-            """
-            
-            answers = self.db_manager.execute_query(answers_query, (question_id,))
             print(f"DEBUG: Found {len(answers) if answers else 0} answers for question {question_id}")
             
             # Convert field names for compatibility
@@ -172,7 +258,10 @@ class QnAService:
                 for i, answer in enumerate(answers):
                     answer['id'] = answer['answer_id']
                     answer['answered_by'] = 'expert' if answer['is_verified'] else 'community'
-                    answer['helpful_count'] = answer['helpful_votes'] or 0
+                    # Include votes that are still waiting to be written back
+                    answer['helpful_count'] = ((answer['helpful_votes'] or 0)
+                                               + ANSWER_VOTES.pending(answer['answer_id'])
+                                               + QUESTION_VOTES.pending(question_id))
                     print(f"DEBUG: Answer {i+1}: {answer['answer_text'][:30]}... (by {answer['answered_by']})")
             else:
                 answers = []
@@ -214,12 +303,21 @@ class QnAService:
             }
         ]
         
-        # Add question counts
+        # Add question counts (one grouped query instead of one COUNT per category)
         try:
+            query = """
+                SELECT category, COUNT(*) as count
+                FROM anonymous_questions
+                WHERE is_answered = TRUE
+                GROUP BY category
+            """
+            result = self.db_manager.execute_query(query)
+            if result is None:
+                raise RuntimeError("category counts unavailable")
+            
+            counts = {row['category']: row['count'] for row in result}
             for category in categories:
-                query = "SELECT COUNT(*) as count FROM anonymous_questions WHERE category = %s AND is_answered = TRUE"
-                result = self.db_manager.execute_query(query, (category['name'],))
-                category['question_count'] = result[0]['count'] if result else 0
+                category['question_count'] = counts.get(category['name'], 0)
             
         except Exception as e:
             print(f"Error getting category counts: {e}")
@@ -246,7 +344,8 @@ class QnAService:
                     GROUP BY q.question_id, q.question_text, q.category, q.created_at
                     ORDER BY answer_count DESC, q.created_at DESC
                 """
-                results = self.db_manager.execute_query(query, (search_term, search_term, category))
+                results = self.db_manager.execute_query(query, (search_term, search_term, category),
+                                                        timeout=self.SEARCH_TIMEOUT)
             else:
                 query = """
                     SELECT q.question_id, q.question_text, q.category, q.created_at,
@@ -258,7 +357,8 @@ class QnAService:
                     GROUP BY q.question_id, q.question_text, q.category, q.created_at
                     ORDER BY answer_count DESC, q.created_at DESC
                 """
-                results = self.db_manager.execute_query(query, (search_term, search_term))
+                results = self.db_manager.execute_query(query, (search_term, search_term),
+                                                        timeout=self.SEARCH_TIMEOUT)
             
             if results:
                 # Add id field for compatibility
@@ -295,33 +395,27 @@ class QnAService:
                     return False  # Can't vote on own question
             
             # For now, allow multiple helpful votes (in production, you'd track individual votes)
-            # Update all answers for this question (increase helpful count)
-            update_query = """
-                UPDATE anonymous_answers 
-                SET helpful_votes = helpful_votes + 1 
-                WHERE question_id = %s
-            """
-            result = self.db_manager.execute_query(update_query, (question_id,))
-            
-            return result is not None
+            # Increase the helpful count of all answers for this question (written back in batches)
+            QUESTION_VOTES.increment(question_id)
+            return True
             
         except Exception as e:
             print(f"Error marking answer helpful: {e}")
             return False
     
+    STATS_QUERY = """
+        SELECT 
+            (SELECT COUNT(*) FROM anonymous_questions) as total_questions,
+            (SELECT COUNT(*) FROM anonymous_questions WHERE is_answered = TRUE) as answered_questions,
+            (SELECT COUNT(*) FROM anonymous_questions WHERE is_answered = FALSE) as pending_questions,
+            (SELECT COUNT(*) FROM anonymous_answers) as total_answers,
+            (SELECT COUNT(DISTINCT username) FROM anonymous_questions) as active_users
+    """
+    
     def get_question_stats(self) -> Dict:
         """Get statistics about the Q&A system"""
         try:
-            stats_query = """
-                SELECT 
-                    (SELECT COUNT(*) FROM anonymous_questions) as total_questions,
-                    (SELECT COUNT(*) FROM anonymous_questions WHERE is_answered = TRUE) as answered_questions,
-                    (SELECT COUNT(*) FROM anonymous_questions WHERE is_answered = FALSE) as pending_questions,
-                    (SELECT COUNT(*) FROM anonymous_answers) as total_answers,
-                    (SELECT COUNT(DISTINCT username) FROM anonymous_questions) as active_users
-            """
-            
-            result = self.db_manager.execute_query(stats_query)
+            result = self.db_manager.execute_query(self.STATS_QUERY, timeout=self.STATS_TIMEOUT)
             
             return result[0] if result else {}
             
@@ -329,17 +423,15 @@ class QnAService:
             print(f"Error getting question stats: {e}")
             return {}
     
+    async def get_question_stats_async(self) -> Dict:
+        """Get statistics about the Q&A system without blocking the event loop"""
+        row = await async_db_manager.fetch_one(self.STATS_QUERY)
+        return row if row else {}
+    
     def _update_system_stat(self, stat_name: str, increment: int = 1):
-        """Update system statistics"""
+        """Update system statistics (aggregated and written back in batches)"""
         try:
-            query = """
-                INSERT INTO system_stats (stat_name, stat_value) 
-                VALUES (%s, %s)
-                ON DUPLICATE KEY UPDATE 
-                stat_value = stat_value + %s
-            """
-            
-            self.db_manager.execute_query(query, (stat_name, increment, increment))
+            SYSTEM_STATS.increment(stat_name, increment)
             
         except Exception as e:
             print(f"Error updating system stats: {e}")
@@ -3,8 +3,8 @@ import os
 import textwrap
 from datetime import datetime
 from typing import List, Dict
-from services.qna_service import QnAService
-from utils.helpers import clear_screen, print_colored, get_user_input, format_date
+from services.qna_service import QnAService, ANSWER_VOTES
+from utils.helpers import clear_screen, print_colored, get_user_input, format_date, print_unavailable_notice
 
 class QnAUI:
     def __init__(self, username: str):
@@ -163,22 +163,31 @@ class QnAUI:
         input("\nPress Enter to continue...")
     
     def browse_questions(self):
-        """Browse answered questions"""
+        """Browse answered questions, newest first, one page at a time"""
+        # Cursor the current page was read with, so refresh and returning from a question stay put
+        after = before = None
+        page_number = 1
+        
         while True:
             clear_screen()
             print_colored("📖 Browse Questions & Answers", "cyan", bold=True, center=True)
             print("=" * 60)
             print()
             
-            questions = self.qna_service.browse_questions(limit=15)
+            questions = self.qna_service.browse_questions_page(after=after, before=before, page_size=15)
+            
+            if not questions and not self.qna_service.db_manager.is_available():
+                print_unavailable_notice("Questions")
+                input("\nPress Enter to continue...")
+                return
             
-            if not questions:
+            if not questions and page_number == 1:
                 print_colored("📝 No answered questions available yet.", "yellow", center=True)
                 print_colored("Be the first to ask a question!", "blue", center=True)
                 input("\nPress Enter to continue...")
                 return
             
-            print_colored(f"📋 Showing {len(questions)} most popular questions:", "blue", bold=True)
+            print_colored(f"📋 Newest answered questions, page {page_number}:", "blue", bold=True)
             print()
             
             for i, q in enumerate(questions, 1):
@@ -197,6 +206,10 @@ class QnAUI:
             
             print_colored("Options:", "cyan", bold=True)
             print("• Enter question number to view full Q&A")
+            if questions.has_next:
+                print("• Press 'n' for the next page")
+            if questions.has_previous:
+                print("• Press 'p' for the previous page")
             print("• Press 'r' to refresh")
             print("• Press '0' to go back")
             print()
@@ -207,6 +220,12 @@ class QnAUI:
                 break
             elif choice == 'r':
                 continue
+            elif choice == 'n' and questions.has_next:
+                after, before = questions.next_after, None
+                page_number += 1
+            elif choice == 'p' and questions.has_previous:
+                after, before = None, questions.previous_before
+                page_number -= 1
             else:
                 try:
                     q_num = int(choice)
@@ -216,7 +235,7 @@ class QnAUI:
                         print_colored("❌ Invalid question number.", "red")
                         input("Press Enter to continue...")
                 except ValueError:
-                    print_colored("❌ Please enter a valid number or 'r' to refresh.", "red")
+                    print_colored("❌ Please enter a valid number or option.", "red")
                     input("Press Enter to continue...")
     
     def view_question_detail(self, question_id: int):
@@ -313,10 +332,9 @@ class QnAUI:
     def mark_individual_answer_helpful(self, answer_id: int, username: str) -> bool:
         """Mark a specific answer as helpful"""
         try:
-            # Update the specific answer's helpful count
-            update_query = "UPDATE anonymous_answers SET helpful_votes = helpful_votes + 1 WHERE answer_id = %s"
-            result = self.qna_service.db_manager.execute_query(update_query, (answer_id,))
-            return result is not None
+            # Update the specific answer's helpful count (written back in batches)
+            ANSWER_VOTES.increment(answer_id)
+            return True
         except Exception as e:
             print(f"Error marking individual answer helpful: {e}")
             return False
@@ -0,0 +1,121 @@
+"""
+Typo-tolerant name matching with a trigram index.
+"""
+
+import heapq
+import math
+import time
+import unicodedata
+from collections import Counter
+
+
+def normalize_place(name):
+    """Lookup key of a place name: case, accents and spacing ignored."""
+    if not name:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', name)
+    return ' '.join(''.join(c for c in decomposed if not unicodedata.combining(c)).split()).casefold()
+
+
+def trigrams(text):
+    """Character trigrams of a normalized name, padded so word starts weigh more."""
+    padded = f"  {normalize_place(text)} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """In-memory trigram index returning ranked fuzzy matches for names.
+
+    Each entry is indexed under the trigrams of its name; a search counts the
+    trigrams each entry shares with the query and ranks entries by Dice
+    similarity (``2 * shared / (query trigrams + entry trigrams)``), so
+    "Kigli" still finds Kigali and "King Faysal" King Faisal Hospital.
+    Entries have their own key, so several names may map to the same value
+    (e.g. former town names) and equal names to different values.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def add(self, key, name, value=None):
+        """Index ``name`` under ``key``; searches return ``value`` (default: the name).
+
+        Adding an existing key replaces its entry.
+        """
+        self.remove(key)
+        grams = trigrams(name)
+        if not grams:
+            return
+        self._entries[key] = (grams, name if value is None else value)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for gram in entry[0]:
+            keys = self._postings[gram]
+            keys.discard(key)
+            if not keys:
+                del self._postings[gram]
+
+    def search(self, query, limit=5, min_similarity=0.35, time_budget=0.02, max_candidates=2000):
+        """Best matches for ``query`` as ``[(value, similarity)]``, most similar first.
+
+        Postings are read rarest trigram first. An entry needs at least
+        ``min_similarity * q / (2 - min_similarity)`` of the query's ``q``
+        trigrams to qualify, so only the rarest postings can introduce
+        candidates; the common ones are merely probed for the candidates
+        already found. New candidates stop being added past
+        ``max_candidates``, and ``time_budget`` seconds bound the whole
+        search: the remaining trigrams are skipped, which only lowers
+        similarities, and scoring stops after the best ``limit`` candidates.
+        A value indexed under several names is returned once, with its best
+        similarity.
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+
+        deadline = time.perf_counter() + time_budget
+        postings = sorted((self._postings.get(gram, ()) for gram in grams), key=len)
+        needed = max(1, math.ceil(min_similarity * len(grams) / (2 - min_similarity)))
+        prefix = len(grams) - needed + 1
+
+        shared = Counter()
+        candidates = None
+        for position, keys in enumerate(postings):
+            if candidates is None and position < prefix and len(shared) < max_candidates:
+                shared.update(keys)
+            else:
+                if candidates is None:
+                    candidates = set(shared)
+                shared.update(candidates.intersection(keys))
+            if time.perf_counter() > deadline:
+                break
+
+        # An entry sharing ``count`` trigrams is at best 2 * count / (q + count)
+        # similar, so scoring stops once that falls below the current top ``limit``
+        best = {}
+        floor = min_similarity
+        for position, (key, count) in enumerate(shared.most_common()):
+            if 2 * count / (len(grams) + count) < floor:
+                break
+            if position >= limit and time.perf_counter() > deadline:
+                break
+            entry_grams, value = self._entries[key]
+            similarity = 2 * count / (len(grams) + len(entry_grams))
+            if similarity >= floor and similarity > best.get(value, 0):
+                best[value] = similarity
+                if len(best) >= limit:
+                    floor = heapq.nlargest(limit, best.values())[-1]
+
+        return sorted(best.items(), key=lambda match: -match[1])[:limit]
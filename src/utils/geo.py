@@ -0,0 +1,172 @@
+"""
+Geographic utilities: distances, a nearest-neighbour index and the bundled
+gazetteer of Rwandan towns used to pick a location.
+"""
+
+import csv
+import heapq
+import math
+import os
+from functools import lru_cache
+from src.utils.fuzzy import TrigramIndex, normalize_place
+
+GAZETTEER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'database', 'gazetteer', 'rwanda_towns.csv'
+)
+
+EARTH_RADIUS_KM = 6371.0
+# Kilometres per degree of latitude
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(latitude1, longitude1, latitude2, longitude2):
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(latitude1), math.radians(latitude2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(longitude2 - longitude1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class KDTree:
+    """Static 2-d tree for nearest-neighbour queries over ``(latitude, longitude, item)``.
+
+    Points are projected to a flat kilometre grid around their mean
+    latitude. For a country the size of Rwanda that is accurate to about
+    0.1%, so only near-ties can swap places; reported distances are
+    great-circle distances. The tree is stored implicitly: the median of
+    each range sits in its middle, its halves are the left and right
+    subtrees.
+    """
+
+    def __init__(self, points):
+        points = [(float(latitude), float(longitude), item) for latitude, longitude, item in points]
+        mean_latitude = sum(point[0] for point in points) / len(points) if points else 0.0
+        self._x_scale = KM_PER_DEGREE * math.cos(math.radians(mean_latitude))
+
+        nodes = [(longitude * self._x_scale, latitude * KM_PER_DEGREE, latitude, longitude, item)
+                 for latitude, longitude, item in points]
+        self._build(nodes, 0, len(nodes), 0)
+        self._nodes = nodes
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def _build(self, nodes, low, high, axis):
+        if high - low <= 1:
+            return
+        nodes[low:high] = sorted(nodes[low:high], key=lambda node: node[axis])
+        middle = (low + high) // 2
+        self._build(nodes, low, middle, 1 - axis)
+        self._build(nodes, middle + 1, high, 1 - axis)
+
+    def nearest(self, latitude, longitude, count=5, accept=None, max_km=None):
+        """The ``count`` nearest items as ``[(item, distance_km)]``, closest first.
+
+        ``accept(item)`` filters candidates during the search, so filtered
+        lookups still return ``count`` results when enough exist;
+        ``max_km`` drops anything farther away.
+        """
+        if count <= 0 or not self._nodes:
+            return []
+
+        x, y = longitude * self._x_scale, latitude * KM_PER_DEGREE
+        # Max-heap of the best candidates so far: (-squared distance, position)
+        best = []
+        limit = (max_km * 1.01) ** 2 if max_km is not None else math.inf
+        nodes = self._nodes
+
+        def search(low, high, axis):
+            if low >= high:
+                return
+            middle = (low + high) // 2
+            node = nodes[middle]
+            dx, dy = node[0] - x, node[1] - y
+            distance = dx * dx + dy * dy
+            worst = -best[0][0] if len(best) == count else limit
+            if distance < worst and (accept is None or accept(node[4])):
+                if len(best) == count:
+                    heapq.heapreplace(best, (-distance, middle))
+                else:
+                    heapq.heappush(best, (-distance, middle))
+
+            offset = dx if axis == 0 else dy
+            near, far = ((low, middle), (middle + 1, high)) if offset > 0 else ((middle + 1, high), (low, middle))
+            search(*near, 1 - axis)
+            worst = -best[0][0] if len(best) == count else limit
+            if offset * offset < worst:
+                search(*far, 1 - axis)
+
+        search(0, len(nodes), 0)
+
+        results = []
+        for _, position in best:
+            node = nodes[position]
+            distance = haversine_km(latitude, longitude, node[2], node[3])
+            if max_km is None or distance <= max_km:
+                results.append((node[4], distance))
+        results.sort(key=lambda result: result[1])
+        return results
+
+
+class Town:
+    """A gazetteer entry."""
+
+    __slots__ = ('name', 'district', 'province', 'latitude', 'longitude', 'aliases')
+
+    def __init__(self, name, district, province, latitude, longitude, aliases=()):
+        self.name = name
+        self.district = district
+        self.province = province
+        self.latitude = latitude
+        self.longitude = longitude
+        self.aliases = tuple(aliases)
+
+    def __str__(self):
+        return f"{self.name} ({self.district}, {self.province})"
+
+
+@lru_cache(maxsize=1)
+def load_gazetteer(path=GAZETTEER_PATH):
+    """Towns of the bundled gazetteer, sorted by province and name."""
+    with open(path, encoding='utf-8', newline='') as gazetteer_file:
+        towns = [
+            Town(row['town'], row['district'], row['province'], float(row['latitude']),
+                 float(row['longitude']), [alias for alias in row['aliases'].split('|') if alias])
+            for row in csv.DictReader(gazetteer_file)
+        ]
+    return tuple(sorted(towns, key=lambda town: (town.province, town.name)))
+
+
+def find_town(name):
+    """The gazetteer town called ``name`` (or one of its former names or its district).
+
+    Falls back to the only town whose name starts with ``name``; returns None
+    when there is no match or more than one.
+    """
+    key = normalize_place(name)
+    if not key:
+        return None
+
+    towns = load_gazetteer()
+    for town in towns:
+        if key in (normalize_place(n) for n in (town.name, town.district, *town.aliases)):
+            return town
+
+    candidates = [town for town in towns if normalize_place(town.name).startswith(key)]
+    return candidates[0] if len(candidates) == 1 else None
+
+
+@lru_cache(maxsize=1)
+def _town_index():
+    index = TrigramIndex()
+    for town in load_gazetteer():
+        for name in {town.name, town.district, *town.aliases}:
+            index.add((town.name, name), name, town)
+    return index
+
+
+def match_towns(name, limit=3):
+    """Gazetteer towns spelled like ``name`` as ``[(town, similarity)]``, best first."""
+    return _town_index().search(name, limit)
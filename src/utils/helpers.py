@@ -193,6 +193,12 @@ def print_emergency_contacts():
     ], Fore.RED)
 
 
+def print_unavailable_notice(what):
+    """Explain that ``what`` cannot be loaded while the database is unreachable."""
+    print_warning(f"{what} cannot be loaded right now. Please try again in a few minutes.")
+    print_emergency_contacts()
+
+
 def print_privacy_reminder():
     """Print privacy and safety reminder."""
     print_info_box("🔒 PRIVACY REMINDER", [
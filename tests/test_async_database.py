@@ -0,0 +1,27 @@
+import asyncio
+
+from config.async_database import AsyncDatabaseManager
+from config.database import DatabaseManager
+
+
+def test_sqlite_statements_run_on_the_sync_manager():
+    manager = DatabaseManager()
+    assert manager.connect()
+    db = AsyncDatabaseManager(manager)
+    assert not db.native
+
+    async def scenario():
+        await db.execute("CREATE TABLE notes (note_id INTEGER PRIMARY KEY, body TEXT)")
+        await db.execute_many("INSERT INTO notes (body) VALUES (%s)", [('a',), ('b',)])
+        first = await db.fetch_all("SELECT body FROM notes ORDER BY note_id")
+        # A write through the async manager invalidates the shared result cache
+        await db.execute("UPDATE notes SET body = %s WHERE note_id = %s", ('c', 1))
+        return first, await db.fetch_one("SELECT body FROM notes ORDER BY note_id")
+
+    try:
+        first, row = asyncio.run(scenario())
+    finally:
+        manager.disconnect()
+
+    assert first == [{'body': 'a'}, {'body': 'b'}]
+    assert row == {'body': 'c'}
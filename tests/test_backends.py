@@ -0,0 +1,68 @@
+import pytest
+
+from config.backends import SQLiteBackend, translate_mysql_to_sqlite
+
+
+def test_placeholders_become_question_marks():
+    assert translate_mysql_to_sqlite(
+        "SELECT * FROM users WHERE username = %s AND is_active = %s"
+    ) == "SELECT * FROM users WHERE username = ? AND is_active = ?"
+
+
+def test_string_literals_are_left_alone():
+    assert translate_mysql_to_sqlite(
+        "SELECT * FROM questions WHERE question_text LIKE '%s%' AND category = %s"
+    ) == "SELECT * FROM questions WHERE question_text LIKE '%s%' AND category = ?"
+    assert translate_mysql_to_sqlite(
+        "UPDATE notes SET body = 'it''s NOW() %s', edited_at = NOW() WHERE note_id = %s"
+    ) == "UPDATE notes SET body = 'it''s NOW() %s', edited_at = datetime('now', 'localtime') WHERE note_id = ?"
+
+
+def test_upsert_and_insert_ignore():
+    assert translate_mysql_to_sqlite(
+        "INSERT INTO system_stats (stat_name, stat_value) VALUES (%s, %s) "
+        "ON DUPLICATE KEY UPDATE stat_value = stat_value + VALUES(stat_value)"
+    ) == (
+        "INSERT INTO system_stats (stat_name, stat_value) VALUES (?, ?) "
+        "ON CONFLICT DO UPDATE SET stat_value = stat_value + excluded.stat_value"
+    )
+    assert translate_mysql_to_sqlite("INSERT IGNORE INTO t (a) VALUES (%s)") == "INSERT OR IGNORE INTO t (a) VALUES (?)"
+
+
+def test_upsert_runs_on_sqlite():
+    backend = SQLiteBackend(':memory:')
+    connection = backend.connect()
+    query = backend.translate(
+        "INSERT INTO system_stats (stat_name, stat_value) VALUES (%s, %s) "
+        "ON DUPLICATE KEY UPDATE stat_value = stat_value + VALUES(stat_value)"
+    )
+    connection.execute("DELETE FROM system_stats")
+    connection.execute(query, ('questions_asked', 2))
+    connection.execute(query, ('questions_asked', 3))
+
+    rows = connection.execute("SELECT stat_value FROM system_stats WHERE stat_name = 'questions_asked'").fetchall()
+    connection.close()
+    assert rows == [{'stat_value': 5}]
+
+
+def test_in_memory_database_outlives_its_connections():
+    backend = SQLiteBackend(':memory:')
+    connection = backend.connect()
+    connection.execute("CREATE TABLE notes (body TEXT)")
+    connection.execute("INSERT INTO notes VALUES ('kept')")
+    # As when the pool evicts its last idle connection
+    connection.close()
+
+    connection = backend.connect()
+    try:
+        assert connection.execute("SELECT body FROM notes").fetchall() == [{'body': 'kept'}]
+        assert connection.execute("SELECT COUNT(*) AS n FROM schema_migrations").fetchone()['n'] > 0
+    finally:
+        connection.close()
+
+
+def test_old_sqlite_is_refused(monkeypatch):
+    monkeypatch.setattr('config.backends.sqlite3.sqlite_version_info', (3, 31, 1))
+
+    with pytest.raises(RuntimeError, match="SQLite 3.35.0 or later"):
+        SQLiteBackend(':memory:')
@@ -0,0 +1,83 @@
+import pytest
+
+from config.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from config.database import DatabaseManager
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('config.circuit_breaker.time.monotonic', lambda: now[0])
+    return now
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+    assert not breaker.record_failure()
+    breaker.record_success()
+    assert not breaker.record_failure()
+    assert not breaker.record_failure()
+    assert breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.stats() == {'state': OPEN, 'consecutive_failures': 3, 'trips': 1, 'rejected': 1}
+    assert breaker.seconds_until_retry() == 30
+
+
+def test_one_trial_call_after_the_reset_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    trip(breaker)
+
+    clock[0] += 30
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    # Only one trial at a time
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_failed_trial_opens_again(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    trip(breaker)
+
+    clock[0] += 30
+    assert breaker.allow()
+    assert breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert breaker.stats()['trips'] == 2
+    assert not breaker.allow()
+
+
+def test_zero_threshold_disables_the_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=0)
+    for _ in range(10):
+        assert not breaker.record_failure()
+    assert breaker.allow()
+
+
+def test_open_breaker_fails_queries_fast():
+    manager = DatabaseManager()
+    assert manager.connect()
+    try:
+        manager.breaker.state = OPEN
+        manager.breaker.opened_at = float('inf')
+
+        assert manager.execute_query("SELECT 1 AS one", cached=False) is None
+        assert not manager.is_available()
+        with pytest.raises(CircuitOpenError):
+            with manager.get_connection():
+                pass
+    finally:
+        manager.breaker.record_success()
+        manager.disconnect()
@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from config.connection_pool import ConnectionPool, PoolTimeoutError
+
+
+class Connection:
+    def __init__(self, pool_ref):
+        self.pool_ref = pool_ref
+        self.closed = False
+        self.closed_with_lock_held = None
+
+    def close(self):
+        condition = self.pool_ref[0]._condition
+        acquired = []
+
+        def probe():
+            # A Condition over an RLock: another thread can take it only if no one holds it
+            if condition.acquire(timeout=0.5):
+                condition.release()
+                acquired.append(True)
+
+        thread = threading.Thread(target=probe)
+        thread.start()
+        thread.join()
+        self.closed_with_lock_held = not acquired
+        self.closed = True
+
+
+@pytest.fixture
+def pool():
+    ref = []
+    pool = ConnectionPool(lambda: Connection(ref), min_size=0, max_size=2, idle_timeout=60, checkout_timeout=0.05)
+    ref.append(pool)
+    return pool
+
+
+def expire(pooled):
+    pooled.last_used -= 120
+
+
+@pytest.mark.parametrize('evict', [
+    lambda pool: pool.evict_idle(),
+    lambda pool: pool.release(pool.acquire()),
+])
+def test_idle_connections_are_closed_outside_the_lock(pool, evict):
+    pooled = pool.acquire()
+    pool.release(pooled)
+    expire(pooled)
+
+    evict(pool)
+
+    assert pooled.connection.closed
+    assert pooled.connection.closed_with_lock_held is False
+    assert pool.stats()['evicted'] == 1
+
+
+def test_checkout_times_out_when_the_pool_is_exhausted(pool):
+    first, second = pool.acquire(), pool.acquire()
+
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+    pool.release(first)
+    assert pool.acquire() is first
+    pool.release(second)
+
+
+def test_broken_connections_are_discarded(pool):
+    pooled = pool.acquire()
+    pooled.invalidate()
+    pool.release(pooled)
+
+    assert pooled.connection.closed
+    assert pool.stats()['discarded'] == 1
+    assert pool.acquire() is not pooled
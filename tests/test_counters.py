@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+
+import pytest
+
+from config.counters import CounterAggregator
+
+
+class Unit:
+    def __init__(self):
+        self.statements = []
+        self.committed = False
+
+    def add(self, query, params=None):
+        self.statements.append((query, params))
+
+
+class FlakyManager:
+    """Collects the statements of committed flushes; transactions fail while ``down``."""
+
+    def __init__(self):
+        self.down = False
+        self.committed = []
+
+    @contextmanager
+    def transaction(self):
+        unit = Unit()
+        yield unit
+        if not self.down:
+            unit.committed = True
+            self.committed.extend(unit.statements)
+
+
+@pytest.fixture
+def manager():
+    return FlakyManager()
+
+
+@pytest.fixture
+def aggregator(manager):
+    return CounterAggregator(manager, flush_interval=3600, max_pending=100)
+
+
+def test_increments_are_coalesced_per_key(manager, aggregator):
+    views = aggregator.counter('educational_modules', 'module_id', 'view_count')
+    for module_id in (1, 2, 1, 1):
+        views.increment(module_id)
+
+    assert views.pending(1) == 3
+    assert aggregator.flush()
+    assert len(manager.committed) == 1
+    query, params = manager.committed[0]
+    assert query.startswith("UPDATE educational_modules SET view_count = view_count + CASE module_id")
+    assert params == (1, 3, 2, 1, 1, 2)
+    assert views.pending(1) == 0
+
+
+def test_failed_flush_keeps_increments_for_the_next_one(manager, aggregator):
+    stats = aggregator.counter('system_stats', 'stat_name', 'stat_value', upsert=True)
+    stats.increment('questions_asked')
+    stats.increment('questions_asked', 2)
+
+    manager.down = True
+    assert not aggregator.flush()
+    assert manager.committed == []
+    assert stats.pending('questions_asked') == 3
+    # Pending counts increments, before and after a failed flush
+    assert aggregator.stats()['pending'] == 2
+
+    stats.increment('questions_asked')
+    assert aggregator.stats()['pending'] == 3
+
+    manager.down = False
+    assert aggregator.flush()
+    assert manager.committed[0][1] == ('questions_asked', 4)
+    assert aggregator.stats()['pending'] == 0
+    assert aggregator.stats()['flushes'] == 1
@@ -0,0 +1,53 @@
+import pytest
+
+from config.database import db_manager
+from src.models.educational_catalog import ModuleCatalog
+
+
+@pytest.fixture
+def catalog():
+    db_manager.execute_query("DELETE FROM educational_modules")
+    db_manager.execute_many(
+        "INSERT INTO educational_modules (title, content, category, difficulty_level) VALUES (%s, %s, %s, %s)",
+        [("STIs and testing", "...", 'stds', 'beginner'),
+         ("Pregnancy risks, advanced", "...", 'pregnancy_risks', 'advanced'),
+         ("Early pregnancy", "...", 'pregnancy_risks', 'beginner'),
+         ("Contraception options", "...", 'contraception', 'intermediate')]
+    )
+    yield ModuleCatalog(check_interval=0)
+    db_manager.execute_query("DELETE FROM educational_modules")
+
+
+def test_categories_and_modules_follow_the_enum_order(catalog):
+    assert catalog.categories() == ['pregnancy_risks', 'contraception', 'stds']
+    assert [module.title for module in catalog.modules()] == [
+        "Early pregnancy", "Pregnancy risks, advanced", "Contraception options", "STIs and testing",
+    ]
+
+
+def test_stamp_is_checked_outside_the_lock(catalog, monkeypatch):
+    read_stamp = catalog._read_stamp
+    held = []
+
+    def checked_read_stamp():
+        held.append(catalog._lock.locked())
+        return read_stamp()
+
+    monkeypatch.setattr(catalog, '_read_stamp', checked_read_stamp)
+    catalog.modules()
+    catalog.modules()
+
+    assert held == [False, False]
+    assert catalog.stats()['reloads'] == 1
+
+
+def test_changes_are_seen_on_the_next_check(catalog):
+    assert len(catalog.modules()) == 4
+
+    db_manager.execute_query(
+        "INSERT INTO educational_modules (title, content, category, difficulty_level) VALUES (%s, %s, %s, %s)",
+        ("Puberty basics", "...", 'puberty', 'beginner')
+    )
+
+    assert catalog.categories() == ['pregnancy_risks', 'contraception', 'puberty', 'stds']
+    assert catalog.stats()['reloads'] == 2
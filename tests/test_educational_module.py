@@ -0,0 +1,40 @@
+import pytest
+
+from config.circuit_breaker import DatabaseUnavailableError
+from config.database import db_manager
+from src.models.educational_module import EducationalModule
+
+
+@pytest.fixture
+def listed():
+    """A module as the listings hydrate it: without its deferred columns."""
+    db_manager.execute_query("DELETE FROM educational_modules")
+    db_manager.execute_query(
+        "INSERT INTO educational_modules (title, content, category, difficulty_level) VALUES (%s, %s, %s, %s)",
+        ("Puberty basics", "Bodies change at different times.", 'puberty', 'beginner')
+    )
+    yield EducationalModule.get_all_modules()[0]
+    db_manager.execute_query("DELETE FROM educational_modules")
+
+
+def test_content_loads_on_first_access(listed):
+    assert not listed.is_loaded()
+    assert listed.content == "Bodies change at different times."
+    assert listed.is_loaded()
+
+
+def test_unreadable_content_raises_and_is_retried(listed, monkeypatch):
+    monkeypatch.setattr(db_manager, 'execute_rows', lambda query, params=None, **options: None)
+
+    with pytest.raises(DatabaseUnavailableError):
+        listed.content
+
+    monkeypatch.undo()
+    assert listed.content == "Bodies change at different times."
+
+
+def test_deleted_module_raises_lookup_error(listed):
+    db_manager.execute_query("DELETE FROM educational_modules")
+
+    with pytest.raises(LookupError):
+        listed.content
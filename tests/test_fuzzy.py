@@ -0,0 +1,67 @@
+import pytest
+
+from src.utils.fuzzy import TrigramIndex, normalize_place
+
+
+@pytest.fixture
+def towns():
+    index = TrigramIndex()
+    for key, name in enumerate(('Kigali', 'Musanze', 'Huye', 'Rubavu', 'Nyagatare', 'Rusizi')):
+        index.add(key, name)
+    return index
+
+
+def test_normalize_place_ignores_case_accents_and_spacing():
+    assert normalize_place('  Muhimá   Hospital ') == 'muhima hospital'
+    assert normalize_place(None) == ''
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('Kigli', 'Kigali'),
+    ('musanzi', 'Musanze'),
+    ('RUBAVU', 'Rubavu'),
+    ('Nyagatre', 'Nyagatare'),
+])
+def test_misspelled_names_rank_first(towns, query, expected):
+    assert towns.search(query)[0][0] == expected
+
+
+def test_results_are_ranked_and_limited(towns):
+    matches = towns.search('Rusizi', limit=2)
+
+    assert matches[0] == ('Rusizi', 1.0)
+    assert len(matches) <= 2
+    assert [similarity for _, similarity in matches] == sorted((s for _, s in matches), reverse=True)
+
+
+def test_unrelated_and_empty_queries_match_nothing(towns):
+    assert towns.search('Zzyzx') == []
+    assert towns.search('   ') == []
+
+
+def test_add_replaces_and_remove_forgets(towns):
+    towns.add(0, 'Kigali City')
+    assert len(towns) == 6
+    assert towns.search('Kigali City')[0] == ('Kigali City', 1.0)
+
+    towns.remove(0)
+    assert 0 not in towns
+    assert all(value != 'Kigali City' for value, _ in towns.search('Kigali'))
+
+
+def test_value_under_several_names_is_returned_once():
+    index = TrigramIndex()
+    index.add('butare', 'Butare', 'Huye')
+    index.add('huye', 'Huye', 'Huye')
+
+    assert [value for value, _ in index.search('Butare')] == ['Huye']
+
+
+def test_candidate_cap_still_returns_matches():
+    index = TrigramIndex()
+    for key in range(5000):
+        index.add(key, f"Health Centre {key}")
+
+    matches = index.search('Health Centre 4242', limit=3, max_candidates=100, time_budget=1)
+
+    assert len(matches) == 3
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from src.utils.geo import KDTree, haversine_km
+
+
+@pytest.fixture
+def points():
+    rng = random.Random(7)
+    # Scattered over Rwanda's bounding box
+    return [(rng.uniform(-2.8, -1.05), rng.uniform(28.85, 30.9), item) for item in range(500)]
+
+
+def brute_force(points, latitude, longitude, count, accept=None, max_km=None):
+    distances = sorted((haversine_km(latitude, longitude, lat, lon), item) for lat, lon, item in points
+                       if accept is None or accept(item))
+    return [(item, distance) for distance, item in distances
+            if max_km is None or distance <= max_km][:count]
+
+
+def test_haversine_kigali_to_huye():
+    assert haversine_km(-1.9441, 30.0619, -2.5967, 29.7394) == pytest.approx(80.5, abs=1)
+
+
+@pytest.mark.parametrize('latitude, longitude', [(-1.9441, 30.0619), (-2.5967, 29.7394), (-1.0, 31.5)])
+def test_nearest_matches_brute_force(points, latitude, longitude):
+    expected = brute_force(points, latitude, longitude, 10)
+    found = KDTree(points).nearest(latitude, longitude, count=10)
+
+    assert [item for item, _ in found] == [item for item, _ in expected]
+    assert [distance for _, distance in found] == pytest.approx([distance for _, distance in expected])
+
+
+def test_filter_and_radius(points):
+    tree = KDTree(points)
+    even = lambda item: item % 2 == 0
+
+    found = tree.nearest(-1.9441, 30.0619, count=5, accept=even, max_km=40)
+
+    assert [item for item, _ in found] == [item for item, _ in brute_force(points, -1.9441, 30.0619, 5, even, 40)]
+    assert all(distance <= 40 for _, distance in found)
+
+
+def test_empty_tree_and_zero_count(points):
+    assert KDTree([]).nearest(-1.9441, 30.0619) == []
+    assert KDTree(points).nearest(-1.9441, 30.0619, count=0) == []
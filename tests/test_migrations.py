@@ -0,0 +1,43 @@
+import pytest
+
+from config.database import DatabaseManager
+from config.migrations import MigrationError, MigrationRunner, added_columns
+
+
+@pytest.fixture
+def manager():
+    manager = DatabaseManager()
+    assert manager.connect()
+    yield manager
+    manager.disconnect()
+
+
+def test_added_columns():
+    assert added_columns(
+        "ALTER TABLE support_resources ADD COLUMN latitude DECIMAL(9, 6) NULL, ADD COLUMN longitude DECIMAL(9, 6) NULL"
+    ) == ('support_resources', ['latitude', 'longitude'])
+    assert added_columns("ALTER TABLE system_stats ADD UNIQUE KEY unique_stat_name (stat_name)") is None
+    assert added_columns("ALTER TABLE t ADD COLUMN a INT, ADD INDEX idx_a (a)") is None
+    assert added_columns("CREATE INDEX idx_a ON t (a)") is None
+
+
+def test_rerun_after_a_lost_version_record_skips_existing_columns(manager):
+    """A run that failed after 005's ALTER but before it was recorded can be repeated."""
+    with manager.get_connection() as connection:
+        connection.execute("DELETE FROM schema_migrations WHERE version >= 5")
+        messages = []
+
+        applied = MigrationRunner(manager.backend, connection, log=messages.append).run()
+
+        assert [migration.version for migration in applied] == [5, 6]
+        assert "  skip: columns latitude on support_resources already exist" in messages
+        assert "  skip: columns longitude on support_resources already exist" in messages
+
+
+def test_partially_added_columns_stop_the_run(manager):
+    with manager.get_connection() as connection:
+        connection.execute("CREATE TABLE places (place_id INTEGER PRIMARY KEY, latitude REAL)")
+        runner = MigrationRunner(manager.backend, connection, log=None)
+
+        with pytest.raises(MigrationError, match="Only some of the columns"):
+            runner._columns_exist('places', ['latitude', 'longitude'])
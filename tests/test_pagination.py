@@ -0,0 +1,104 @@
+import sqlite3
+
+import pytest
+
+from config.pagination import KeysetQuery
+from src.models.local_services import SupportResource
+
+# support_resources.type as MySQL declares (and sorts) the ENUM
+TYPE_ORDER = ('clinic', 'ngo', 'hotline', 'counseling_center')
+
+
+def enum_order(left, right):
+    return (TYPE_ORDER.index(left) > TYPE_ORDER.index(right)) - (TYPE_ORDER.index(left) < TYPE_ORDER.index(right))
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(':memory:')
+    connection.create_collation('enum_order', enum_order)
+    connection.execute("""
+        CREATE TABLE support_resources (
+            resource_id INTEGER PRIMARY KEY, name TEXT NOT NULL,
+            type TEXT COLLATE enum_order NOT NULL, description TEXT, phone TEXT, email TEXT,
+            address TEXT, city TEXT, country TEXT, website TEXT, is_available_24_7 INTEGER,
+            latitude REAL, longitude REAL, created_at TEXT
+        )
+    """)
+    yield connection
+    connection.close()
+
+
+def fetch_page(connection, keyset, after=None, before=None, page_size=3):
+    sql, params = keyset.query(after, before, page_size)
+    cursor = connection.execute(sql.replace('%s', '?'), params)
+    columns = [column[0] for column in cursor.description]
+    rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    return keyset.page(rows, after, before, page_size)
+
+
+def walk(connection, keyset, page_size=3):
+    seen, after = [], None
+    while True:
+        page = fetch_page(connection, keyset, after=after, page_size=page_size)
+        seen += [row['resource_id'] for row in page]
+        if not page.has_next:
+            return seen, page
+        after = page.next_after
+
+
+def test_directory_pages_across_type_boundaries(connection):
+    rows = [(f"{resource_type.title()} {i}", resource_type, city)
+            for city in (None, 'Huye', 'Kigali')
+            for resource_type in TYPE_ORDER
+            for i in range(2)]
+    connection.executemany("INSERT INTO support_resources (name, type, city) VALUES (?, ?, ?)", rows)
+    expected = [row[0] for row in connection.execute(
+        "SELECT resource_id FROM support_resources "
+        "ORDER BY COALESCE(city, ''), CAST(type AS CHAR(20)), name, resource_id"
+    )]
+
+    for page_size in (1, 2, 3, 5):
+        seen, last = walk(connection, SupportResource.ALL_RESOURCES_PAGE, page_size)
+        assert seen == expected
+
+        back, page = [row['resource_id'] for row in last], last
+        while page.has_previous:
+            page = fetch_page(connection, SupportResource.ALL_RESOURCES_PAGE,
+                              before=page.previous_before, page_size=page_size)
+            back = [row['resource_id'] for row in page] + back
+        assert back == expected
+
+
+def test_directory_key_never_seeks_on_the_raw_enum():
+    key = SupportResource.ALL_RESOURCES_PAGE.key
+    assert 'type' not in key
+    sql, _ = SupportResource.ALL_RESOURCES_PAGE.query(after=('', 'clinic', 'x', 1))
+    order_by = sql.split('ORDER BY')[1]
+    for expression in key:
+        assert expression in order_by
+
+
+def test_seek_condition_is_lexicographic():
+    keyset = KeysetQuery("SELECT a, b, id FROM t", ('a', 'b', 'id'))
+    sql, params = keyset.query(after=(1, 2, 3), page_size=10)
+    assert "a <= %s AND (a < %s OR (b <= %s AND (b < %s OR (id < %s))))" in sql
+    assert sql.rstrip().endswith("ORDER BY a DESC, b DESC, id DESC\nLIMIT %s")
+    assert params == (1, 1, 2, 2, 3, 11)
+
+
+def test_page_flags_and_cursors():
+    keyset = KeysetQuery("SELECT id FROM t", ('id',), descending=False)
+    page = keyset.page([{'id': 1}, {'id': 2}, {'id': 3}], page_size=2)
+    assert [row['id'] for row in page] == [1, 2]
+    assert page.has_next and not page.has_previous
+    assert page.next_after == (2,) and page.previous_before == (1,)
+
+    backwards = keyset.page([{'id': 4}, {'id': 3}], before=(5,), page_size=2)
+    assert [row['id'] for row in backwards] == [3, 4]
+    assert backwards.has_next and not backwards.has_previous
+
+    with pytest.raises(ValueError):
+        keyset.query(after=(1,), before=(2,))
+    with pytest.raises(ValueError):
+        KeysetQuery("SELECT id FROM t", ('a', 'id'), columns=('a',))
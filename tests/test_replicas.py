@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+
+from config.connection_pool import PoolTimeoutError
+from config.database import DatabaseManager, DatabaseUnavailableError
+from config.replicas import Replica, ReplicaSet
+
+
+class FailingPool:
+    """A replica pool whose checkouts fail with ``error``."""
+
+    def __init__(self, error):
+        self.error = error
+        self.acquired = 0
+
+    def acquire(self, timeout=None):
+        self.acquired += 1
+        raise self.error
+
+    def close_all(self):
+        pass
+
+
+@pytest.fixture
+def manager():
+    manager = DatabaseManager()
+    manager.read_retries = 0
+    assert manager.connect()
+    yield manager
+    manager.disconnect()
+
+
+def attach_replica(manager, pool):
+    """Route reads to one healthy replica that is not due for a probe."""
+    replica = Replica('replica', 3306, pool, probe_factory=lambda: None)
+    replica.healthy = True
+    replica.checked_at = time.monotonic()
+    manager.replicas = ReplicaSet([replica], lag_probe=lambda connection: 0, check_interval=3600)
+    return replica
+
+
+@pytest.mark.parametrize('error', [
+    PoolTimeoutError("No database connection available"),
+    DatabaseUnavailableError("Cannot connect to the database"),
+])
+def test_read_falls_back_to_primary_when_replica_checkout_fails(manager, error):
+    pool = FailingPool(error)
+    replica = attach_replica(manager, pool)
+
+    assert manager.execute_query("SELECT 1 AS one", cached=False) == [{'one': 1}]
+    assert pool.acquired == 1
+    assert not replica.healthy
+    assert replica.failures == 1
+
+    # Down until its next probe: later reads go straight to the primary
+    assert manager.execute_query("SELECT 2 AS two", cached=False) == [{'two': 2}]
+    assert pool.acquired == 1
+
+
+def test_streaming_read_falls_back_to_primary(manager):
+    pool = FailingPool(PoolTimeoutError("No database connection available"))
+    replica = attach_replica(manager, pool)
+
+    batches = list(manager.iter_query_batches("SELECT 1 AS one"))
+
+    assert batches == [[{'one': 1}]]
+    assert not replica.healthy
+
+
+def test_unhealthy_replica_is_probed_in_the_background():
+    release = threading.Event()
+    probed = []
+
+    def lag_probe(connection):
+        release.wait(5)
+        probed.append(connection)
+        return 0.5
+
+    replica = Replica('replica', 3306, FailingPool(None), probe_factory=lambda: 'probe')
+    replicas = ReplicaSet([replica], lag_probe=lag_probe)
+
+    # The read does not wait for the first probe; until it says so the replica is not used
+    assert replicas.choose() is None
+    release.set()
+    for _ in range(100):
+        if replica.healthy:
+            break
+        time.sleep(0.01)
+
+    assert probed == ['probe']
+    assert replicas.choose() is replica
+    assert replica.lag_seconds == 0.5
@@ -0,0 +1,39 @@
+import pytest
+
+from config.database import db_manager
+from src.models.resource_directory import ResourceDirectory
+
+
+@pytest.fixture
+def directory():
+    db_manager.execute_query("DELETE FROM support_resources")
+    db_manager.bulk_insert(
+        'support_resources', ('name', 'type', 'city', 'is_available_24_7'),
+        [("Isange One Stop Centre", 'counseling_center', 'Kigali', True),
+         ("Youth Helpline", 'hotline', 'Kigali', True),
+         ("Health Development Initiative", 'ngo', 'Kigali', False),
+         ("King Faisal Hospital", 'clinic', 'Kigali', True),
+         ("Huye Counseling Services", 'counseling_center', 'Huye', False)]
+    )
+    yield ResourceDirectory(check_interval=0)
+    db_manager.execute_query("DELETE FROM support_resources")
+
+
+def test_types_follow_the_enum_order(directory):
+    assert directory.types() == ['clinic', 'ngo', 'hotline', 'counseling_center']
+
+
+def test_directory_order_ranks_types_by_the_enum(directory):
+    assert [resource.name for resource in directory.find(city='Kigali')] == [
+        "King Faisal Hospital", "Health Development Initiative", "Youth Helpline", "Isange One Stop Centre",
+    ]
+    assert [resource.resource_type for resource in directory.open_24_7()] == [
+        'clinic', 'hotline', 'counseling_center',
+    ]
+
+
+def test_match_names_finds_misspelled_resources(directory):
+    matches = directory.match_names("King Faysal", limit=1)
+
+    assert [resource.name for resource, _ in matches] == ["King Faisal Hospital"]
+    assert directory.match_cities("Kigli")[0][0] == 'Kigali'
@@ -0,0 +1,412 @@
+# EXPLAIN audit: execution plans of every SQL statement the application runs
+#
+# Usage (from the project root):
+#     python tools/explain_audit.py [--rows N] [--no-seed] [--update-baseline]
+#
+# Collects the SQL string literals in src/models, src/services,
+# src/admin_tool.py and src/ui/qna_ui.py, plus the first and a later page of
+# each KeysetQuery listing, EXPLAINs each SELECT, UPDATE and
+# DELETE against a seeded database and prints a report ranked by estimated
+# cost: full table scans, full index scans, filesorts, temporary tables and
+# secondary indexes that no statement uses (indexes that only back foreign
+# keys show up there too).
+#
+# Full scans are compared with the baseline in tools/explain_baseline.json and
+# the exit status is 1 when a new one appears, so the audit can gate CI. After
+# reviewing an accepted scan, record it with --update-baseline.
+#
+# Runs on a throwaway in-memory SQLite database unless DB_BACKEND is set. The
+# seeding step fills any table with fewer than --rows rows, so against MySQL
+# point DB_NAME at a scratch database.
+
+import argparse
+import ast
+import json
+import os
+import re
+import sys
+from datetime import date, timedelta
+
+sys.path.append('.')
+os.environ.setdefault('DB_BACKEND', 'sqlite')
+os.environ.setdefault('DB_SQLITE_PATH', ':memory:')
+os.environ.setdefault('DB_QUERY_STATS', 'off')
+os.environ.setdefault('DB_RESULT_CACHE_SIZE', '0')
+
+from config.backends import DATABASE_ERRORS
+from config.database import db_manager
+from config.pagination import KeysetQuery
+from config.query_stats import fingerprint
+
+SOURCES = ('src/models', 'src/services', 'src/admin_tool.py', 'src/ui/qna_ui.py')
+BASELINE_PATH = os.path.join('tools', 'explain_baseline.json')
+
+# Statements with a plan worth auditing; the keywords are upper case in this
+# code base, which keeps docstrings like "Update session status." out
+SQL_STATEMENT = re.compile(r'^\s*(?:SELECT\b.*?\bFROM\s+\w|UPDATE\s+\w+\s+SET\b|DELETE\s+FROM\s+\w)', re.DOTALL)
+_PARAMETER = re.compile(r'(?:\b(LIKE|LIMIT|OFFSET)\s+)?%s')
+_LIST_PLACEHOLDER = re.compile(r'\{\w+\}')
+_TABLE_REFERENCE = re.compile(
+    r'\b(?:FROM|JOIN|UPDATE)\s+(\w+)'
+    r'(?:\s+(?:AS\s+)?(?!(?:WHERE|JOIN|LEFT|RIGHT|INNER|CROSS|ON|SET|GROUP|ORDER|LIMIT|USING)\b)(\w+))?',
+    re.IGNORECASE
+)
+
+CATEGORIES = ('general', 'health', 'emotional_support', 'resources', 'other')
+MODULE_CATEGORIES = ('reproductive_health', 'pregnancy_risks', 'contraception', 'puberty', 'stds')
+RESOURCE_TYPES = ('clinic', 'ngo', 'hotline', 'counseling_center')
+CITIES = ('Kigali', 'Huye', 'Musanze', 'Rubavu', 'Rwamagana', 'Muhanga')
+SESSION_STATUSES = ('scheduled', 'completed', 'cancelled', 'rescheduled')
+
+
+class Statement:
+    """One distinct SQL text, where it appears and what EXPLAIN said about it."""
+
+    def __init__(self, query):
+        self.query = query
+        self.locations = []
+        self.steps = []
+        self.error = None
+        self.score = 0
+
+    @property
+    def name(self):
+        return self.locations[0][1]
+
+    @property
+    def fingerprint_id(self):
+        return fingerprint(self.query)[0]
+
+    @property
+    def tables(self):
+        """Map the table names and aliases used in the query to table names."""
+        tables = {}
+        for table, alias in _TABLE_REFERENCE.findall(self.query):
+            tables[table] = table
+            if alias:
+                tables[alias] = table
+        return tables
+
+    def steps_with(self, access):
+        return [step for step in self.steps if step['access'] == access and step['table']]
+
+    @property
+    def filesort(self):
+        return any(step['filesort'] for step in self.steps)
+
+    @property
+    def temporary(self):
+        return any(step['temporary'] for step in self.steps)
+
+    def baseline_keys(self):
+        """``fingerprint:table`` for each table this statement scans in full."""
+        return {f"{self.fingerprint_id}:{step['table']}" for step in self.steps_with('scan')}
+
+
+class _SQLCollector(ast.NodeVisitor):
+    """Find SQL string constants in a module, labelled with their enclosing scope.
+
+    ``KeysetQuery(...)`` definitions are built and contribute the SQL of a
+    first and a later page instead of their bare SELECT fragment.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.scope = []
+        self.found = []
+        # Literal constants by assigned name, to resolve KeysetQuery arguments
+        self.constants = {}
+        self.fragments = set()
+
+    def _visit_scope(self, node):
+        self.scope.append(node.name)
+        self.generic_visit(node)
+        self.scope.pop()
+
+    visit_ClassDef = visit_FunctionDef = visit_AsyncFunctionDef = _visit_scope
+
+    def visit_Assign(self, node):
+        # Name class-level query constants after the attribute they are stored in
+        if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            try:
+                self.constants[node.targets[0].id] = ast.literal_eval(node.value)
+            except ValueError:
+                pass
+            self.scope.append(node.targets[0].id)
+            self.generic_visit(node)
+            self.scope.pop()
+        else:
+            self.generic_visit(node)
+
+    def visit_Call(self, node):
+        if not (isinstance(node.func, ast.Name) and node.func.id == 'KeysetQuery'):
+            self.generic_visit(node)
+            return
+
+        def value(argument):
+            if isinstance(argument, ast.Name):
+                return self.constants[argument.id]
+            return ast.literal_eval(argument)
+
+        try:
+            select, key = value(node.args[0]), value(node.args[1])
+            if isinstance(key, str):
+                raise ValueError
+            options = {keyword.arg: value(keyword.value) for keyword in node.keywords}
+        except (IndexError, KeyError, ValueError):
+            print(f"  ? {self.path}:{node.lineno}: KeysetQuery arguments are not literals, skipped")
+            return
+
+        # A select kept in its own constant is only a fragment of the real queries
+        self.fragments.add(select)
+        keyset = KeysetQuery(select, key, **options)
+        location = f"{self.path}:{node.lineno}"
+        scope = '.'.join(self.scope) or '<module>'
+        for label, after in (('first page', None), ('later page', ('1',) * len(keyset.key))):
+            query, _ = keyset.query(after=after)
+            self.found.append((query, location, f"{scope} ({label})"))
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, str) and SQL_STATEMENT.match(node.value):
+            # ``IN ({ids})`` templates get one placeholder per value; audit them with one
+            query = _LIST_PLACEHOLDER.sub('%s', node.value)
+            self.found.append((query, f"{self.path}:{node.lineno}", '.'.join(self.scope) or '<module>'))
+
+
+def collect_statements(sources=SOURCES):
+    """Return the distinct SQL statements found in ``sources``, in file order."""
+    paths = []
+    for source in sources:
+        if os.path.isdir(source):
+            paths.extend(sorted(
+                os.path.join(source, name) for name in os.listdir(source)
+                if name.endswith('.py') and name != '__init__.py'
+            ))
+        else:
+            paths.append(source)
+
+    statements = {}
+    for path in paths:
+        with open(path, encoding='utf-8') as source_file:
+            collector = _SQLCollector(path)
+            collector.visit(ast.parse(source_file.read(), path))
+
+        for query, location, scope in collector.found:
+            if query in collector.fragments:
+                continue
+            key = ' '.join(query.split())
+            statement = statements.setdefault(key, Statement(query))
+            statement.locations.append((location, scope))
+    return list(statements.values())
+
+
+def sample_params(query):
+    """Plausible values for the ``%s`` placeholders of ``query``.
+
+    Values are strings, which both backends compare against any column type
+    without defeating an index; LIMIT/OFFSET need integers and LIKE gets a
+    pattern shaped like the ones the services build.
+    """
+    params = []
+    for keyword in _PARAMETER.findall(query):
+        keyword = keyword.upper()
+        if keyword == 'LIKE':
+            params.append('%a%')
+        elif keyword in ('LIMIT', 'OFFSET'):
+            params.append(20)
+        else:
+            params.append('1')
+    return tuple(params)
+
+
+def seed(rows):
+    """Fill the application tables up to roughly ``rows`` rows of synthetic data."""
+    def count(table):
+        return db_manager.execute_query(f"SELECT COUNT(*) AS n FROM {table}")[0]['n']
+
+    user_count = max(10, rows // 10)
+    module_count = max(10, rows // 100)
+    today = date.today()
+    loaded = []
+
+    def load(table, columns, target, generate):
+        existing = count(table)
+        if existing >= target:
+            return
+        result = db_manager.bulk_insert(table, columns, generate(existing, target), ignore=True)
+        print(f"  seeded {table}: {result.rows} rows")
+        loaded.append(table)
+
+    load('users', ('username', 'age'), user_count,
+         lambda start, end: ((f"audit{i}", 13 + i % 7) for i in range(start, end)))
+    load('educational_modules', ('title', 'content', 'category', 'difficulty_level'), module_count,
+         lambda start, end: ((f"Audit module {i}", "Synthetic module content.",
+                              MODULE_CATEGORIES[i % len(MODULE_CATEGORIES)], 'beginner')
+                             for i in range(start, end)))
+    load('support_resources', ('name', 'type', 'description', 'phone', 'city', 'is_available_24_7'),
+         max(10, rows // 10),
+         lambda start, end: ((f"Audit resource {i}", RESOURCE_TYPES[i % len(RESOURCE_TYPES)],
+                              "Synthetic support resource.", f"+250 788 {i:06d}",
+                              CITIES[i % len(CITIES)], i % 7 == 0) for i in range(start, end)))
+    load('anonymous_questions', ('username', 'question_text', 'category', 'is_answered'), rows,
+         lambda start, end: ((f"audit{i % user_count}", f"Synthetic question {i}?",
+                              CATEGORIES[i % len(CATEGORIES)], i % 3 != 0) for i in range(start, end)))
+    answered = [row['question_id'] for row in db_manager.iter_query(
+        "SELECT question_id FROM anonymous_questions WHERE is_answered = TRUE")]
+    load('anonymous_answers', ('question_id', 'answer_text', 'is_verified', 'helpful_votes'), len(answered),
+         lambda start, end: ((question_id, "Synthetic answer.", True, i % 5)
+                             for i, question_id in enumerate(answered[start:end])))
+    load('counseling_sessions', ('username', 'client_name', 'topic', 'preferred_date', 'status'),
+         max(10, rows // 10),
+         lambda start, end: ((f"audit{i % user_count}", f"Client {i}", "Synthetic topic",
+                              today + timedelta(days=i % 90), SESSION_STATUSES[i % len(SESSION_STATUSES)])
+                             for i in range(start, end)))
+
+    module_ids = [row['module_id'] for row in db_manager.execute_query(
+        "SELECT module_id FROM educational_modules ORDER BY module_id LIMIT 3")]
+    load('user_progress', ('username', 'module_id', 'completed', 'score'), user_count * len(module_ids),
+         lambda start, end: ((f"audit{i}", module_id, i % 2 == 0, i % 100)
+                             for i in range(user_count) for module_id in module_ids))
+
+    if loaded:
+        db_manager.analyze(loaded)
+
+
+def audit(statements, row_counts):
+    """EXPLAIN every statement and score it by the rows its plan reads badly."""
+    for statement in statements:
+        try:
+            steps = db_manager.explain(statement.query, sample_params(statement.query))
+        except DATABASE_ERRORS as e:
+            statement.error = str(e)
+            continue
+
+        tables = statement.tables
+        for step in steps:
+            if step['table']:
+                step['table'] = tables.get(step['table'], step['table'])
+            if step['rows'] is None and step['table']:
+                step['rows'] = row_counts.get(step['table'], 0)
+        statement.steps = steps
+
+        # Cost of the scans, plus the rows that have to be sorted or materialized
+        largest = max((step['rows'] or 0 for step in steps), default=0)
+        statement.score = sum(step['rows'] for step in statement.steps_with('scan'))
+        statement.score += sum(step['rows'] for step in statement.steps_with('index scan')) // 2
+        statement.score += largest * (statement.filesort + statement.temporary)
+
+
+def print_report(statements, unused_indexes):
+    flagged = sorted((s for s in statements if s.score or s.filesort or s.temporary),
+                     key=lambda s: s.score, reverse=True)
+
+    print(f"\nEXPLAIN audit on {db_manager.backend.label}: {len(statements)} statements, "
+          f"{len(flagged)} with findings\n")
+
+    for rank, statement in enumerate(flagged, 1):
+        findings = [f"full scan of {step['table']} (~{step['rows']:,} rows)"
+                    for step in statement.steps_with('scan')]
+        findings += [f"full index scan of {step['table']} using {step['index']}"
+                     for step in statement.steps_with('index scan')]
+        if statement.filesort:
+            findings.append("filesort")
+        if statement.temporary:
+            findings.append("temporary table")
+
+        location, scope = statement.locations[0]
+        print(f"{rank:>3}. [{statement.score:,}] {scope} ({location})")
+        for other_location, other_scope in statement.locations[1:]:
+            print(f"       also {other_scope} ({other_location})")
+        print(f"       {'; '.join(findings)}")
+        print(f"       {' '.join(statement.query.split())[:110]}")
+
+    failed = [s for s in statements if s.error]
+    if failed:
+        print(f"\nCould not EXPLAIN {len(failed)} statement(s):")
+        for statement in failed:
+            print(f"  {statement.name} ({statement.locations[0][0]}): {statement.error}")
+
+    print("\nSecondary indexes no audited statement uses:")
+    for table, index in unused_indexes:
+        print(f"  {table}.{index}")
+    if not unused_indexes:
+        print("  (none)")
+
+
+def load_baseline(path):
+    try:
+        with open(path, encoding='utf-8') as baseline_file:
+            return json.load(baseline_file)
+    except FileNotFoundError:
+        return {}
+
+
+def check_baseline(statements, baseline, backend):
+    """Print full scans missing from the baseline; return True if there are none."""
+    current = {key: statement.name for statement in statements for key in statement.baseline_keys()}
+    if backend not in baseline:
+        print(f"\nNo {backend} baseline in {BASELINE_PATH}; run with --update-baseline to record "
+              f"the {len(current)} current full scan(s)")
+        return True
+
+    accepted = baseline[backend]
+    new = sorted(key for key in current if key not in accepted)
+    resolved = sorted(key for key in accepted if key not in current)
+
+    if resolved:
+        print(f"\n{len(resolved)} baseline full scan(s) no longer occur; run with --update-baseline:")
+        for key in resolved:
+            print(f"  {key} ({accepted[key]})")
+    if new:
+        print(f"\n✗ {len(new)} new full scan(s) not in the baseline:")
+        for key in new:
+            print(f"  {key} ({current[key]})")
+        return False
+
+    print("\n✓ No new full scans")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN every SQL statement of the application")
+    parser.add_argument('--rows', type=int, default=20000, help="rows to seed the largest tables with")
+    parser.add_argument('--no-seed', action='store_true', help="audit the database as it is")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="accepted full scans (JSON)")
+    parser.add_argument('--update-baseline', action='store_true', help="accept the current full scans")
+    args = parser.parse_args()
+
+    if not db_manager.connect():
+        return 2
+
+    try:
+        if not args.no_seed:
+            seed(args.rows)
+
+        statements = collect_statements()
+        tables = sorted({table for s in statements for table in s.tables.values()})
+        row_counts = {
+            table: db_manager.execute_query(f"SELECT COUNT(*) AS n FROM {table}")[0]['n'] for table in tables
+        }
+        audit(statements, row_counts)
+
+        used = {(step['table'], step['index']) for s in statements for step in s.steps if step['index']}
+        unused = [index for index in db_manager.secondary_indexes() if index not in used]
+        print_report(statements, unused)
+
+        backend = db_manager.backend.name
+        baseline = load_baseline(args.baseline)
+        if args.update_baseline:
+            baseline[backend] = {key: s.name for s in statements for key in sorted(s.baseline_keys())}
+            with open(args.baseline, 'w', encoding='utf-8') as baseline_file:
+                json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+                baseline_file.write("\n")
+            print(f"\n✓ Recorded {len(baseline[backend])} full scan(s) in {args.baseline}")
+            return 0
+
+        return 0 if check_baseline(statements, baseline, backend) else 1
+    finally:
+        db_manager.disconnect()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
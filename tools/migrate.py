@@ -0,0 +1,73 @@
+# Schema migrations: apply database/migrations/NNN_*.sql in version order
+#
+# Usage (from the project root):
+#     python tools/migrate.py            # apply pending migrations
+#     python tools/migrate.py --dry-run  # print what would run
+#     python tools/migrate.py --status   # list applied and pending migrations
+#
+# Applied versions are recorded with a checksum in schema_migrations. Index
+# builds on MySQL use ALGORITHM=INPLACE, LOCK=NONE, so this can run against a
+# live database. The SQLite backend applies pending migrations by itself when
+# it opens its first connection.
+
+import argparse
+import sys
+
+sys.path.append('.')
+
+from config.backends import DATABASE_ERRORS
+from config.database import db_manager
+from config.migrations import MigrationError, MigrationRunner, load_migrations
+
+
+def print_status(runner):
+    applied = runner.applied()
+    for migration in load_migrations(runner.backend.name, runner.directory):
+        recorded = applied.get(migration.version)
+        if recorded is None:
+            state = "pending"
+        elif recorded[1] != migration.checksum:
+            state = "applied, MODIFIED since"
+        else:
+            state = "applied"
+        print(f"  {migration.version:03d} {migration.name:<40} {state}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply pending schema migrations")
+    parser.add_argument('--dry-run', action='store_true', help="print the statements without running them")
+    parser.add_argument('--status', action='store_true', help="list applied and pending migrations")
+    args = parser.parse_args()
+
+    backend = db_manager.backend
+    # This tool decides what runs; don't let the SQLite backend migrate on connect
+    backend.auto_migrate = False
+
+    try:
+        # Index builds and data migrations may run for minutes: no socket timeout
+        connection = backend.connect(socket_timeout=None)
+    except DATABASE_ERRORS as e:
+        print(f"✗ Error connecting to {backend.label}: {e}")
+        return 2
+
+    try:
+        runner = MigrationRunner(backend, connection)
+        print(f"Migrations on {backend.label}:")
+        if args.status:
+            print_status(runner)
+            return 0
+
+        applied = runner.run(dry_run=args.dry_run)
+        if applied and not args.dry_run:
+            print(f"✓ Applied {len(applied)} migration(s)")
+        return 0
+
+    except MigrationError as e:
+        print(f"✗ {e}")
+        return 1
+    finally:
+        connection.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())